@@ -17,6 +17,8 @@ from gamestonk_terminal.menu import session
 default_backend = mpl.get_backend()
 # pylint: disable=wrong-import-position
 from gamestonk_terminal.backtesting import bt_view  # noqa: E402
+from gamestonk_terminal.backtesting import bt_helper  # noqa: E402
+from gamestonk_terminal.backtesting import sweep_view  # noqa: E402
 
 # Restore backend matplotlib used
 mpl.use(default_backend)
@@ -25,7 +27,7 @@ mpl.use(default_backend)
 class BacktestingController:
     """Backtesting Class"""
 
-    CHOICES = ["help", "q", "quit", "ema", "ema_cross", "rsi"]
+    CHOICES = ["help", "q", "quit", "ema", "ema_cross", "rsi", "sweep"]
 
     def __init__(
         self,
@@ -52,6 +54,8 @@ class BacktestingController:
         print("   ema_cross   buy when EMA(short) > EMA(long) ")
         print("   rsi         buy when RSI < low and sell when RSI > high")
         print("")
+        print("   sweep       backtest every parameter combination of ema_cross or rsi")
+        print("")
 
     def switch(self, an_input: str):
         """Process and dispatch input
@@ -94,10 +98,16 @@ class BacktestingController:
         """Call RSI Strategy"""
         bt_view.rsi_strat(self.ticker, self.start, other_args)
 
+    def call_sweep(self, other_args: List[str]):
+        """Call parameter sweep"""
+        sweep_view.sweep(self.ticker, self.start, other_args)
+
 
 def menu(ticker: str, start: Union[str, datetime]):
     """Backtesting Menu"""
     plt.close("all")
+    # Every command of the session shares the same prices
+    bt_helper.clear_data()
     bt_controller = BacktestingController(ticker, start)
     bt_controller.call_help(None)
 
@@ -2,17 +2,59 @@
 __docformat__ = "numpy"
 
 
+import threading
 from datetime import datetime
-from typing import Union
+from typing import Dict, Tuple, Union
 from matplotlib import pyplot as plt
+import pandas as pd
 from pandas.plotting import register_matplotlib_converters
+import pandas_ta as ta
 import bt
+from gamestonk_terminal import market_data
+from gamestonk_terminal.backtesting import vector_model
 from gamestonk_terminal.helper_funcs import plot_autoscale
 from gamestonk_terminal.config_plot import PLOT_DPI
 from gamestonk_terminal import feature_flags as gtff
 
 register_matplotlib_converters()
 
+# Price store of the backtesting session, shared by every strategy and benchmark
+_prices: Dict[Tuple[str, str], pd.DataFrame] = dict()
+_prices_lock = threading.Lock()
+
+
+def get_data(ticker: str, start: Union[str, datetime]) -> pd.DataFrame:
+    """
+    Get adjusted close prices in the format of bt.get, fetched once per backtesting session
+    Parameters
+    ----------
+    ticker: str
+        Stock to get prices for
+    start: Union[str, datetime]
+        Start date.  Can be either string or datetime
+
+    Returns
+    -------
+    pd.DataFrame
+        Adjusted close prices in a column named after the lowercase ticker. The frame is
+        shared, and must not be modified.
+    """
+    key = (ticker.lower(), pd.Timestamp(start).strftime("%Y-%m-%d"))
+    with _prices_lock:
+        if key not in _prices:
+            prices = market_data.get_adjusted_closes([ticker], start=key[1])
+            if prices.empty:
+                raise ValueError(f"No prices found for {ticker.upper()}")
+            prices.columns = [key[0]]
+            _prices[key] = prices
+        return _prices[key]
+
+
+def clear_data():
+    """Forget the prices of the backtesting session"""
+    with _prices_lock:
+        _prices.clear()
+
 
 def buy_and_hold(ticker: str, start: Union[str, datetime], name: str):
     """
@@ -30,7 +72,7 @@ def buy_and_hold(ticker: str, start: Union[str, datetime], name: str):
     -------
     bt.Backtest object for buy and hold strategy
     """
-    prices = bt.get(ticker, start=start)
+    prices = get_data(ticker, start)
     bt_strategy = bt.Strategy(
         name,
         [
@@ -43,6 +85,257 @@ def buy_and_hold(ticker: str, start: Union[str, datetime], name: str):
     return bt.Backtest(bt_strategy, prices)
 
 
+def ema_backtest(
+    prices: pd.DataFrame, length: int, name: str = "AboveEMA"
+) -> bt.Backtest:
+    """
+    Generates a backtest going long when the price is at or above EMA(length)
+    Parameters
+    ----------
+    prices: pd.DataFrame
+        Prices of the stock, from get_data
+    length: int
+        EMA period
+    name: str
+        Name of the backtest
+
+    Returns
+    -------
+    bt.Backtest object for the EMA strategy
+    """
+    ticker = prices.columns[0]
+    ema = ta.ema(prices[ticker], length).to_frame(ticker)
+
+    bt_strategy = bt.Strategy(
+        name,
+        [
+            bt.algos.SelectWhere(prices >= ema),
+            bt.algos.WeighEqually(),
+            bt.algos.Rebalance(),
+        ],
+    )
+    return bt.Backtest(bt_strategy, prices)
+
+
+def ema_cross_backtest(
+    prices: pd.DataFrame,
+    short: int,
+    long: int,
+    shortable: bool,
+    name: str = "EMA_Cross",
+) -> bt.Backtest:
+    """
+    Generates a backtest going long/short when EMA(short) is greater/less than EMA(long)
+    Parameters
+    ----------
+    prices: pd.DataFrame
+        Prices of the stock, from get_data
+    short: int
+        Short EMA period
+    long: int
+        Long EMA period
+    shortable: bool
+        Go short when EMA(short) <= EMA(long), instead of staying out
+    name: str
+        Name of the backtest
+
+    Returns
+    -------
+    bt.Backtest object for the EMA cross strategy
+    """
+    ticker = prices.columns[0]
+    signals = vector_model.ema_cross_positions(
+        prices[ticker], short, long, shortable
+    ).to_frame(ticker)
+
+    bt_strategy = bt.Strategy(
+        name,
+        [
+            bt.algos.WeighTarget(signals),
+            bt.algos.Rebalance(),
+        ],
+    )
+    return bt.Backtest(bt_strategy, prices)
+
+
+def rsi_backtest(
+    prices: pd.DataFrame,
+    periods: int,
+    low: float,
+    high: float,
+    shortable: bool,
+    name: str = "RSI Reversion",
+) -> bt.Backtest:
+    """
+    Generates a backtest going long when RSI < low and short when RSI > high
+    Parameters
+    ----------
+    prices: pd.DataFrame
+        Prices of the stock, from get_data
+    periods: int
+        Number of periods for RSI calculation
+    low: float
+        Low RSI level
+    high: float
+        High (upper) RSI level
+    shortable: bool
+        Go short when RSI > high, instead of staying out
+    name: str
+        Name of the backtest
+
+    Returns
+    -------
+    bt.Backtest object for the RSI strategy
+    """
+    ticker = prices.columns[0]
+    signal = vector_model.rsi_positions(
+        prices[ticker], periods, low, high, shortable
+    ).to_frame(ticker)
+
+    bt_strategy = bt.Strategy(
+        name, [bt.algos.WeighTarget(signal), bt.algos.Rebalance()]
+    )
+    return bt.Backtest(bt_strategy, prices)
+
+
+def run_with_benchmarks(
+    bt_backtest: bt.Backtest,
+    ticker: str,
+    start: Union[str, datetime],
+    spy: bool,
+    no_bench: bool,
+) -> bt.backtest.Result:
+    """
+    Run a backtest along with its buy and hold benchmarks, on the session prices
+    Parameters
+    ----------
+    bt_backtest: bt.Backtest
+        Backtest of the strategy
+    ticker: str
+        Stock the strategy trades
+    start: Union[str, datetime]
+        Backtest start date.  Can be either string or datetime
+    spy: bool
+        Add a SPY buy and hold benchmark
+    no_bench: bool
+        Do not add a buy and hold benchmark of the stock
+
+    Returns
+    -------
+    bt.backtest.Result
+        Result of the strategy and its benchmarks
+    """
+    l_backtests = [bt_backtest]
+    if spy:
+        l_backtests.append(buy_and_hold("spy", start, "SPY Hold"))
+    if not no_bench:
+        l_backtests.append(buy_and_hold(ticker, start, ticker.upper() + " Hold"))
+    return bt.run(*l_backtests)
+
+
+def run_vectorized(
+    positions: pd.Series,
+    name: str,
+    ticker: str,
+    start: Union[str, datetime],
+    spy: bool,
+    no_bench: bool,
+    fee: float = 0.0,
+) -> Dict[str, pd.Series]:
+    """
+    Run a vectorized backtest along with its buy and hold benchmarks, on the session prices
+    Parameters
+    ----------
+    positions: pd.Series
+        Target weight of each day, from the vector_model positions functions
+    name: str
+        Name of the backtest
+    ticker: str
+        Stock the strategy trades
+    start: Union[str, datetime]
+        Backtest start date.  Can be either string or datetime
+    spy: bool
+        Add a SPY buy and hold benchmark
+    no_bench: bool
+        Do not add a buy and hold benchmark of the stock
+    fee: float
+        Cost of trading, as a fraction of the traded weight
+
+    Returns
+    -------
+    Dict[str, pd.Series]
+        Equity curve of the strategy and its benchmarks, by name
+    """
+    prices = get_data(ticker, start)[ticker.lower()]
+    d_equity = {name: vector_model.backtest(prices, positions, fee)}
+    l_benchmarks = (["spy"] if spy else []) + ([] if no_bench else [ticker])
+    for bench_ticker in l_benchmarks:
+        bench_prices = get_data(bench_ticker, start)[bench_ticker.lower()]
+        d_equity[bench_ticker.upper() + " Hold"] = vector_model.backtest(
+            bench_prices, pd.Series(1.0, index=bench_prices.index), fee
+        )
+    return d_equity
+
+
+# Prices of a sweep worker process, sent once when the worker starts
+_sweep_prices = pd.DataFrame()
+
+SWEEP_STATS = ["cagr", "daily_sharpe", "max_drawdown", "total_return", "calmar"]
+
+
+def init_sweep_worker(prices: pd.DataFrame):
+    """Keep the prices in a sweep worker, so that each job only sends its parameters"""
+    global _sweep_prices  # pylint: disable=global-statement
+    _sweep_prices = prices
+
+
+def run_sweep_job(job: Tuple[str, Tuple, bool]) -> Dict[str, float]:
+    """
+    Run the backtest of a strategy parameter set, on the prices of the sweep worker
+    Parameters
+    ----------
+    job: Tuple[str, Tuple, bool]
+        Strategy, 'ema_cross' or 'rsi', its parameters, (short, long) or (periods, low,
+        high), and whether it can go short
+
+    Returns
+    -------
+    Dict[str, float]
+        SWEEP_STATS of the backtest
+    """
+    strategy, params, shortable = job
+    if strategy == "ema_cross":
+        short, long = params
+        bt_backtest = ema_cross_backtest(_sweep_prices, short, long, shortable)
+    else:
+        periods, low, high = params
+        bt_backtest = rsi_backtest(_sweep_prices, periods, low, high, shortable)
+    stats = bt.run(bt_backtest).stats[bt_backtest.name]
+    return {stat: float(stats[stat]) for stat in SWEEP_STATS}
+
+
+def plot_equity(d_equity: Dict[str, pd.Series], plot_title: str):
+    """
+    Plot the equity curves of vectorized backtests
+    Parameters
+    ----------
+    d_equity: Dict[str, pd.Series]
+        Equity curve of each backtest, by name
+    plot_title: str
+        Title of plot
+
+    """
+    _, ax = plt.subplots(figsize=plot_autoscale(), dpi=PLOT_DPI)
+    pd.DataFrame(d_equity).plot(title=plot_title, ax=ax)
+    plt.grid(b=True, which="major", color="#666666", linestyle="-")
+    plt.minorticks_on()
+    plt.grid(b=True, which="minor", color="#999999", linestyle="-", alpha=0.2)
+
+    if gtff.USE_ION:
+        plt.ion()
+    plt.show()
+
+
 def plot_bt(res: bt.backtest.Result, plot_title: str):
     """
     Plot the bt result
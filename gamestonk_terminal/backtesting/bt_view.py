@@ -3,11 +3,23 @@ __docformat__ = "numpy"
 import argparse
 from typing import List, Union
 from datetime import datetime
-import pandas as pd
-import bt
-import pandas_ta as ta
 from gamestonk_terminal.helper_funcs import parse_known_args_and_warn
-from gamestonk_terminal.backtesting.bt_helper import buy_and_hold, plot_bt
+from gamestonk_terminal.backtesting.bt_helper import (
+    ema_backtest,
+    ema_cross_backtest,
+    get_data,
+    rsi_backtest,
+    plot_bt,
+    plot_equity,
+    run_vectorized,
+    run_with_benchmarks,
+)
+from gamestonk_terminal.backtesting.vector_model import (
+    display_stats,
+    ema_cross_positions,
+    ema_positions,
+    rsi_positions,
+)
 
 
 def simple_ema(ticker: str, start_date: Union[str, datetime], other_args: List[str]):
@@ -47,37 +59,49 @@ def simple_ema(ticker: str, start_date: Union[str, datetime], other_args: List[s
         dest="no_bench",
     )
 
+    parser.add_argument(
+        "--vector",
+        action="store_true",
+        default=False,
+        help="Flag to use the vectorized engine instead of bt, which is much faster",
+        dest="vector",
+    )
+
+    parser.add_argument(
+        "--fee",
+        default=0.0,
+        type=float,
+        help="Trading cost in basis points of the traded value, for the vectorized engine. "
+        "The buy and hold benchmarks also pay it.",
+        dest="fee",
+    )
+
     try:
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if not ns_parser:
             return
         ticker = ticker.lower()
-        ema = pd.DataFrame()
-        prices = bt.get(ticker, start=start_date)
-        ema[ticker] = ta.ema(prices[ticker], ns_parser.length)
-        bt_strategy = bt.Strategy(
-            "AboveEMA",
-            [
-                bt.algos.SelectWhere(prices >= ema),
-                bt.algos.WeighEqually(),
-                bt.algos.Rebalance(),
-            ],
+        prices = get_data(ticker, start_date)
+        if ns_parser.vector:
+            d_equity = run_vectorized(
+                ema_positions(prices[ticker], ns_parser.length),
+                "AboveEMA",
+                ticker,
+                start_date,
+                ns_parser.spy,
+                ns_parser.no_bench,
+                ns_parser.fee / 10000,
+            )
+            plot_equity(d_equity, f"Equity for EMA({ns_parser.length})")
+            print(display_stats(d_equity))
+            print("")
+            return
+
+        bt_backtest = ema_backtest(prices, ns_parser.length)
+
+        res = run_with_benchmarks(
+            bt_backtest, ticker, start_date, ns_parser.spy, ns_parser.no_bench
         )
-        bt_backtest = bt.Backtest(bt_strategy, prices)
-
-        if ns_parser.spy:
-            spy_bt = buy_and_hold("spy", start_date, "SPY Hold")
-            if ns_parser.no_bench:
-                res = bt.run(bt_backtest, spy_bt)
-            else:
-                stock_bt = buy_and_hold(ticker, start_date, ticker.upper() + " Hold")
-                res = bt.run(bt_backtest, spy_bt, stock_bt)
-        else:
-            if ns_parser.no_bench:
-                res = bt.run(bt_backtest)
-            else:
-                stock_bt = buy_and_hold(ticker, start_date, ticker.upper() + " Hold")
-                res = bt.run(bt_backtest, stock_bt)
 
         plot_bt(res, f"Equity for EMA({ns_parser.length})")
 
@@ -130,6 +154,23 @@ def ema_cross(ticker: str, start_date: Union[str, datetime], other_args: List[st
         dest="no_bench",
     )
 
+    parser.add_argument(
+        "--vector",
+        action="store_true",
+        default=False,
+        help="Flag to use the vectorized engine instead of bt, which is much faster",
+        dest="vector",
+    )
+
+    parser.add_argument(
+        "--fee",
+        default=0.0,
+        type=float,
+        help="Trading cost in basis points of the traded value, for the vectorized engine. "
+        "The buy and hold benchmarks also pay it.",
+        dest="fee",
+    )
+
     parser.add_argument(
         "--no_short",
         action="store_false",
@@ -145,42 +186,33 @@ def ema_cross(ticker: str, start_date: Union[str, datetime], other_args: List[st
             print("Short EMA period is longer than Long EMA period\n")
             return
         ticker = ticker.lower()
-        prices = bt.get(ticker, start=start_date)
-        short_ema = pd.DataFrame(ta.ema(prices[ticker], ns_parser.short))
-        short_ema.columns = [ticker]
-        long_ema = pd.DataFrame(ta.ema(prices[ticker], ns_parser.long))
-        long_ema.columns = [ticker]
-
-        # signals
-        signals = long_ema.copy()
-        signals[short_ema > long_ema] = 1.0
-        signals[short_ema <= long_ema] = -1.0 * ns_parser.shortable
-        signals[long_ema.isnull()] = 0.0
-
-        combined_data = bt.merge(signals, prices, short_ema, long_ema)
-        combined_data.columns = ["signal", "price", "ema_short", "ema_long"]
-        bt_strategy = bt.Strategy(
-            "EMA_Cross",
-            [
-                bt.algos.WeighTarget(signals),
-                bt.algos.Rebalance(),
-            ],
+        prices = get_data(ticker, start_date)
+        if ns_parser.vector:
+            d_equity = run_vectorized(
+                ema_cross_positions(
+                    prices[ticker], ns_parser.short, ns_parser.long, ns_parser.shortable
+                ),
+                "EMA_Cross",
+                ticker,
+                start_date,
+                ns_parser.spy,
+                ns_parser.no_bench,
+                ns_parser.fee / 10000,
+            )
+            plot_equity(
+                d_equity, f"EMA Cross for EMA({ns_parser.short})/EMA({ns_parser.long})"
+            )
+            print(display_stats(d_equity))
+            print("")
+            return
+
+        bt_backtest = ema_cross_backtest(
+            prices, ns_parser.short, ns_parser.long, ns_parser.shortable
+        )
+
+        res = run_with_benchmarks(
+            bt_backtest, ticker, start_date, ns_parser.spy, ns_parser.no_bench
         )
-        bt_backtest = bt.Backtest(bt_strategy, prices)
-
-        if ns_parser.spy:
-            spy_bt = buy_and_hold("spy", start_date, "SPY Hold")
-            if ns_parser.no_bench:
-                res = bt.run(bt_backtest, spy_bt)
-            else:
-                stock_bt = buy_and_hold(ticker, start_date, ticker.upper() + " Hold")
-                res = bt.run(bt_backtest, spy_bt, stock_bt)
-        else:
-            if ns_parser.no_bench:
-                res = bt.run(bt_backtest)
-            else:
-                stock_bt = buy_and_hold(ticker, start_date, ticker.upper() + " Hold")
-                res = bt.run(bt_backtest, stock_bt)
 
         plot_bt(res, f"EMA Cross for EMA({ns_parser.short})/EMA({ns_parser.long})")
         print(res.display())
@@ -241,6 +273,23 @@ def rsi_strat(ticker: str, start_date: Union[datetime, str], other_args: List[st
         dest="no_bench",
     )
 
+    parser.add_argument(
+        "--vector",
+        action="store_true",
+        default=False,
+        help="Flag to use the vectorized engine instead of bt, which is much faster",
+        dest="vector",
+    )
+
+    parser.add_argument(
+        "--fee",
+        default=0.0,
+        type=float,
+        help="Trading cost in basis points of the traded value, for the vectorized engine. "
+        "The buy and hold benchmarks also pay it.",
+        dest="fee",
+    )
+
     parser.add_argument(
         "--no_short",
         action="store_false",
@@ -257,37 +306,42 @@ def rsi_strat(ticker: str, start_date: Union[datetime, str], other_args: List[st
             print("Low RSI value is higher than Low RSI value\n")
             return
         ticker = ticker.lower()
-        prices = bt.get(ticker, start=start_date)
-
-        rsi = pd.DataFrame(ta.rsi(prices[ticker], ns_parser.periods))
-        rsi.columns = [ticker]
-
-        signal = 0 * rsi.copy()
-        signal[rsi > ns_parser.high] = -1
-        signal[rsi < ns_parser.low] = 1
-        signal[rsi.isnull()] = 0
+        prices = get_data(ticker, start_date)
+
+        if ns_parser.vector:
+            d_equity = run_vectorized(
+                rsi_positions(
+                    prices[ticker],
+                    ns_parser.periods,
+                    ns_parser.low,
+                    ns_parser.high,
+                    ns_parser.shortable,
+                ),
+                "RSI Reversion",
+                ticker,
+                start_date,
+                ns_parser.spy,
+                ns_parser.no_bench,
+                ns_parser.fee / 10000,
+            )
+            plot_equity(
+                d_equity, f"RSI Strategy between ({ns_parser.low}, {ns_parser.high})"
+            )
+            print(display_stats(d_equity))
+            print("")
+            return
 
-        merged_data = bt.merge(signal, prices)
-        merged_data.columns = ["signal", "price"]
+        bt_backtest = rsi_backtest(
+            prices,
+            ns_parser.periods,
+            ns_parser.low,
+            ns_parser.high,
+            ns_parser.shortable,
+        )
 
-        bt_strategy = bt.Strategy(
-            "RSI Reversion", [bt.algos.WeighTarget(signal), bt.algos.Rebalance()]
+        res = run_with_benchmarks(
+            bt_backtest, ticker, start_date, ns_parser.spy, ns_parser.no_bench
         )
-        bt_backtest = bt.Backtest(bt_strategy, prices)
-
-        if ns_parser.spy:
-            spy_bt = buy_and_hold("spy", start_date, "SPY Hold")
-            if ns_parser.no_bench:
-                res = bt.run(bt_backtest, spy_bt)
-            else:
-                stock_bt = buy_and_hold(ticker, start_date, ticker.upper() + " Hold")
-                res = bt.run(bt_backtest, spy_bt, stock_bt)
-        else:
-            if ns_parser.no_bench:
-                res = bt.run(bt_backtest)
-            else:
-                stock_bt = buy_and_hold(ticker, start_date, ticker.upper() + " Hold")
-                res = bt.run(bt_backtest, stock_bt)
 
         plot_bt(res, f"RSI Strategy between ({ns_parser.low}, {ns_parser.high})")
         print(res.display())
@@ -0,0 +1,366 @@
+"""Backtesting parameter sweep view"""
+__docformat__ = "numpy"
+
+import argparse
+import itertools
+import multiprocessing
+import os
+from datetime import datetime
+from typing import List, Tuple, Union
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from gamestonk_terminal.backtesting import bt_helper
+from gamestonk_terminal.backtesting import vector_model
+from gamestonk_terminal.config_plot import PLOT_DPI
+from gamestonk_terminal.helper_funcs import (
+    check_positive,
+    parse_known_args_and_warn,
+    plot_autoscale,
+)
+from gamestonk_terminal import feature_flags as gtff
+
+
+def parse_range(s_range: str) -> List[int]:
+    """Parse an inclusive range of integers, 'start:stop:step', 'start:stop' or 'value'
+
+    Parameters
+    ----------
+    s_range : str
+        Range, e.g. 5:50:5
+
+    Returns
+    -------
+    List[int]
+        Values of the range
+    """
+    try:
+        l_values = [int(value) for value in s_range.split(":")]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"{s_range} is not a valid range") from e
+    if len(l_values) == 1:
+        return l_values
+    if len(l_values) > 3 or (len(l_values) == 3 and l_values[2] <= 0):
+        raise argparse.ArgumentTypeError(f"{s_range} is not a valid range")
+    step = l_values[2] if len(l_values) == 3 else 1
+    return list(range(l_values[0], l_values[1] + 1, step))
+
+
+def get_sweep_jobs(
+    strategy: str,
+    l_first: List[int],
+    l_second: List[int],
+    periods: int,
+    shortable: bool,
+) -> List[Tuple[str, Tuple, bool]]:
+    """Jobs of every valid parameter combination of a strategy
+
+    Parameters
+    ----------
+    strategy : str
+        'ema_cross' or 'rsi'
+    l_first : List[int]
+        Short EMA periods, or low RSI levels
+    l_second : List[int]
+        Long EMA periods, or high RSI levels
+    periods : int
+        Number of periods for RSI calculation
+    shortable : bool
+        Strategy can go short
+
+    Returns
+    -------
+    List[Tuple[str, Tuple, bool]]
+        Jobs for bt_helper.run_sweep_job, skipping combinations where the first
+        parameter is not below the second one
+    """
+    return [
+        (
+            strategy,
+            (first, second) if strategy == "ema_cross" else (periods, first, second),
+            shortable,
+        )
+        for first, second in itertools.product(l_first, l_second)
+        if first < second
+    ]
+
+
+def run_vectorized_sweep(
+    prices: pd.DataFrame, l_jobs: List[Tuple[str, Tuple, bool]], fee: float = 0.0
+) -> List[dict]:
+    """Run the backtests of a sweep with the vectorized engine
+
+    Parameters
+    ----------
+    prices : pd.DataFrame
+        Prices of the stock, from bt_helper.get_data
+    l_jobs : List[Tuple[str, Tuple, bool]]
+        Jobs from get_sweep_jobs
+    fee : float
+        Cost of trading, as a fraction of the traded weight
+
+    Returns
+    -------
+    List[dict]
+        Backtest stats of each job
+    """
+    close = prices.iloc[:, 0]
+    l_stats = list()
+    for strategy, params, shortable in l_jobs:
+        if strategy == "ema_cross":
+            short, long = params
+            positions = vector_model.ema_cross_positions(close, short, long, shortable)
+        else:
+            periods, low, high = params
+            positions = vector_model.rsi_positions(close, periods, low, high, shortable)
+        stats = vector_model.get_stats(vector_model.backtest(close, positions, fee))
+        l_stats.append({stat: stats[stat] for stat in bt_helper.SWEEP_STATS})
+    return l_stats
+
+
+def run_sweep(
+    prices: pd.DataFrame, l_jobs: List[Tuple[str, Tuple, bool]], n_jobs: int
+) -> List[dict]:
+    """Run the bt backtests of a sweep, in a pool of worker processes sharing the prices
+
+    Parameters
+    ----------
+    prices : pd.DataFrame
+        Prices of the stock, from bt_helper.get_data
+    l_jobs : List[Tuple[str, Tuple, bool]]
+        Jobs from get_sweep_jobs
+    n_jobs : int
+        Number of worker processes
+
+    Returns
+    -------
+    List[dict]
+        Backtest stats of each job
+    """
+    if n_jobs > 1 and len(l_jobs) > 1:
+        with multiprocessing.get_context("spawn").Pool(
+            processes=min(n_jobs, len(l_jobs)),
+            initializer=bt_helper.init_sweep_worker,
+            initargs=(prices,),
+        ) as pool:
+            return pool.map(bt_helper.run_sweep_job, l_jobs)
+
+    bt_helper.init_sweep_worker(prices)
+    return list(map(bt_helper.run_sweep_job, l_jobs))
+
+
+def plot_sweep_heatmap(
+    df_sweep: pd.DataFrame, first: str, second: str, metric: str, title: str
+):
+    """Plot a metric of a sweep over its two swept parameters
+
+    Parameters
+    ----------
+    df_sweep : pd.DataFrame
+        Sweep results, with a column per parameter and stat
+    first : str
+        Parameter on the y axis
+    second : str
+        Parameter on the x axis
+    metric : str
+        Stat to color the cells with
+    title : str
+        Title of the plot
+    """
+    df_grid = df_sweep.pivot(index=first, columns=second, values=metric)
+    _, ax = plt.subplots(figsize=plot_autoscale(), dpi=PLOT_DPI)
+    im = ax.imshow(
+        np.ma.masked_invalid(df_grid.values.astype(float)),
+        cmap="RdYlGn",
+        aspect="auto",
+        origin="lower",
+    )
+    ax.set_xticks(range(len(df_grid.columns)))
+    ax.set_xticklabels(df_grid.columns)
+    ax.set_yticks(range(len(df_grid.index)))
+    ax.set_yticklabels(df_grid.index)
+    ax.set_xlabel(second)
+    ax.set_ylabel(first)
+    ax.set_title(title)
+    plt.colorbar(im, ax=ax, label=metric)
+
+    if gtff.USE_ION:
+        plt.ion()
+    plt.show()
+
+
+def sweep(ticker: str, start_date: Union[str, datetime], other_args: List[str]):
+    """
+    Backtest every parameter combination of a strategy, and rank them
+    Parameters
+    ----------
+    ticker: str
+        Stock to test
+    start_date: Union[str, datetime]
+        Backtest start date.  Can be either string or datetime
+    other_args: List[str]
+        List of argparse arguments
+
+    Returns
+    -------
+    Heatmap and ranked table of the backtests
+    """
+    parser = argparse.ArgumentParser(
+        add_help=False,
+        prog="sweep",
+        description="""
+            Backtest every combination of the parameter ranges of a strategy with the
+            vectorized engine, or with bt in parallel worker processes, and rank them.
+            Ranges are inclusive, as start:stop:step.
+            E.g. 'sweep ema_cross -s 5:50:5 -l 20:200:20' or 'sweep rsi --low 10:40:5 -u 60:90:5'.
+        """,
+    )
+    parser.add_argument(
+        "strategy", choices=["ema_cross", "rsi"], help="strategy to sweep"
+    )
+    parser.add_argument(
+        "-s",
+        "--short",
+        type=parse_range,
+        default=parse_range("5:50:5"),
+        dest="short",
+        help="ema_cross short EMA periods",
+    )
+    parser.add_argument(
+        "-l",
+        "--long",
+        type=parse_range,
+        default=parse_range("20:200:20"),
+        dest="long",
+        help="ema_cross long EMA periods",
+    )
+    parser.add_argument(
+        "--low",
+        type=parse_range,
+        default=parse_range("10:40:5"),
+        dest="low",
+        help="rsi low (lower) levels",
+    )
+    parser.add_argument(
+        "-u",
+        "--high",
+        type=parse_range,
+        default=parse_range("60:90:5"),
+        dest="high",
+        help="rsi high (upper) levels",
+    )
+    parser.add_argument(
+        "-p",
+        "--periods",
+        type=check_positive,
+        default=14,
+        dest="periods",
+        help="rsi number of periods for RSI calculation",
+    )
+    parser.add_argument(
+        "--no_short",
+        action="store_false",
+        default=True,
+        dest="shortable",
+        help="Flag that disables the short sell",
+    )
+    parser.add_argument(
+        "-m",
+        "--metric",
+        choices=bt_helper.SWEEP_STATS,
+        default="daily_sharpe",
+        dest="metric",
+        help="stat to rank the parameters by, and color the heatmap with",
+    )
+    parser.add_argument(
+        "--bt",
+        action="store_true",
+        default=False,
+        dest="use_bt",
+        help="Flag to backtest with bt in worker processes, instead of the vectorized engine",
+    )
+    parser.add_argument(
+        "--fee",
+        default=0.0,
+        type=float,
+        dest="fee",
+        help="Trading cost in basis points of the traded value. Only applied by the "
+        "vectorized engine, so it can't be used with --bt",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=check_positive,
+        default=os.cpu_count() or 1,
+        dest="n_jobs",
+        help="number of worker processes",
+    )
+    parser.add_argument(
+        "-n",
+        "--num",
+        type=check_positive,
+        default=10,
+        dest="n_num",
+        help="number of best parameter sets to display",
+    )
+
+    try:
+        ns_parser = parse_known_args_and_warn(parser, other_args)
+        if not ns_parser:
+            return
+
+        if ns_parser.use_bt and ns_parser.fee:
+            print("The bt backtests don't apply --fee, use the vectorized engine\n")
+            return
+
+        if ns_parser.strategy == "ema_cross":
+            first, second = "short", "long"
+            l_first = ns_parser.short
+            l_second = ns_parser.long
+        else:
+            first, second = "low", "high"
+            l_first = ns_parser.low
+            l_second = ns_parser.high
+
+        l_jobs = get_sweep_jobs(
+            ns_parser.strategy,
+            l_first,
+            l_second,
+            ns_parser.periods,
+            ns_parser.shortable,
+        )
+        if not l_jobs:
+            print(f"No combination with {first} below {second}\n")
+            return
+
+        prices = bt_helper.get_data(ticker.lower(), start_date)
+        print(f"Backtesting {len(l_jobs)} parameter sets...")
+        if ns_parser.use_bt:
+            l_stats = run_sweep(prices, l_jobs, ns_parser.n_jobs)
+        else:
+            l_stats = run_vectorized_sweep(prices, l_jobs, ns_parser.fee / 10000)
+
+        df_sweep = pd.DataFrame(
+            [
+                {first: params[-2], second: params[-1], **stats}
+                for (_, params, _), stats in zip(l_jobs, l_stats)
+            ]
+        )
+
+        s_title = (
+            f"{ticker.upper()} EMA Cross {ns_parser.metric}"
+            if ns_parser.strategy == "ema_cross"
+            else f"{ticker.upper()} RSI({ns_parser.periods}) {ns_parser.metric}"
+        )
+        plot_sweep_heatmap(df_sweep, first, second, ns_parser.metric, s_title)
+
+        # Max drawdowns are negative, so higher is better for every stat
+        df_ranked = df_sweep.sort_values(
+            ns_parser.metric, ascending=False, na_position="last"
+        ).set_index([first, second])
+        print(df_ranked.head(ns_parser.n_num).round(4).to_string())
+        print("")
+
+    except Exception as e:
+        print(e)
+        print("")
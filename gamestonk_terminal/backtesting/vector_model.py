@@ -0,0 +1,240 @@
+"""Vectorized backtests of single asset signal strategies"""
+__docformat__ = "numpy"
+
+from typing import Dict
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+
+# Seconds in a year, as used by ffn for the CAGR of bt results
+YEAR_SECONDS = 31557600
+
+# Equity before the first trade, as bt's initial capital
+INITIAL_EQUITY = 100.0
+
+# Stats of get_stats, with the labels of bt's res.display()
+STATS_LABELS = {
+    "total_return": "Total Return",
+    "daily_sharpe": "Daily Sharpe",
+    "daily_sortino": "Daily Sortino",
+    "cagr": "CAGR",
+    "max_drawdown": "Max Drawdown",
+    "calmar": "Calmar Ratio",
+    "daily_mean": "Daily Mean (ann.)",
+    "daily_vol": "Daily Vol (ann.)",
+    "daily_skew": "Daily Skew",
+    "daily_kurt": "Daily Kurt",
+    "best_day": "Best Day",
+    "worst_day": "Worst Day",
+    "avg_drawdown": "Avg. Drawdown",
+    "avg_drawdown_days": "Avg. Drawdown Days",
+}
+
+
+def ema_positions(prices: pd.Series, length: int) -> pd.Series:
+    """Long when the price is at or above EMA(length), out otherwise
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Adjusted close prices
+    length : int
+        EMA period
+
+    Returns
+    -------
+    pd.Series
+        Target weight of each day, set at its close
+    """
+    ema = ta.ema(prices, length)
+    return (prices >= ema).astype(float)
+
+
+def ema_cross_positions(
+    prices: pd.Series, short: int, long: int, shortable: bool
+) -> pd.Series:
+    """Long when EMA(short) > EMA(long), short (or out) otherwise
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Adjusted close prices
+    short : int
+        Short EMA period
+    long : int
+        Long EMA period
+    shortable : bool
+        Go short when EMA(short) <= EMA(long), instead of staying out
+
+    Returns
+    -------
+    pd.Series
+        Target weight of each day, set at its close
+    """
+    short_ema = ta.ema(prices, short).values
+    long_ema = ta.ema(prices, long).values
+    positions = np.where(short_ema > long_ema, 1.0, -1.0 * shortable)
+    positions[np.isnan(long_ema)] = 0.0
+    return pd.Series(positions, index=prices.index)
+
+
+def rsi_positions(
+    prices: pd.Series, periods: int, low: float, high: float, shortable: bool
+) -> pd.Series:
+    """Long when RSI < low, short (or out) when RSI > high, out otherwise
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Adjusted close prices
+    periods : int
+        Number of periods for RSI calculation
+    low : float
+        Low RSI level
+    high : float
+        High (upper) RSI level
+    shortable : bool
+        Go short when RSI > high, instead of staying out
+
+    Returns
+    -------
+    pd.Series
+        Target weight of each day, set at its close
+    """
+    rsi = ta.rsi(prices, periods).values
+    positions = np.zeros(len(rsi))
+    positions[rsi > high] = -1.0 * shortable
+    positions[rsi < low] = 1.0
+    return pd.Series(positions, index=prices.index)
+
+
+def backtest(prices: pd.Series, positions: pd.Series, fee: float = 0.0) -> pd.Series:
+    """Equity curve of trading a single asset to the target positions
+
+    The position set at the close of a day earns the return of the next day, as with
+    bt's WeighTarget and Rebalance. Trading costs are charged on the day of the trade.
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Adjusted close prices
+    positions : pd.Series
+        Target weight of each day, e.g. from ema_cross_positions
+    fee : float
+        Cost of trading, as a fraction of the traded weight
+
+    Returns
+    -------
+    pd.Series
+        Equity, starting from INITIAL_EQUITY
+    """
+    values = prices.values.astype(float)
+    weights = np.nan_to_num(positions.reindex(prices.index).values.astype(float))
+
+    returns = np.zeros(len(values))
+    returns[1:] = values[1:] / values[:-1] - 1
+    strategy_returns = np.zeros(len(values))
+    strategy_returns[1:] = weights[:-1] * returns[1:]
+    if fee:
+        strategy_returns -= fee * np.abs(np.diff(weights, prepend=0.0))
+
+    return pd.Series(
+        INITIAL_EQUITY * np.cumprod(1 + strategy_returns), index=prices.index
+    )
+
+
+def get_stats(equity: pd.Series) -> Dict[str, float]:
+    """Summary stats of an equity curve, defined as those of bt's res.display()
+
+    As bt, the stats start from INITIAL_EQUITY on a virtual day before the first date, so
+    that the trades of the first date, and their fees, count in the returns.
+
+    Parameters
+    ----------
+    equity : pd.Series
+        Equity curve, from backtest
+
+    Returns
+    -------
+    Dict[str, float]
+        Stats with the keys of STATS_LABELS, NaN when undefined
+    """
+    equity = pd.concat(
+        [
+            pd.Series(
+                [INITIAL_EQUITY], index=[equity.index[0] - pd.DateOffset(days=1)]
+            ),
+            equity,
+        ]
+    )
+    values = equity.values
+    returns = values[1:] / values[:-1] - 1
+    year_frac = (equity.index[-1] - equity.index[0]).total_seconds() / YEAR_SECONDS
+
+    drawdown = values / np.maximum.accumulate(values) - 1
+    # Drawdown periods, from the first day below a high to the day it is recovered
+    in_drawdown = drawdown < 0
+    starts = np.flatnonzero(in_drawdown & ~np.append(False, in_drawdown[:-1]))
+    ends = np.flatnonzero(in_drawdown & ~np.append(in_drawdown[1:], False))
+    l_depths = [drawdown[start : end + 1].min() for start, end in zip(starts, ends)]
+    l_days = [
+        (equity.index[min(end + 1, len(values) - 1)] - equity.index[start]).days
+        for start, end in zip(starts, ends)
+    ]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total_return = values[-1] / values[0] - 1
+        cagr = (values[-1] / values[0]) ** (1 / year_frac) - 1 if year_frac else np.nan
+        daily_vol = np.std(returns, ddof=1) * np.sqrt(252)
+        downside = np.std(np.minimum(returns, 0.0), ddof=1)
+        max_drawdown = drawdown.min()
+        return {
+            "total_return": total_return,
+            "daily_sharpe": np.mean(returns) * 252 / daily_vol,
+            "daily_sortino": np.mean(returns) / downside * np.sqrt(252),
+            "cagr": cagr,
+            "max_drawdown": max_drawdown,
+            "calmar": cagr / abs(max_drawdown) if max_drawdown else np.nan,
+            "daily_mean": np.mean(returns) * 252,
+            "daily_vol": daily_vol,
+            "daily_skew": pd.Series(returns).skew(),
+            "daily_kurt": pd.Series(returns).kurt(),
+            "best_day": returns.max() if len(returns) else np.nan,
+            "worst_day": returns.min() if len(returns) else np.nan,
+            "avg_drawdown": np.mean(l_depths) if l_depths else 0.0,
+            "avg_drawdown_days": np.mean(l_days) if l_days else 0.0,
+        }
+
+
+def display_stats(d_equity: Dict[str, pd.Series]) -> str:
+    """Table of the summary stats of several equity curves, as res.display() prints them
+
+    Parameters
+    ----------
+    d_equity : Dict[str, pd.Series]
+        Equity curve of each backtest, by name
+
+    Returns
+    -------
+    str
+        Table with a row per stat and a column per backtest
+    """
+    df_stats = pd.DataFrame(
+        {name: get_stats(equity) for name, equity in d_equity.items()}
+    )
+    l_pct = [
+        "total_return",
+        "cagr",
+        "max_drawdown",
+        "daily_mean",
+        "daily_vol",
+        "best_day",
+        "worst_day",
+        "avg_drawdown",
+    ]
+    df_display = df_stats.apply(
+        lambda row: row.map(lambda x: f"{x:.2%}" if row.name in l_pct else f"{x:.2f}"),
+        axis=1,
+    )
+    df_display.index = [STATS_LABELS[stat] for stat in df_display.index]
+    return df_display.to_string()
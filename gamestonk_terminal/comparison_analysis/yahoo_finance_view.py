@@ -8,9 +8,9 @@ import numpy as np
 import pandas as pd
 from pandas.plotting import register_matplotlib_converters
 import matplotlib.pyplot as plt
-import yfinance as yf
 import seaborn as sns
 
+from gamestonk_terminal import market_data
 from gamestonk_terminal.helper_funcs import parse_known_args_and_warn, plot_autoscale
 from gamestonk_terminal.config_plot import PLOT_DPI
 
@@ -122,48 +122,20 @@ def historical(
 
             similar += ns_parser.l_also
 
+            df_similar = market_data.get_prices_multiple(
+                [ticker] + similar,
+                start=start,
+                column=d_candle_types[ns_parser.type_candle],
+            )
+
             plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
             plt.title(f"Similar companies to {ticker}")
-            df_stock = yf.download(ticker, start=start, progress=False, threads=False)
-            plt.plot(
-                df_stock.index, df_stock[d_candle_types[ns_parser.type_candle]].values
-            )
-            # plt.plot(df_stock.index, df_stock["5. adjusted close"].values, lw=2)
-            l_min = [df_stock.index[0]]
-            l_leg = [ticker]
-
-            l_stocks = similar[:]
-
-            while l_stocks:
-                l_parsed_stocks = list()
-                for symbol in l_stocks:
-                    try:
-                        df_similar_stock = yf.download(
-                            symbol, start=start, progress=False, threads=False
-                        )
-                        if not df_similar_stock.empty:
-                            plt.plot(
-                                df_similar_stock.index,
-                                df_similar_stock[
-                                    d_candle_types[ns_parser.type_candle]
-                                ].values,
-                            )
-                            l_min.append(df_similar_stock.index[0])
-                            l_leg.append(symbol)
-
-                        l_parsed_stocks.append(symbol)
-                    except Exception as e:
-                        print("")
-                        print(e)
-                        print(
-                            "Disregard previous error, which is due to API Rate limits from Yahoo Finance."
-                        )
-                        print(
-                            f"Because we like '{symbol}', and we won't leave without getting data from it."
-                        )
-
-                for parsed_stock in l_parsed_stocks:
-                    l_stocks.remove(parsed_stock)
+            l_min = list()
+            for symbol in df_similar.columns:
+                df_similar_stock = df_similar[symbol].dropna()
+                plt.plot(df_similar_stock.index, df_similar_stock.values)
+                l_min.append(df_similar_stock.index[0])
+            l_leg = list(df_similar.columns)
 
             plt.xlabel("Time")
             plt.ylabel("Share Price ($)")
@@ -172,7 +144,7 @@ def historical(
             plt.minorticks_on()
             plt.grid(b=True, which="minor", color="#999999", linestyle="-", alpha=0.2)
             # ensures that the historical data starts from same datapoint
-            plt.xlim([max(l_min), df_stock.index[-1]])
+            plt.xlim([max(l_min), df_similar.index[-1]])
             plt.show()
         print("")
 
@@ -251,32 +223,14 @@ def correlation(other_args, df_stock, ticker, start, interval, similar):
             if not similar:
                 print("Provide at least a similar company for correlation")
             else:
-                d_stock = {}
-                d_stock[ticker] = yf.download(ticker, start=start, progress=False)
-                l_min = [d_stock[ticker].index[0]]
-
-                for symbol in similar:
-                    d_stock[symbol] = yf.download(symbol, start=start, progress=False)
-                    if not d_stock[symbol].empty:
-                        l_min.append(d_stock[symbol].index[0])
-
-                min_start_date = max(l_min)
-
-                df_stock = d_stock[ticker][
-                    d_candle_types[ns_parser.type_candle]
-                ].rename(ticker)
-                for symbol in d_stock:
-                    if symbol != ticker:
-                        if not d_stock[symbol].empty:
-                            df_stock = pd.concat(
-                                [
-                                    df_stock,
-                                    d_stock[symbol][
-                                        d_candle_types[ns_parser.type_candle]
-                                    ].rename(symbol),
-                                ],
-                                axis=1,
-                            )
+                df_stock = market_data.get_prices_multiple(
+                    [ticker] + similar,
+                    start=start,
+                    column=d_candle_types[ns_parser.type_candle],
+                )
+                min_start_date = max(
+                    df_stock[symbol].first_valid_index() for symbol in df_stock.columns
+                )
 
                 mask = np.zeros((df_stock.shape[1], df_stock.shape[1]), dtype=bool)
                 mask[np.triu_indices(len(mask))] = True
@@ -57,6 +57,9 @@ Optimizer = "Adam"
 # Can be set to large number or None to ignore
 Early_Stop_Patience = 10
 
+# Epochs to fine-tune a saved model when new bars were loaded since it was trained
+Fine_Tune_Epochs = 10
+
 # Losses https://www.tensorflow.org/api_docs/python/tf/keras/losses
 # mae, mape, mse, msle, poisson, logcosh, kld, hinge, squared_hinge, huber
 Loss = "mae"
@@ -6,6 +6,13 @@ load_dotenv()
 # By default the jupyter notebook will be run on port 8888
 PAPERMILL_NOTEBOOK_REPORT_PORT = "8888"
 
+# Local on-disk cache of historical prices loaded through 'load'
+DATA_CACHE_DIR = os.getenv("GT_DATA_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".gamestonk_terminal", "cache"
+)
+# Minutes during which a cached ticker is served from disk without a top-up
+DATA_CACHE_MAX_AGE = int(os.getenv("GT_DATA_CACHE_MAX_AGE") or 5)
+
 # https://www.alphavantage.co
 API_KEY_ALPHAVANTAGE = os.getenv("GT_API_KEY_ALPHAVANTAGE") or "REPLACE_ME"
 
@@ -2,13 +2,12 @@
 __docformat__ = "numpy"
 
 import argparse
-from typing import List, Tuple, Dict
-import requests
-from scipy import stats
+from typing import List, Tuple, Dict, Optional
 import pandas as pd
 from matplotlib import pyplot as plt
 from gamestonk_terminal.config_plot import PLOT_DPI
 from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal import finra_model
 from gamestonk_terminal.helper_funcs import (
     parse_known_args_and_warn,
     plot_autoscale,
@@ -16,108 +15,47 @@ from gamestonk_terminal.helper_funcs import (
 )
 
 
-def getFINRAweeks(tier, is_ats) -> List:
-    """Get FINRA weeks
+def get_regression_slopes(df_ats: pd.DataFrame) -> pd.Series:
+    """Linear regression slope of the total weekly shares quantity over time, for every ticker
+
+    Computed in closed form as the covariance over the variance of each ticker, in a single
+    grouped pass instead of a regression per ticker.
 
     Parameters
     ----------
-    tier : str
-        Stock tier between T1, T2, or OTCE
-    is_ats : bool
-        ATS data if true, NON-ATS otherwise
+    df_ats : pd.DataFrame
+        Dark Pools (ATS) Data, with issueSymbolIdentifier, weekStartDateInt and
+        totalWeeklyShareQuantity columns
 
     Returns
     ----------
-    List
-        List of response data
+    pd.Series
+        Regression slope indexed by ticker, sorted from highest to lowest. Tickers with a
+        single week of data have no slope and are left out.
     """
-    req_hdr = {"Accept": "application/json", "Content-Type": "application/json"}
-
-    req_data = {
-        "compareFilters": [
-            {
-                "compareType": "EQUAL",
-                "fieldName": "summaryTypeCode",
-                "fieldValue": "ATS_W_SMBL" if is_ats else "OTC_W_SMBL",
-            },
-            {
-                "compareType": "EQUAL",
-                "fieldName": "tierIdentifier",
-                "fieldValue": tier,
-            },
-        ],
-        "delimiter": "|",
-        "fields": ["weekStartDate"],
-        "limit": 27,
-        "quoteValues": False,
-        "sortFields": ["-weekStartDate"],
-    }
-
-    response = requests.post(
-        "https://api.finra.org/data/group/otcMarket/name/weeklyDownloadDetails",
-        headers=req_hdr,
-        json=req_data,
-    )
-
-    return response.json() if response.status_code == 200 else list()
+    symbols = df_ats["issueSymbolIdentifier"]
+    x = df_ats["weekStartDateInt"].astype(float)
+    y = df_ats["totalWeeklyShareQuantity"].astype(float)
 
+    dx = x - x.groupby(symbols).transform("mean")
+    dy = y - y.groupby(symbols).transform("mean")
+    sxy = (dx * dy).groupby(symbols).sum()
+    sxx = (dx * dx).groupby(symbols).sum()
 
-def getFINRAdata(weekStartDate, tier, ticker, is_ats, offset):
-    req_hdr = {"Accept": "application/json", "Content-Type": "application/json"}
+    slopes = sxy[sxx > 0] / sxx[sxx > 0]
+    return slopes.sort_values(ascending=False)
 
-    l_cmp_filters = [
-        {
-            "compareType": "EQUAL",
-            "fieldName": "weekStartDate",
-            "fieldValue": weekStartDate,
-        },
-        {"compareType": "EQUAL", "fieldName": "tierIdentifier", "fieldValue": tier},
-        {
-            "compareType": "EQUAL",
-            "description": "",
-            "fieldName": "summaryTypeCode",
-            "fieldValue": "ATS_W_SMBL" if is_ats else "OTC_W_SMBL",
-        },
-    ]
-
-    if ticker:
-        l_cmp_filters.append(
-            {
-                "compareType": "EQUAL",
-                "fieldName": "issueSymbolIdentifier",
-                "fieldValue": ticker,
-            }
-        )
-
-    req_data = {
-        "compareFilters": l_cmp_filters,
-        "delimiter": "|",
-        "fields": [
-            "issueSymbolIdentifier",
-            "totalWeeklyShareQuantity",
-            "totalWeeklyTradeCount",
-            "lastUpdateDate",
-        ],
-        "limit": 5000,
-        "offset": offset,
-        "quoteValues": False,
-        "sortFields": ["totalWeeklyShareQuantity"],
-    }
-
-    return requests.post(
-        "https://api.finra.org/data/group/otcMarket/name/weeklySummary",
-        headers=req_hdr,
-        json=req_data,
-    )
 
-
-def getATSdata(num_tickers_to_filter: int) -> Tuple[pd.DataFrame, Dict]:
+def getATSdata(
+    num_tickers_to_filter: Optional[int] = None,
+) -> Tuple[pd.DataFrame, Dict]:
     """Get all FINRA ATS data, and parse most promising tickers based on linear regression
 
     Parameters
     ----------
-    num_tickers_to_filter : int
-        Number of tickers to filter from entire ATS data based on the sum of the total weekly shares quantity
+    num_tickers_to_filter : Optional[int]
+        Number of tickers to filter from entire ATS data based on the sum of the total weekly
+        shares quantity. Every ticker is ranked if not provided.
 
     Returns
     ----------
@@ -126,53 +64,27 @@ def getATSdata(num_tickers_to_filter: int) -> Tuple[pd.DataFrame, Dict]:
     Dict
         Tickers from Dark Pools with better regression slope
     """
-    tiers = ["T1", "T2", "OTCE"]
-    df_ats = pd.DataFrame()
-
-    for tier in tiers:
-        print(f"Processing Tier {tier} ...")
-        for d_week in getFINRAweeks(tier, is_ats=True):
-            offset = 0
-            response = getFINRAdata(d_week["weekStartDate"], tier, "", True, offset)
-            l_data = response.json()
-
-            while len(response.json()) == 5000:
-                offset += 5000
-                response = getFINRAdata(d_week["weekStartDate"], tier, "", True, offset)
-                l_data += response.json()
-
-            df_ats_week = pd.DataFrame(l_data)
-            df_ats_week["weekStartDate"] = d_week["weekStartDate"]
-
-            if not df_ats_week.empty:
-                df_ats = df_ats.append(df_ats_week, ignore_index=True)
-
-    df_ats = df_ats.sort_values("weekStartDate")
-    df_ats["weekStartDateInt"] = pd.to_datetime(df_ats["weekStartDate"]).apply(
-        lambda x: x.timestamp()
-    )
-
-    print(f"Processing regression on {num_tickers_to_filter} promising tickers ...")
+    print("Processing ATS data of every tier ...")
+    df_ats = finra_model.get_weekly_summary("", is_ats=True)
+
+    df_ats["weekStartDateInt"] = (
+        pd.to_datetime(df_ats["weekStartDate"]) - pd.Timestamp(0)
+    ).dt.total_seconds()
+
+    df_reg = df_ats
+    if num_tickers_to_filter:
+        print(f"Processing regression on {num_tickers_to_filter} promising tickers ...")
+        top_symbols = (
+            df_ats.groupby("issueSymbolIdentifier")["totalWeeklyShareQuantity"]
+            .sum()
+            .nlargest(num_tickers_to_filter)
+            .index
+        )
+        df_reg = df_ats[df_ats["issueSymbolIdentifier"].isin(top_symbols)]
+    else:
+        print("Processing regression on every ticker ...")
 
-    d_ats_reg = {}
-    # set(df_ats['issueSymbolIdentifier'].values) this would be iterating through all tickers
-    # but that is extremely time consuming for little reward. A little filtering is done to
-    # speed up search for best ATS tickers
-    for symbol in list(
-        df_ats.groupby("issueSymbolIdentifier")["totalWeeklyShareQuantity"]
-        .sum()
-        .sort_values()[-num_tickers_to_filter:]
-        .index
-    ):
-        slope = stats.linregress(
-            df_ats[df_ats["issueSymbolIdentifier"] == symbol][
-                "weekStartDateInt"
-            ].values,
-            df_ats[df_ats["issueSymbolIdentifier"] == symbol][
-                "totalWeeklyShareQuantity"
-            ].values,
-        )[0]
-        d_ats_reg[symbol] = slope
+    d_ats_reg = get_regression_slopes(df_reg).to_dict()
 
     return df_ats, d_ats_reg
 
@@ -230,8 +142,9 @@ def dark_pool(other_args: List[str]):
         action="store",
         dest="n_num",
         type=check_positive,
-        default=1000,
-        help="Number of tickers to filter from entire ATS data based on the sum of the total weekly shares quantity.",
+        default=None,
+        help="Number of tickers to filter from entire ATS data based on the sum of the total weekly shares quantity. "
+        "Every ticker is ranked by default.",
     )
     parser.add_argument(
         "-t",
@@ -3,133 +3,14 @@ __docformat__ = "numpy"
 
 import argparse
 from typing import List, Tuple
-import requests
 import pandas as pd
 from matplotlib import pyplot as plt
 from gamestonk_terminal.config_plot import PLOT_DPI
 from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal import finra_model
 from gamestonk_terminal.helper_funcs import parse_known_args_and_warn, plot_autoscale
 
 
-def getFINRAweeks(tier, is_ats) -> List:
-    """Get FINRA weeks
-
-    Parameters
-    ----------
-    tier : str
-        Stock tier between T1, T2, or OTCE
-    is_ats : bool
-        ATS data if true, NON-ATS otherwise
-
-    Returns
-    ----------
-    List
-        List of response data
-    """
-    req_hdr = {"Accept": "application/json", "Content-Type": "application/json"}
-
-    req_data = {
-        "compareFilters": [
-            {
-                "compareType": "EQUAL",
-                "fieldName": "summaryTypeCode",
-                "fieldValue": "ATS_W_SMBL" if is_ats else "OTC_W_SMBL",
-            },
-            {
-                "compareType": "EQUAL",
-                "fieldName": "tierIdentifier",
-                "fieldValue": tier,
-            },
-        ],
-        "delimiter": "|",
-        "fields": ["weekStartDate"],
-        "limit": 27,
-        "quoteValues": False,
-        "sortFields": ["-weekStartDate"],
-    }
-
-    response = requests.post(
-        "https://api.finra.org/data/group/otcMarket/name/weeklyDownloadDetails",
-        headers=req_hdr,
-        json=req_data,
-    )
-
-    return response.json() if response.status_code == 200 else list()
-
-
-def getFINRAdata(weekStartDate, tier, ticker, is_ats) -> Tuple[int, List]:
-    """Get FINRA data
-
-    Parameters
-    ----------
-    weekStartDate : str
-        Weekly data to get FINRA data
-    tier : str
-        Stock tier between T1, T2, or OTCE
-    ticker : str
-        Stock ticker to get data from
-    is_ats : bool
-        ATS data if true, NON-ATS otherwise
-
-    Returns
-    ----------
-    str
-        Status code from request
-    List
-        List of response data
-    """
-    req_hdr = {"Accept": "application/json", "Content-Type": "application/json"}
-
-    l_cmp_filters = [
-        {
-            "compareType": "EQUAL",
-            "fieldName": "weekStartDate",
-            "fieldValue": weekStartDate,
-        },
-        {"compareType": "EQUAL", "fieldName": "tierIdentifier", "fieldValue": tier},
-        {
-            "compareType": "EQUAL",
-            "description": "",
-            "fieldName": "summaryTypeCode",
-            "fieldValue": "ATS_W_SMBL" if is_ats else "OTC_W_SMBL",
-        },
-    ]
-
-    if ticker:
-        l_cmp_filters.append(
-            {
-                "compareType": "EQUAL",
-                "fieldName": "issueSymbolIdentifier",
-                "fieldValue": ticker,
-            }
-        )
-
-    req_data = {
-        "compareFilters": l_cmp_filters,
-        "delimiter": "|",
-        "fields": [
-            "issueSymbolIdentifier",
-            "totalWeeklyShareQuantity",
-            "totalWeeklyTradeCount",
-            "lastUpdateDate",
-        ],
-        "limit": 5000,
-        "quoteValues": False,
-        "sortFields": ["totalWeeklyShareQuantity"],
-    }
-
-    response = requests.post(
-        "https://api.finra.org/data/group/otcMarket/name/weeklySummary",
-        headers=req_hdr,
-        json=req_data,
-    )
-
-    return (
-        response.status_code,
-        response.json() if response.status_code == 200 else list(),
-    )
-
-
 def getTickerFINRAdata(ticker) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Get all FINRA data associated with a ticker
 
@@ -145,44 +26,12 @@ def getTickerFINRAdata(ticker) -> Tuple[pd.DataFrame, pd.DataFrame]:
     pd.DataFrame
         OTC (Non-ATS) Data
     """
-    tiers = ["T1", "T2", "OTCE"]
-
-    l_data = list()
-    for tier in tiers:
-        for d_week in getFINRAweeks(tier, is_ats=True):
-            status_code, response = getFINRAdata(
-                d_week["weekStartDate"], tier, ticker, True
-            )
-            if status_code == 200:
-                if response:
-                    d_data = response[0]
-                    d_data.update(d_week)
-                    l_data.append(d_data)
-                else:
-                    break
-
-    df_ats = pd.DataFrame(l_data)
+    df_ats = finra_model.get_weekly_summary(ticker, is_ats=True)
     if not df_ats.empty:
-        df_ats = df_ats.sort_values("weekStartDate")
         df_ats = df_ats.set_index("weekStartDate")
 
-    l_data = list()
-    for tier in tiers:
-        for d_week in getFINRAweeks(tier, is_ats=False):
-            status_code, response = getFINRAdata(
-                d_week["weekStartDate"], tier, ticker, False
-            )
-            if status_code == 200:
-                if response:
-                    d_data = response[0]
-                    d_data.update(d_week)
-                    l_data.append(d_data)
-                else:
-                    break
-
-    df_otc = pd.DataFrame(l_data)
+    df_otc = finra_model.get_weekly_summary(ticker, is_ats=False)
     if not df_otc.empty:
-        df_otc = df_otc.sort_values("weekStartDate")
         df_otc = df_otc.set_index("weekStartDate")
 
     return df_ats, df_otc
@@ -19,6 +19,12 @@ USE_PROMPT_TOOLKIT = strtobool(os.getenv("GTFF_USE_PROMPT_TOOLKIT", "False"))
 # Enable Prediction features
 ENABLE_PREDICT = strtobool(os.getenv("GTFF_ENABLE_PREDICT", "False"))
 
+# Enable on-disk cache of historical prices
+ENABLE_DATA_CACHE = strtobool(os.getenv("GTFF_ENABLE_DATA_CACHE", "True"))
+
+# Enable saving and reusing trained neural network models
+ENABLE_NN_CHECKPOINTS = strtobool(os.getenv("GTFF_ENABLE_NN_CHECKPOINTS", "True"))
+
 # Enable plot autoscaling
 USE_PLOT_AUTOSCALING = strtobool(os.getenv("GTFF_USE_PLOT_AUTOSCALING", "False"))
 
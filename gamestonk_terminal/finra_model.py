@@ -0,0 +1,313 @@
+"""FINRA OTC Transparency Client"""
+__docformat__ = "numpy"
+
+import json
+import os
+import pathlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from gamestonk_terminal import config_terminal as cfg
+from gamestonk_terminal import feature_flags as gtff
+
+FINRA_URL = "https://api.finra.org/data/group/otcMarket/name"
+TIERS = ["T1", "T2", "OTCE"]
+PAGE_SIZE = 5000
+MAX_WORKERS = 10
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Connection pooled session shared by all FINRA requests
+
+    Returns
+    -------
+    requests.Session
+        Session with json headers and a pool sized for the concurrent requests
+    """
+    global _session  # pylint: disable=global-statement
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers.update(
+                {"Accept": "application/json", "Content-Type": "application/json"}
+            )
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS)
+            _session.mount("https://", adapter)
+    return _session
+
+
+def getFINRAweeks(tier: str, is_ats: bool) -> List:
+    """Get FINRA weeks
+
+    Parameters
+    ----------
+    tier : str
+        Stock tier between T1, T2, or OTCE
+    is_ats : bool
+        ATS data if true, NON-ATS otherwise
+
+    Returns
+    ----------
+    List
+        List of response data
+    """
+    req_data = {
+        "compareFilters": [
+            {
+                "compareType": "EQUAL",
+                "fieldName": "summaryTypeCode",
+                "fieldValue": "ATS_W_SMBL" if is_ats else "OTC_W_SMBL",
+            },
+            {
+                "compareType": "EQUAL",
+                "fieldName": "tierIdentifier",
+                "fieldValue": tier,
+            },
+        ],
+        "delimiter": "|",
+        "fields": ["weekStartDate"],
+        "limit": 27,
+        "quoteValues": False,
+        "sortFields": ["-weekStartDate"],
+    }
+
+    response = get_session().post(
+        f"{FINRA_URL}/weeklyDownloadDetails",
+        json=req_data,
+    )
+
+    return response.json() if response.status_code == 200 else list()
+
+
+def getFINRAdata(
+    weekStartDate: str, tier: str, ticker: str, is_ats: bool, offset: int = 0
+) -> requests.Response:
+    """Get a page of FINRA weekly summary data
+
+    Parameters
+    ----------
+    weekStartDate : str
+        Weekly data to get FINRA data
+    tier : str
+        Stock tier between T1, T2, or OTCE
+    ticker : str
+        Stock ticker to get data from, empty to get every ticker of the week
+    is_ats : bool
+        ATS data if true, NON-ATS otherwise
+    offset : int
+        Number of rows to skip, for pagination
+
+    Returns
+    ----------
+    requests.Response
+        Response from the weekly summary request
+    """
+    l_cmp_filters = [
+        {
+            "compareType": "EQUAL",
+            "fieldName": "weekStartDate",
+            "fieldValue": weekStartDate,
+        },
+        {"compareType": "EQUAL", "fieldName": "tierIdentifier", "fieldValue": tier},
+        {
+            "compareType": "EQUAL",
+            "description": "",
+            "fieldName": "summaryTypeCode",
+            "fieldValue": "ATS_W_SMBL" if is_ats else "OTC_W_SMBL",
+        },
+    ]
+
+    if ticker:
+        l_cmp_filters.append(
+            {
+                "compareType": "EQUAL",
+                "fieldName": "issueSymbolIdentifier",
+                "fieldValue": ticker,
+            }
+        )
+
+    req_data = {
+        "compareFilters": l_cmp_filters,
+        "delimiter": "|",
+        "fields": [
+            "issueSymbolIdentifier",
+            "totalWeeklyShareQuantity",
+            "totalWeeklyTradeCount",
+            "lastUpdateDate",
+        ],
+        "limit": PAGE_SIZE,
+        "offset": offset,
+        "quoteValues": False,
+        "sortFields": ["totalWeeklyShareQuantity"],
+    }
+
+    return get_session().post(f"{FINRA_URL}/weeklySummary", json=req_data)
+
+
+def get_cache_path(weekStartDate: str, tier: str, ticker: str, is_ats: bool):
+    """Path of the cached weekly summary of a week and tier
+
+    Parameters
+    ----------
+    weekStartDate : str
+        Week of the data
+    tier : str
+        Stock tier between T1, T2, or OTCE
+    ticker : str
+        Stock ticker, empty for the whole week
+    is_ats : bool
+        ATS data if true, NON-ATS otherwise
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the json file holding the week records
+    """
+    key = re.sub(
+        r"[^A-Za-z0-9_.\-]",
+        "_",
+        f"{'ats' if is_ats else 'otc'}_{tier}_{weekStartDate}_{ticker.upper() or 'ALL'}",
+    )
+    return pathlib.Path(cfg.DATA_CACHE_DIR, "finra", f"{key}.json")
+
+
+def _read_week(weekStartDate: str, tier: str, ticker: str, is_ats: bool):
+    for cache_ticker in [ticker, ""] if ticker else [""]:
+        cache_file = get_cache_path(weekStartDate, tier, cache_ticker, is_ats)
+        if os.path.isfile(cache_file):
+            try:
+                with open(cache_file, encoding="utf-8") as f:
+                    l_data = json.load(f)
+            except Exception as e:
+                print(f"Ignoring unreadable cache file {cache_file}: {e}")
+                continue
+            if cache_ticker != ticker:
+                # The whole week is cached, so a ticker is a lookup on it
+                l_data = [
+                    d_data
+                    for d_data in l_data
+                    if d_data["issueSymbolIdentifier"] == ticker.upper()
+                ]
+            return l_data
+    return None
+
+
+def _write_week(l_data: List, weekStartDate: str, tier: str, ticker: str, is_ats: bool):
+    cache_file = get_cache_path(weekStartDate, tier, ticker, is_ats)
+    try:
+        os.makedirs(cache_file.parent, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(l_data, f)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        print(f"Unable to write cache file {cache_file}: {e}")
+
+
+def get_week_data(weekStartDate: str, tier: str, ticker: str, is_ats: bool) -> List:
+    """Get every row of the FINRA weekly summary of a week, going through all pages
+
+    Published weeks never change, so a successfully downloaded week is stored on disk
+    and later served without any request.
+
+    Parameters
+    ----------
+    weekStartDate : str
+        Weekly data to get FINRA data
+    tier : str
+        Stock tier between T1, T2, or OTCE
+    ticker : str
+        Stock ticker to get data from, empty to get every ticker of the week
+    is_ats : bool
+        ATS data if true, NON-ATS otherwise
+
+    Returns
+    -------
+    List
+        Records of the week, with the weekStartDate added to each of them
+    """
+    if gtff.ENABLE_DATA_CACHE:
+        l_data = _read_week(weekStartDate, tier, ticker, is_ats)
+        if l_data is not None:
+            return l_data
+
+    l_data = list()
+    offset = 0
+    b_complete = True
+    while True:
+        response = getFINRAdata(weekStartDate, tier, ticker, is_ats, offset)
+        if response.status_code != 200:
+            b_complete = False
+            break
+        l_page = response.json()
+        l_data += l_page
+        if len(l_page) < PAGE_SIZE:
+            break
+        offset += PAGE_SIZE
+
+    for d_data in l_data:
+        d_data["weekStartDate"] = weekStartDate
+
+    # A partial week is never cached
+    if gtff.ENABLE_DATA_CACHE and b_complete:
+        _write_week(l_data, weekStartDate, tier, ticker, is_ats)
+
+    return l_data
+
+
+def get_weekly_summary(
+    ticker: str, is_ats: bool, tiers: List[str] = None
+) -> pd.DataFrame:
+    """Get FINRA weekly summary of every tier and available week, fetched concurrently
+
+    Parameters
+    ----------
+    ticker : str
+        Stock ticker to get data from, empty to get every ticker
+    is_ats : bool
+        ATS data if true, NON-ATS otherwise
+    tiers : List[str]
+        Stock tiers to get, all of them by default
+
+    Returns
+    -------
+    pd.DataFrame
+        Weekly summary, with a row per ticker and week, sorted by weekStartDate
+    """
+    tiers = tiers or TIERS
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        d_weeks: Dict[str, List] = dict(
+            zip(
+                tiers,
+                executor.map(lambda tier: getFINRAweeks(tier, is_ats), tiers),
+            )
+        )
+        l_jobs = [
+            (d_week["weekStartDate"], tier)
+            for tier in tiers
+            for d_week in d_weeks[tier]
+        ]
+        l_weeks = list(
+            executor.map(
+                lambda job: get_week_data(job[0], job[1], ticker, is_ats), l_jobs
+            )
+        )
+
+    l_frames = [pd.DataFrame(l_data) for l_data in l_weeks if l_data]
+    if not l_frames:
+        return pd.DataFrame()
+
+    return (
+        pd.concat(l_frames, ignore_index=True)
+        .sort_values("weekStartDate", kind="mergesort")
+        .reset_index(drop=True)
+    )
@@ -2,6 +2,7 @@
 __docformat__ = "numpy"
 import argparse
 from datetime import datetime, timedelta, time as Time
+from typing import Tuple
 import os
 import random
 import re
@@ -266,6 +267,28 @@ def divide_chunks(data, n):
         yield data[i : i + n]
 
 
+def get_data_key(df_stock: pd.Series) -> Tuple:
+    """
+    Key identifying a price series, so that different tickers, intervals and end dates are told apart
+    Parameters
+    ----------
+    df_stock: pd.Series
+        Series of stock prices
+    Returns
+    -------
+    Tuple
+        Length, first and last dates, and hash of the series
+    """
+    if df_stock.empty:
+        return (0,)
+    return (
+        len(df_stock),
+        str(df_stock.index[0]),
+        str(df_stock.index[-1]),
+        int(pd.util.hash_pandas_object(df_stock).sum()),
+    )
+
+
 def get_next_stock_market_days(last_stock_day, n_next_days) -> list:
     """gets the next stock market day. Checks against weekends and holidays"""
     n_days = 0
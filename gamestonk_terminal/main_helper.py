@@ -12,7 +12,6 @@ from colorama import Fore, Style
 import matplotlib.pyplot as plt
 from numpy.core.fromnumeric import transpose
 import pandas as pd
-from alpha_vantage.timeseries import TimeSeries
 import mplfinance as mpf
 import yfinance as yf
 import pytz
@@ -30,8 +29,8 @@ from gamestonk_terminal.helper_funcs import (
     plot_autoscale,
 )
 
-from gamestonk_terminal import config_terminal as cfg
 from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal import market_data
 from gamestonk_terminal import thought_of_the_day as thought
 from gamestonk_terminal.technical_analysis import trendline_api as trend
 
@@ -148,48 +147,18 @@ def load(other_args: List[str], s_ticker, s_start, s_interval, df_stock):
         # Daily
         if ns_parser.n_interval == 1440:
 
-            # Alpha Vantage Source
-            if ns_parser.source == "av":
-                ts = TimeSeries(key=cfg.API_KEY_ALPHAVANTAGE, output_format="pandas")
-                # pylint: disable=unbalanced-tuple-unpacking
-                df_stock_candidate, _ = ts.get_daily_adjusted(
-                    symbol=ns_parser.s_ticker, outputsize="full"
-                )
-
-                # Check that loading a stock was not successful
-                # pylint: disable=no-member
-                if df_stock_candidate.empty:
-                    print("")
-                    return [s_ticker, s_start, s_interval, df_stock]
-
-                # pylint: disable=no-member
-                df_stock_candidate.sort_index(ascending=True, inplace=True)
-
-                # Slice dataframe from the starting date YYYY-MM-DD selected
-                df_stock_candidate = df_stock_candidate[ns_parser.s_start_date :]
-
-            # Yahoo Finance Source
-            elif ns_parser.source == "yf":
-                df_stock_candidate = yf.download(
-                    ns_parser.s_ticker, start=ns_parser.s_start_date, progress=False
-                )
+            df_stock_candidate = market_data.get_prices(
+                ns_parser.s_ticker,
+                start=ns_parser.s_start_date,
+                source=ns_parser.source,
+            )
 
-                # Check that loading a stock was not successful
-                if df_stock_candidate.empty:
-                    print("")
-                    return [s_ticker, s_start, s_interval, df_stock]
+            # Check that loading a stock was not successful
+            if df_stock_candidate.empty:
+                print("")
+                return [s_ticker, s_start, s_interval, df_stock]
 
-                df_stock_candidate = df_stock_candidate.rename(
-                    columns={
-                        "Open": "1. open",
-                        "High": "2. high",
-                        "Low": "3. low",
-                        "Close": "4. close",
-                        "Adj Close": "5. adjusted close",
-                        "Volume": "6. volume",
-                    }
-                )
-                df_stock_candidate.index.name = "date"
+            df_stock_candidate = market_data.to_numbered_columns(df_stock_candidate)
 
             # Check if start time from dataframe is more recent than specified
             if df_stock_candidate.index[0] > pd.to_datetime(ns_parser.s_start_date):
@@ -202,25 +171,19 @@ def load(other_args: List[str], s_ticker, s_start, s_interval, df_stock):
 
             # Alpha Vantage Source
             if ns_parser.source == "av":
-                ts = TimeSeries(key=cfg.API_KEY_ALPHAVANTAGE, output_format="pandas")
-                # pylint: disable=unbalanced-tuple-unpacking
-                df_stock_candidate, _ = ts.get_intraday(
-                    symbol=ns_parser.s_ticker,
-                    outputsize="full",
-                    interval=str(ns_parser.n_interval) + "min",
+                df_stock_candidate = market_data.get_prices(
+                    ns_parser.s_ticker,
+                    start=ns_parser.s_start_date,
+                    interval=str(ns_parser.n_interval) + "m",
+                    source="av",
                 )
                 s_interval = str(ns_parser.n_interval) + "min"
                 # Check that loading a stock was not successful
-                # pylint: disable=no-member
                 if df_stock_candidate.empty:
                     print("")
                     return [s_ticker, s_start, s_interval, df_stock]
 
-                # pylint: disable=no-member
-                df_stock_candidate.sort_index(ascending=True, inplace=True)
-
-                # Slice dataframe from the starting date YYYY-MM-DD selected
-                df_stock_candidate = df_stock_candidate[ns_parser.s_start_date :]
+                df_stock_candidate = market_data.to_numbered_columns(df_stock_candidate)
 
                 # Check if start time from dataframe is more recent than specified
                 if df_stock_candidate.index[0] > pd.to_datetime(ns_parser.s_start_date):
@@ -239,23 +202,16 @@ def load(other_args: List[str], s_ticker, s_start, s_interval, df_stock):
 
                 if s_start_dt > ns_parser.s_start_date:
                     # Using Yahoo Finance with granularity {s_int} the starting date is set to: {s_date_start}
-
-                    df_stock_candidate = yf.download(
-                        ns_parser.s_ticker,
-                        start=s_date_start,
-                        progress=False,
-                        interval=s_int,
-                        prepost=ns_parser.b_prepost,
-                    )
-
+                    s_date_fetch = s_date_start
                 else:
-                    df_stock_candidate = yf.download(
-                        ns_parser.s_ticker,
-                        start=ns_parser.s_start_date.strftime("%Y-%m-%d"),
-                        progress=False,
-                        interval=s_int,
-                        prepost=ns_parser.b_prepost,
-                    )
+                    s_date_fetch = ns_parser.s_start_date.strftime("%Y-%m-%d")
+
+                df_stock_candidate = market_data.get_prices(
+                    ns_parser.s_ticker,
+                    start=s_date_fetch,
+                    interval=s_int,
+                    prepost=ns_parser.b_prepost,
+                )
 
                 # Check that loading a stock was not successful
                 if df_stock_candidate.empty:
@@ -267,17 +223,7 @@ def load(other_args: List[str], s_ticker, s_start, s_interval, df_stock):
                 else:
                     s_start = ns_parser.s_start_date
 
-                df_stock_candidate = df_stock_candidate.rename(
-                    columns={
-                        "Open": "1. open",
-                        "High": "2. high",
-                        "Low": "3. low",
-                        "Close": "4. close",
-                        "Adj Close": "5. adjusted close",
-                        "Volume": "6. volume",
-                    }
-                )
-                df_stock_candidate.index.name = "date"
+                df_stock_candidate = market_data.to_numbered_columns(df_stock_candidate)
 
         s_intraday = (f"Intraday {s_interval}", "Daily")[ns_parser.n_interval == 1440]
 
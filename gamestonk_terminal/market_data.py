@@ -0,0 +1,425 @@
+"""Market Data Provider Module"""
+__docformat__ = "numpy"
+
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from alpha_vantage.timeseries import TimeSeries
+
+from gamestonk_terminal import config_terminal as cfg
+from gamestonk_terminal import ohlcv_cache
+
+# Normalized column schema of every price dataframe returned by this module
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+d_av_columns = {
+    "1. open": "Open",
+    "2. high": "High",
+    "3. low": "Low",
+    "4. close": "Close",
+    "5. adjusted close": "Adj Close",
+    "6. volume": "Volume",
+    # Intraday prices have no adjusted close
+    "5. volume": "Volume",
+}
+
+# Schema of the canonical frame used by the technical analysis indicators
+TA_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Session memo: (source, ticker, interval, prepost, period) -> (start, fetch time, prices)
+_session_prices: Dict[tuple, Tuple[str, datetime, pd.DataFrame]] = {}
+# Downloads currently running, so that concurrent identical requests share them
+_in_flight: Dict[tuple, Future] = {}
+_lock = threading.Lock()
+
+
+def normalize_columns(df_prices: pd.DataFrame) -> pd.DataFrame:
+    """Normalize a price dataframe to the OHLCV_COLUMNS schema
+
+    Parameters
+    ----------
+    df_prices : pd.DataFrame
+        Prices from Yahoo Finance or Alpha Vantage
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices with the available OHLCV_COLUMNS, float typed and sorted by ascending date
+    """
+    if df_prices.empty:
+        return df_prices
+
+    df_prices = df_prices.rename(columns=d_av_columns)
+    df_prices = df_prices[[col for col in OHLCV_COLUMNS if col in df_prices.columns]]
+    df_prices = df_prices.astype(float).sort_index(ascending=True)
+    df_prices.index.name = "date"
+    return df_prices
+
+
+def to_numbered_columns(df_prices: pd.DataFrame) -> pd.DataFrame:
+    """Rename normalized columns to the '1. open', ..., 'N. volume' convention of the loaded stock
+
+    Parameters
+    ----------
+    df_prices : pd.DataFrame
+        Prices with OHLCV_COLUMNS
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices with numbered columns, e.g. '5. adjusted close' and '6. volume' when there
+        is an adjusted close or '5. volume' otherwise
+    """
+    d_names = {
+        "Open": "open",
+        "High": "high",
+        "Low": "low",
+        "Close": "close",
+        "Adj Close": "adjusted close",
+        "Volume": "volume",
+    }
+    return df_prices.rename(
+        columns={
+            col: f"{idx + 1}. {d_names[col]}"
+            for idx, col in enumerate(df_prices.columns)
+        }
+    )
+
+
+def to_ohlcv_frame(df_stock: pd.DataFrame) -> pd.DataFrame:
+    """Canonical OHLCV frame of a loaded stock, as used by the technical analysis indicators
+
+    The close is the adjusted close when there is one, so daily and intraday prices share the
+    TA_COLUMNS schema. Columns missing from the source, e.g. the volume of a coin, are NaN.
+    All columns are float64 and live in a single block, with each column contiguous in memory,
+    so that selecting a column hands a zero-copy view to pandas_ta.
+
+    Parameters
+    ----------
+    df_stock : pd.DataFrame
+        Loaded stock, with numbered or OHLCV_COLUMNS columns
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices with TA_COLUMNS, sorted by ascending date
+    """
+    df_prices = normalize_columns(df_stock)
+    if "Adj Close" in df_prices.columns:
+        df_prices = df_prices.drop(columns=["Close"], errors="ignore").rename(
+            columns={"Adj Close": "Close"}
+        )
+
+    values = np.full((len(TA_COLUMNS), len(df_prices)), np.nan)
+    for idx, col in enumerate(TA_COLUMNS):
+        if col in df_prices.columns:
+            values[idx] = df_prices[col].values
+
+    df_ohlcv = pd.DataFrame(
+        values.T, index=df_prices.index, columns=TA_COLUMNS, copy=False
+    )
+    df_ohlcv.index.name = "date"
+    return df_ohlcv
+
+
+def _download_yf(
+    ticker: str, start: str, interval: str, prepost: bool, period: Optional[str]
+) -> pd.DataFrame:
+    """Download prices from Yahoo Finance
+
+    yf.Ticker.history is used rather than yf.download, as the latter keeps its results
+    in module level state that is not safe to share between concurrent downloads.
+    """
+    d_range = {"period": period} if period else {"start": start}
+    df_prices = yf.Ticker(ticker).history(
+        interval=interval,
+        prepost=prepost,
+        auto_adjust=False,
+        actions=False,
+        **d_range,
+    )
+    return normalize_columns(df_prices)
+
+
+def _download_av(ticker: str, start: str, interval: str) -> pd.DataFrame:
+    """Download daily adjusted or intraday prices from Alpha Vantage
+
+    Only the latest 100 bars are requested when they are enough to cover the start date,
+    which keeps cache top-ups cheap given Alpha Vantage's calls per minute limit.
+    """
+    n_interval = 1440 if interval == "1d" else int(interval.rstrip("m"))
+    # Alpha Vantage intraday bars include extended hours, from 4:00 to 20:00
+    n_bars_per_day = 1 if n_interval == 1440 else 960 // n_interval
+    n_days = len(pd.bdate_range(start, datetime.now()))
+    outputsize = "compact" if n_days * n_bars_per_day < 100 else "full"
+
+    ts = TimeSeries(key=cfg.API_KEY_ALPHAVANTAGE, output_format="pandas")
+    if n_interval == 1440:
+        # pylint: disable=unbalanced-tuple-unpacking
+        df_prices, _ = ts.get_daily_adjusted(symbol=ticker, outputsize=outputsize)
+    else:
+        # pylint: disable=unbalanced-tuple-unpacking
+        df_prices, _ = ts.get_intraday(
+            symbol=ticker, outputsize=outputsize, interval=f"{n_interval}min"
+        )
+
+    return normalize_columns(df_prices)
+
+
+def _fetch_once(key: tuple, fetch) -> pd.DataFrame:
+    """Run fetch, unless the same key is already being downloaded, in which case wait for it"""
+    with _lock:
+        in_flight = _in_flight.get(key)
+        b_owner = in_flight is None
+        future: Future = Future() if in_flight is None else in_flight
+        if b_owner:
+            _in_flight[key] = future
+
+    if not b_owner:
+        return future.result()
+
+    try:
+        df_prices = fetch()
+    except Exception as e:
+        with _lock:
+            del _in_flight[key]
+        future.set_exception(e)
+        raise
+
+    with _lock:
+        del _in_flight[key]
+    future.set_result(df_prices)
+    return df_prices
+
+
+def get_prices(
+    ticker: str,
+    start: Union[str, datetime, None] = None,
+    interval: str = "1d",
+    prepost: bool = False,
+    source: str = "yf",
+    period: Optional[str] = None,
+) -> pd.DataFrame:
+    """Get historical prices of a ticker, fetched at most once per session
+
+    A request whose date range is covered by a previous request in the session is served
+    from memory, for DATA_CACHE_MAX_AGE minutes. Otherwise prices go through the on-disk
+    cache of ohlcv_cache, unless a yfinance period is given.
+
+    Parameters
+    ----------
+    ticker : str
+        Stock ticker
+    start : Union[str, datetime, None]
+        Start date of the prices. Ignored when period is given.
+    interval : str
+        Yahoo Finance style interval: '1d', '1m', '5m', '15m', '30m' or '60m'
+    prepost : bool
+        Include pre and after market hours. Only for 'yf' intraday prices.
+    source : str
+        Source of historical data, 'yf' or 'av'
+    period : Optional[str]
+        Yahoo Finance period, e.g. '3mo', used instead of a start date
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices with OHLCV_COLUMNS, sorted by ascending date. Empty if no data was found.
+    """
+    ticker = ticker.upper()
+    s_start = "" if period else pd.Timestamp(start).strftime("%Y-%m-%d")
+    memo_key = (source, ticker, interval, prepost, period)
+
+    with _lock:
+        memo = _session_prices.get(memo_key)
+    if memo:
+        memo_start, fetched_at, df_memo = memo
+        b_fresh = datetime.now() - fetched_at < timedelta(
+            minutes=cfg.DATA_CACHE_MAX_AGE
+        )
+        if b_fresh and memo_start <= s_start:
+            return df_memo.loc[s_start:].copy() if s_start else df_memo.copy()
+
+    def fetch() -> pd.DataFrame:
+        if period:
+            return _download_yf(ticker, s_start, interval, prepost, period)
+
+        cache_interval = ("1440min" if interval == "1d" else interval) + (
+            "_prepost" if prepost else ""
+        )
+        return ohlcv_cache.load_cached(
+            source,
+            ticker,
+            cache_interval,
+            s_start,
+            lambda start: _download_av(ticker, start, interval)
+            if source == "av"
+            else _download_yf(ticker, start, interval, prepost, None),
+        )
+
+    df_prices = _fetch_once(memo_key + (s_start,), fetch)
+
+    if df_prices.empty:
+        return df_prices
+
+    with _lock:
+        _session_prices[memo_key] = (s_start, datetime.now(), df_prices)
+
+    # Alpha Vantage returns a fixed number of bars, regardless of the start date
+    return df_prices.loc[s_start:].copy() if s_start else df_prices.copy()
+
+
+def get_adjusted_closes(
+    tickers: List[str],
+    start: Union[str, datetime, None] = None,
+    period: Optional[str] = None,
+) -> pd.DataFrame:
+    """Get daily adjusted close prices of several tickers, aligned on date
+
+    Parameters
+    ----------
+    tickers : List[str]
+        Stock tickers
+    start : Union[str, datetime, None]
+        Start date of the prices
+    period : Optional[str]
+        Yahoo Finance period, e.g. '3mo', used instead of a start date
+
+    Returns
+    -------
+    pd.DataFrame
+        Adjusted close prices with one column per ticker, named as given
+    """
+    return get_prices_multiple(tickers, start=start, period=period)
+
+
+def _get_prices_with_retry(
+    ticker: str,
+    start: Union[str, datetime, None],
+    period: Optional[str],
+    retry_budget: List[int],
+    backoff: float,
+) -> pd.DataFrame:
+    """Get prices of a ticker, retrying with exponential backoff while the shared budget lasts"""
+    n_attempt = 0
+    while True:
+        try:
+            return get_prices(ticker, start=start, period=period)
+        except Exception as e:
+            with _lock:
+                b_retry = retry_budget[0] > 0
+                retry_budget[0] -= 1
+            if not b_retry:
+                print(f"Unable to get {ticker} prices: {e}")
+                return pd.DataFrame()
+            time.sleep(backoff * 2 ** n_attempt + random.uniform(0, backoff))
+            n_attempt += 1
+
+
+def get_prices_dict(
+    tickers: List[str],
+    start: Union[str, datetime, None] = None,
+    period: Optional[str] = None,
+    max_workers: int = 5,
+    max_retries: int = 10,
+    backoff: float = 1.0,
+) -> Dict[str, pd.DataFrame]:
+    """Get daily prices of several tickers concurrently
+
+    Tickers are downloaded through a bounded thread pool. Failed downloads, usually due
+    to Yahoo Finance rate limits, are retried with exponential backoff until the retry
+    budget of the whole batch is spent.
+
+    Parameters
+    ----------
+    tickers : List[str]
+        Stock tickers
+    start : Union[str, datetime, None]
+        Start date of the prices
+    period : Optional[str]
+        Yahoo Finance period, e.g. '3mo', used instead of a start date
+    max_workers : int
+        Maximum number of concurrent downloads
+    max_retries : int
+        Retry budget shared by all the tickers of the batch
+    backoff : float
+        Seconds to wait before the first retry of a ticker, doubled on each retry
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        Prices with OHLCV_COLUMNS of each ticker found, keyed as given, in the order given
+    """
+    retry_budget = [max_retries]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        l_prices = list(
+            executor.map(
+                lambda ticker: _get_prices_with_retry(
+                    ticker, start, period, retry_budget, backoff
+                ),
+                tickers,
+            )
+        )
+
+    return {
+        ticker: df_prices
+        for ticker, df_prices in zip(tickers, l_prices)
+        if not df_prices.empty
+    }
+
+
+def get_prices_multiple(
+    tickers: List[str],
+    start: Union[str, datetime, None] = None,
+    period: Optional[str] = None,
+    column: str = "Adj Close",
+    max_workers: int = 5,
+    max_retries: int = 10,
+    backoff: float = 1.0,
+) -> pd.DataFrame:
+    """Get daily prices of several tickers concurrently, aligned on date
+
+    Parameters
+    ----------
+    tickers : List[str]
+        Stock tickers
+    start : Union[str, datetime, None]
+        Start date of the prices
+    period : Optional[str]
+        Yahoo Finance period, e.g. '3mo', used instead of a start date
+    column : str
+        Price column to keep for each ticker, one of OHLCV_COLUMNS
+    max_workers : int
+        Maximum number of concurrent downloads
+    max_retries : int
+        Retry budget shared by all the tickers of the batch
+    backoff : float
+        Seconds to wait before the first retry of a ticker, doubled on each retry
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices with one column per ticker found, named as given, in the order given
+    """
+    d_prices = {
+        ticker: df_prices[column]
+        for ticker, df_prices in get_prices_dict(
+            tickers, start, period, max_workers, max_retries, backoff
+        ).items()
+    }
+    if not d_prices:
+        return pd.DataFrame()
+
+    return pd.DataFrame(d_prices)
+
+
+def clear_session():
+    """Forget every price fetched in this session"""
+    with _lock:
+        _session_prices.clear()
@@ -0,0 +1,266 @@
+"""OHLCV Disk Cache Module"""
+__docformat__ = "numpy"
+
+import json
+import os
+import pathlib
+import re
+from datetime import datetime, timedelta
+from typing import Callable, Union
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal import config_terminal as cfg
+from gamestonk_terminal import feature_flags as gtff
+
+try:
+    import pyarrow  # noqa: F401 pylint: disable=unused-import
+
+    CACHE_FORMAT = "parquet"
+except ModuleNotFoundError:
+    CACHE_FORMAT = "pkl"
+
+
+def get_cache_key(source: str, ticker: str, interval: str) -> str:
+    """Builds the file name stem used to store a ticker in the cache
+
+    Parameters
+    ----------
+    source : str
+        Source of historical data, e.g. 'yf' or 'av'
+    ticker : str
+        Stock ticker
+    interval : str
+        Interval of the bars, e.g. '1440min' or '5m_prepost'
+
+    Returns
+    -------
+    str
+        File system friendly cache key
+    """
+    return re.sub(r"[^A-Za-z0-9_.\-]", "_", f"{source}_{ticker.upper()}_{interval}")
+
+
+def get_cache_paths(source: str, ticker: str, interval: str):
+    """Data and metadata file paths of a cached ticker
+
+    Parameters
+    ----------
+    source : str
+        Source of historical data
+    ticker : str
+        Stock ticker
+    interval : str
+        Interval of the bars
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the cached prices
+    pathlib.Path
+        Path of the json metadata with covered start date and last update time
+    """
+    key = get_cache_key(source, ticker, interval)
+    cache_dir = pathlib.Path(cfg.DATA_CACHE_DIR)
+    return (
+        pathlib.Path(cache_dir, f"{key}.{CACHE_FORMAT}"),
+        pathlib.Path(cache_dir, f"{key}.json"),
+    )
+
+
+def read_cache(source: str, ticker: str, interval: str):
+    """Reads a ticker from the cache
+
+    Parameters
+    ----------
+    source : str
+        Source of historical data
+    ticker : str
+        Stock ticker
+    interval : str
+        Interval of the bars
+
+    Returns
+    -------
+    pd.DataFrame
+        Cached prices, empty if there is nothing cached
+    dict
+        Cache metadata, with 'start' and 'updated' keys
+    """
+    data_file, meta_file = get_cache_paths(source, ticker, interval)
+    if not os.path.isfile(data_file) or not os.path.isfile(meta_file):
+        return pd.DataFrame(), {}
+
+    try:
+        with open(meta_file, encoding="utf-8") as f:
+            meta = json.load(f)
+        if CACHE_FORMAT == "parquet":
+            df_cache = pd.read_parquet(data_file)
+        else:
+            df_cache = pd.read_pickle(data_file)
+    except Exception as e:
+        print(f"Ignoring unreadable cache file {data_file}: {e}")
+        return pd.DataFrame(), {}
+
+    return df_cache, meta
+
+
+def write_cache(
+    df_cache: pd.DataFrame, source: str, ticker: str, interval: str, start: str
+):
+    """Writes a ticker to the cache
+
+    Parameters
+    ----------
+    df_cache : pd.DataFrame
+        Prices to store
+    source : str
+        Source of historical data
+    ticker : str
+        Stock ticker
+    interval : str
+        Interval of the bars
+    start : str
+        Earliest date, formatted YYYY-MM-DD, that the stored prices were requested from
+    """
+    data_file, meta_file = get_cache_paths(source, ticker, interval)
+    try:
+        os.makedirs(data_file.parent, exist_ok=True)
+        if CACHE_FORMAT == "parquet":
+            df_cache.to_parquet(data_file)
+        else:
+            df_cache.to_pickle(data_file)
+        with open(meta_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "start": start,
+                    "updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                },
+                f,
+            )
+    except Exception as e:
+        print(f"Unable to write cache file {data_file}: {e}")
+
+
+def clear_cache(source: str, ticker: str, interval: str):
+    """Removes a ticker from the cache
+
+    Parameters
+    ----------
+    source : str
+        Source of historical data
+    ticker : str
+        Stock ticker
+    interval : str
+        Interval of the bars
+    """
+    for cache_file in get_cache_paths(source, ticker, interval):
+        if os.path.isfile(cache_file):
+            os.remove(cache_file)
+
+
+def is_top_up_consistent(df_cache: pd.DataFrame, df_new: pd.DataFrame) -> bool:
+    """Check that newly fetched bars can be appended to the cached ones
+
+    Parameters
+    ----------
+    df_cache : pd.DataFrame
+        Cached prices
+    df_new : pd.DataFrame
+        Prices fetched from a date before the last cached bar
+
+    Returns
+    -------
+    bool
+        True when the fetched bars overlap the complete cached bars, i.e. the ones before
+        the last cached bar, with the same prices, or only refresh the last cached bar
+    """
+    if df_new.empty:
+        return False
+
+    overlap = df_new.index.intersection(df_cache.index[:-1])
+    if overlap.empty:
+        # Only the last cached bar was fetched again, which is what the top-up refreshes
+        return df_new.index[0] <= df_cache.index[-1]
+
+    # Volumes of complete bars are sometimes revised, without any adjustment
+    columns = [
+        col for col in df_cache.columns if col in df_new.columns and col != "Volume"
+    ]
+    return np.allclose(
+        df_cache.loc[overlap, columns].values.astype(float),
+        df_new.loc[overlap, columns].values.astype(float),
+        rtol=1e-6,
+        equal_nan=True,
+    )
+
+
+def load_cached(
+    source: str,
+    ticker: str,
+    interval: str,
+    start: Union[str, datetime],
+    fetch: Callable[[str], pd.DataFrame],
+) -> pd.DataFrame:
+    """Loads prices from the cache, only fetching the bars after the last cached timestamp
+
+    When the cache is disabled, or the ticker was never cached from the requested start date,
+    the full history is fetched and stored.  A ticker updated less than DATA_CACHE_MAX_AGE
+    minutes ago is served from disk without any request.  The full history is fetched again
+    when the prices before the last cached bar changed, e.g. after a split or a dividend,
+    or when the top-up is empty.
+
+    Parameters
+    ----------
+    source : str
+        Source of historical data
+    ticker : str
+        Stock ticker
+    interval : str
+        Interval of the bars
+    start : Union[str, datetime]
+        Start date of the prices to load
+    fetch : Callable[[str], pd.DataFrame]
+        Downloads prices from a start date formatted YYYY-MM-DD onwards. Must return
+        a dataframe sorted by ascending date index, with the columns used in the cache.
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices from start date onwards, sorted by ascending date
+    """
+    s_start = pd.Timestamp(start).strftime("%Y-%m-%d")
+
+    if not gtff.ENABLE_DATA_CACHE:
+        return fetch(s_start)
+
+    df_cache, meta = read_cache(source, ticker, interval)
+
+    # Nothing cached, or cached prices don't go back far enough
+    if df_cache.empty or not meta or meta.get("start", s_start) > s_start:
+        df_fetched = fetch(s_start)
+        if df_fetched.empty:
+            return df_fetched
+        write_cache(df_fetched, source, ticker, interval, s_start)
+        return df_fetched
+
+    last_update = datetime.strptime(meta["updated"], "%Y-%m-%d %H:%M:%S")
+    if datetime.now() - last_update <= timedelta(minutes=cfg.DATA_CACHE_MAX_AGE):
+        return df_cache.loc[s_start:].copy()
+
+    # The last cached bar may have been incomplete, so it is fetched again, along with the
+    # bars of the day before it, which are compared with the cached ones
+    df_new = fetch(df_cache.index[max(len(df_cache) - 2, 0)].strftime("%Y-%m-%d"))
+    if is_top_up_consistent(df_cache, df_new):
+        df_cache = pd.concat([df_cache, df_new])
+        df_cache = df_cache[~df_cache.index.duplicated(keep="last")].sort_index()
+    else:
+        # Prices were adjusted for a split or a dividend since they were cached, or the
+        # last cached bar is out of the source's lookback window: refetch everything
+        df_new = fetch(meta["start"])
+        if df_new.empty:
+            return df_cache.loc[s_start:].copy()
+        df_cache = df_new
+    write_cache(df_cache, source, ticker, interval, meta["start"])
+
+    return df_cache.loc[s_start:].copy()
@@ -0,0 +1,188 @@
+"""Option chains of Yahoo Finance, fetched lazily and cached in memory"""
+__docformat__ = "numpy"
+
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from gamestonk_terminal import config_terminal as cfg
+
+# Number of option chains downloaded at the same time
+CHAINS_WORKERS = 4
+
+# Cache: (ticker, expiry) -> (fetch time, option chain), for DATA_CACHE_MAX_AGE minutes.
+# Expiry dates of a ticker are cached with an empty expiry.
+_chains: Dict[Tuple[str, str], Tuple[datetime, object]] = {}
+# Downloads currently running, so that concurrent identical requests share them
+_in_flight: Dict[Tuple[str, str], Future] = {}
+_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=CHAINS_WORKERS)
+
+
+def _get_cached(key: Tuple[str, str], fetch: Callable):
+    """Get a cached value, or run fetch unless the same key is already being downloaded,
+    in which case wait for it"""
+    with _lock:
+        now = datetime.now()
+        max_age = timedelta(minutes=cfg.DATA_CACHE_MAX_AGE)
+        for stale_key in [k for k, (t, _) in _chains.items() if now - t >= max_age]:
+            del _chains[stale_key]
+
+        if key in _chains:
+            return _chains[key][1]
+
+        in_flight = _in_flight.get(key)
+        b_owner = in_flight is None
+        future: Future = Future() if in_flight is None else in_flight
+        if b_owner:
+            _in_flight[key] = future
+
+    if not b_owner:
+        return future.result()
+
+    try:
+        value = fetch()
+    except Exception as e:
+        with _lock:
+            del _in_flight[key]
+        future.set_exception(e)
+        raise
+
+    with _lock:
+        del _in_flight[key]
+        _chains[key] = (datetime.now(), value)
+    future.set_result(value)
+    return value
+
+
+def get_expiry_dates(yf_ticker_data) -> List[str]:
+    """Expiry dates of the options of a ticker
+
+    Parameters
+    ----------
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+
+    Returns
+    -------
+    List[str]
+        Expiry dates, formatted YYYY-MM-DD. Empty if the ticker has no options.
+    """
+    return list(
+        _get_cached((yf_ticker_data.ticker, ""), lambda: tuple(yf_ticker_data.options))
+    )
+
+
+def get_option_chain(yf_ticker_data, expiry: str):
+    """Option chain of an expiry date, downloaded once per DATA_CACHE_MAX_AGE minutes
+
+    Parameters
+    ----------
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+    expiry: str
+        Expiry date, formatted YYYY-MM-DD
+
+    Returns
+    -------
+    Options
+        Option chain with calls and puts dataframes
+    """
+    return _get_cached(
+        (yf_ticker_data.ticker, expiry), lambda: yf_ticker_data.option_chain(expiry)
+    )
+
+
+def prefetch_option_chains(yf_ticker_data, expiries: List[str]) -> List[Future]:
+    """Download option chains in the background, in the order of the expiry dates
+
+    Parameters
+    ----------
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+    expiries: List[str]
+        Expiry dates, formatted YYYY-MM-DD
+
+    Returns
+    -------
+    List[Future]
+        Futures of the option chains. Errors are kept in the futures, so that the
+        chains that could not be downloaded are fetched again when used.
+    """
+    return [
+        _executor.submit(get_option_chain, yf_ticker_data, expiry)
+        for expiry in expiries
+    ]
+
+
+def prefetch_ticker_chains(yf_ticker_data) -> Future:
+    """Download the expiry dates and then the option chains of a ticker in the background
+
+    Parameters
+    ----------
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+
+    Returns
+    -------
+    Future
+        Future of the futures of the option chains, from the nearest expiry date. Pass it
+        to cancel_prefetch to drop the downloads not started yet.
+    """
+    return _executor.submit(
+        lambda: prefetch_option_chains(yf_ticker_data, get_expiry_dates(yf_ticker_data))
+    )
+
+
+def cancel_prefetch(prefetch: Future):
+    """Cancel the downloads of a prefetch that have not started yet
+
+    Parameters
+    ----------
+    prefetch: Future
+        Future from prefetch_ticker_chains
+    """
+
+    def cancel_chains(future: Future):
+        if not future.cancelled() and future.exception() is None:
+            for chain_future in future.result():
+                chain_future.cancel()
+
+    # A prefetch still fetching the expiry dates cancels its chains once it has queued them
+    if not prefetch.cancel():
+        prefetch.add_done_callback(cancel_chains)
+
+
+def shutdown():
+    """Stop the background downloads, so that quitting doesn't wait for the queued ones"""
+    if sys.version_info >= (3, 9):
+        _executor.shutdown(wait=False, cancel_futures=True)
+    else:
+        _executor.shutdown(wait=False)
+
+
+def get_option_chains(yf_ticker_data, expiries: List[str]) -> List:
+    """Option chains of several expiry dates, downloaded concurrently
+
+    Parameters
+    ----------
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+    expiries: List[str]
+        Expiry dates, formatted YYYY-MM-DD
+
+    Returns
+    -------
+    List
+        Option chains, in the order of the expiry dates
+    """
+    l_futures = prefetch_option_chains(yf_ticker_data, expiries)
+    return [future.result() for future in l_futures]
+
+
+def clear_chains():
+    """Forget every option chain fetched in this session"""
+    with _lock:
+        _chains.clear()
@@ -0,0 +1,320 @@
+"""Black-Scholes implied volatility and Greeks of whole option chains"""
+__docformat__ = "numpy"
+
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr
+
+# Bounds of the implied volatility search
+MIN_VOL = 1e-4
+MAX_VOL = 5.0
+
+# Options expire at the close, and theta is per calendar day
+EXPIRY_TIME = timedelta(hours=16)
+YEAR_DAYS = 365
+
+GREEKS_COLUMNS = ["iv", "delta", "gamma", "vega", "theta"]
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal density"""
+    return np.exp(-0.5 * x * x) / np.sqrt(2 * np.pi)
+
+
+def get_d1_d2(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    years: np.ndarray,
+    rate: float,
+    vol: np.ndarray,
+    div: float = 0.0,
+):
+    """d1 and d2 terms of the Black-Scholes formula"""
+    vol_sqrt_t = vol * np.sqrt(years)
+    d1 = (np.log(spot / strike) + (rate - div + 0.5 * vol * vol) * years) / vol_sqrt_t
+    return d1, d1 - vol_sqrt_t
+
+
+def bs_price(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    years: np.ndarray,
+    rate: float,
+    vol: np.ndarray,
+    is_call: np.ndarray,
+    div: float = 0.0,
+) -> np.ndarray:
+    """Black-Scholes price of european options
+
+    Parameters
+    ----------
+    spot : np.ndarray
+        Underlying price
+    strike : np.ndarray
+        Strike prices
+    years : np.ndarray
+        Times to expiry, in years
+    rate : float
+        Risk free rate, continuously compounded
+    vol : np.ndarray
+        Volatilities
+    is_call : np.ndarray
+        True for calls, False for puts
+    div : float
+        Dividend yield, continuously compounded
+
+    Returns
+    -------
+    np.ndarray
+        Option prices
+    """
+    d1, d2 = get_d1_d2(spot, strike, years, rate, vol, div)
+    fwd_spot = spot * np.exp(-div * years)
+    pv_strike = strike * np.exp(-rate * years)
+    return np.where(
+        is_call,
+        fwd_spot * ndtr(d1) - pv_strike * ndtr(d2),
+        pv_strike * ndtr(-d2) - fwd_spot * ndtr(-d1),
+    )
+
+
+def implied_volatility(
+    price: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    years: np.ndarray,
+    rate: float,
+    is_call: np.ndarray,
+    div: float = 0.0,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """Implied volatilities of european options, solved for all of them at once
+
+    Each iteration takes a Newton step for every option, or bisects its bracket where
+    the Newton step would leave it, so that every volatility converges.
+
+    Parameters
+    ----------
+    price : np.ndarray
+        Option prices
+    spot : np.ndarray
+        Underlying price
+    strike : np.ndarray
+        Strike prices
+    years : np.ndarray
+        Times to expiry, in years
+    rate : float
+        Risk free rate, continuously compounded
+    is_call : np.ndarray
+        True for calls, False for puts
+    div : float
+        Dividend yield, continuously compounded
+    tol : float
+        Tolerance on the price
+    max_iter : int
+        Maximum number of iterations
+
+    Returns
+    -------
+    np.ndarray
+        Implied volatilities, NaN for prices outside the no-arbitrage bounds or whose
+        volatility is outside [MIN_VOL, MAX_VOL]
+    """
+    price, spot, strike, years, is_call = np.broadcast_arrays(
+        *[np.asarray(x, dtype=float) for x in [price, spot, strike, years]],
+        np.asarray(is_call, dtype=bool),
+    )
+    fwd_spot = spot * np.exp(-div * years)
+    pv_strike = strike * np.exp(-rate * years)
+    lower = np.where(
+        is_call,
+        np.maximum(fwd_spot - pv_strike, 0),
+        np.maximum(pv_strike - fwd_spot, 0),
+    )
+    upper = np.where(is_call, fwd_spot, pv_strike)
+    with np.errstate(invalid="ignore"):
+        valid = (price > lower) & (price < upper) & (years > 0) & (strike > 0)
+
+    # Only the valid options are solved for, starting from the approximation of
+    # Brenner and Subrahmanyam of at the money volatilities
+    p, s, k, t, c = (x[valid] for x in [price, spot, strike, years, is_call])
+    lo = np.full(len(p), MIN_VOL)
+    hi = np.full(len(p), MAX_VOL)
+    vol = np.clip(np.sqrt(2 * np.pi / t) * p / s, 0.05, 1.0)
+    converged = np.zeros(len(p), dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_iter):
+            diff = bs_price(s, k, t, rate, vol, c, div) - p
+            converged = np.abs(diff) < tol
+            if converged.all():
+                break
+            # Prices increase with the volatility, which brackets the solution
+            hi = np.where(diff > 0, vol, hi)
+            lo = np.where(diff < 0, vol, lo)
+            d1, _ = get_d1_d2(s, k, t, rate, vol, div)
+            vega = s * np.exp(-div * t) * norm_pdf(d1) * np.sqrt(t)
+            newton = vol - diff / vega
+            vol = np.where(
+                converged,
+                vol,
+                np.where((newton > lo) & (newton < hi), newton, 0.5 * (lo + hi)),
+            )
+
+    iv = np.full(price.shape, np.nan)
+    iv[valid] = np.where(converged, vol, np.nan)
+    return iv
+
+
+def get_greeks(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    years: np.ndarray,
+    rate: float,
+    vol: np.ndarray,
+    is_call: np.ndarray,
+    div: float = 0.0,
+) -> Dict[str, np.ndarray]:
+    """Black-Scholes Greeks of european options
+
+    Parameters
+    ----------
+    spot : np.ndarray
+        Underlying price
+    strike : np.ndarray
+        Strike prices
+    years : np.ndarray
+        Times to expiry, in years
+    rate : float
+        Risk free rate, continuously compounded
+    vol : np.ndarray
+        Volatilities
+    is_call : np.ndarray
+        True for calls, False for puts
+    div : float
+        Dividend yield, continuously compounded
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        delta, gamma, vega per volatility point and theta per calendar day
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, d2 = get_d1_d2(spot, strike, years, rate, vol, div)
+        sqrt_t = np.sqrt(years)
+        fwd_spot = spot * np.exp(-div * years)
+        pv_strike = strike * np.exp(-rate * years)
+        pdf_d1 = norm_pdf(d1)
+
+        time_decay = -fwd_spot * pdf_d1 * vol / (2 * sqrt_t)
+        theta = np.where(
+            is_call,
+            time_decay - rate * pv_strike * ndtr(d2) + div * fwd_spot * ndtr(d1),
+            time_decay + rate * pv_strike * ndtr(-d2) - div * fwd_spot * ndtr(-d1),
+        )
+        return {
+            "delta": np.where(
+                is_call,
+                np.exp(-div * years) * ndtr(d1),
+                -np.exp(-div * years) * ndtr(-d1),
+            ),
+            "gamma": np.exp(-div * years) * pdf_d1 / (spot * vol * sqrt_t),
+            "vega": fwd_spot * pdf_d1 * sqrt_t / 100,
+            "theta": theta / YEAR_DAYS,
+        }
+
+
+def get_chains_greeks(
+    df_chains: pd.DataFrame,
+    spot: float,
+    rate: float = 0.0,
+    div: float = 0.0,
+    now: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Implied volatility and Greeks of every contract of option chains
+
+    Parameters
+    ----------
+    df_chains : pd.DataFrame
+        Option chains, as from yahoo_view.get_option_chains_by_expiry, with expiry, type
+        ('calls' or 'puts'), strike, bid, ask and lastPrice columns
+    spot : float
+        Underlying price
+    rate : float
+        Risk free rate, continuously compounded
+    div : float
+        Dividend yield, continuously compounded
+    now : Optional[datetime]
+        Valuation time, now by default
+
+    Returns
+    -------
+    pd.DataFrame
+        Chains with iv, delta, gamma, vega and theta columns, NaN where the option price
+        gives no implied volatility. Prices are the bid/ask midpoints, or the last prices
+        of contracts without quotes.
+    """
+    now = now or datetime.now()
+    bid = df_chains["bid"].values.astype(float)
+    ask = df_chains["ask"].values.astype(float)
+    price = np.where(
+        (bid > 0) & (ask > 0), 0.5 * (bid + ask), df_chains["lastPrice"].values
+    ).astype(float)
+
+    expiries = pd.to_datetime(df_chains["expiry"]) + EXPIRY_TIME
+    years = (expiries - now).dt.total_seconds().values / (YEAR_DAYS * 24 * 3600)
+    strike = df_chains["strike"].values.astype(float)
+    is_call = (df_chains["type"] == "calls").values
+
+    iv = implied_volatility(price, spot, strike, years, rate, is_call, div)
+    d_greeks = get_greeks(spot, strike, years, rate, iv, is_call, div)
+
+    return df_chains.assign(iv=iv, **d_greeks)
+
+
+def get_gex_by_strike(df_greeks: pd.DataFrame, spot: float) -> pd.DataFrame:
+    """Gamma exposure of option dealers by strike
+
+    Dealers are assumed long the calls and short the puts held by their clients, so that
+    calls add gamma exposure and puts remove it.
+
+    Parameters
+    ----------
+    df_greeks : pd.DataFrame
+        Chains with gamma, from get_chains_greeks
+    spot : float
+        Underlying price
+
+    Returns
+    -------
+    pd.DataFrame
+        Dollar gamma exposure per 1% move of the underlying, of the calls, the puts and in
+        total, indexed by ascending strike
+    """
+    sign = np.where(df_greeks["type"] == "calls", 1.0, -1.0)
+    gex = (
+        sign
+        * np.nan_to_num(df_greeks["gamma"].values.astype(float))
+        * np.nan_to_num(df_greeks["openInterest"].values.astype(float))
+        * 100
+        * spot
+        * spot
+        * 0.01
+    )
+    df_gex = (
+        pd.DataFrame(
+            {
+                "strike": df_greeks["strike"].values,
+                "type": df_greeks["type"].values,
+                "gex": gex,
+            }
+        )
+        .pivot_table(index="strike", columns="type", values="gex", aggfunc="sum")
+        .reindex(columns=["calls", "puts"])
+        .fillna(0)
+    )
+    df_gex["total"] = df_gex["calls"] + df_gex["puts"]
+    return df_gex.sort_index()
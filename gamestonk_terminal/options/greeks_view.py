@@ -0,0 +1,286 @@
+""" Greeks view """
+__docformat__ = "numpy"
+
+import argparse
+from typing import List
+import matplotlib.pyplot as plt
+import pandas as pd
+from tabulate import tabulate
+
+from gamestonk_terminal.helper_funcs import (
+    plot_autoscale,
+    check_non_negative,
+    parse_known_args_and_warn,
+)
+from gamestonk_terminal.options import chains_model, greeks_model, yahoo_view
+from gamestonk_terminal import config_plot as cfgPlot
+from gamestonk_terminal import feature_flags as gtff
+
+
+def add_pricing_arguments(parser: argparse.ArgumentParser, b_strikes: bool = True):
+    """Add the rate and dividend yield arguments of the Black-Scholes model, and the
+    strike range arguments unless b_strikes is False"""
+    parser.add_argument(
+        "-r",
+        "--rate",
+        dest="rate",
+        type=float,
+        default=0.0,
+        help="risk free rate, in percent.",
+    )
+    parser.add_argument(
+        "-d",
+        "--div",
+        dest="div",
+        type=float,
+        default=0.0,
+        help="dividend yield of the stock, in percent.",
+    )
+    if not b_strikes:
+        return
+    parser.add_argument(
+        "-m",
+        "--min",
+        dest="min_sp",
+        type=check_non_negative,
+        default=-1,
+        help="minimum strike price to consider.",
+    )
+    parser.add_argument(
+        "-M",
+        "--max",
+        dest="max_sp",
+        type=check_non_negative,
+        default=-1,
+        help="maximum strike price to consider.",
+    )
+
+
+def get_strike_range(ns_parser: argparse.Namespace, last_adj_close_price: float):
+    """Strike range of the arguments, 75% to 125% of the price by default"""
+    min_strike = (
+        0.75 * last_adj_close_price if ns_parser.min_sp == -1 else ns_parser.min_sp
+    )
+    max_strike = (
+        1.25 * last_adj_close_price if ns_parser.max_sp == -1 else ns_parser.max_sp
+    )
+    return min_strike, max_strike
+
+
+def get_chains(yf_ticker_data, options, expiry_date: str, b_all: bool) -> pd.DataFrame:
+    """Option chains of every expiry date, or of the selected one
+
+    Parameters
+    ----------
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+    options
+        Option chain of the selected expiry date, with calls and puts
+    expiry_date : str
+        Selected expiry date
+    b_all : bool
+        Get the chains of every expiry date
+
+    Returns
+    -------
+    pd.DataFrame
+        Calls and puts, with additional expiry and type columns
+    """
+    if b_all:
+        return yahoo_view.get_option_chains_by_expiry(
+            yf_ticker_data, chains_model.get_expiry_dates(yf_ticker_data)
+        )
+    return pd.concat(
+        [
+            options.calls.assign(expiry=expiry_date, type="calls"),
+            options.puts.assign(expiry=expiry_date, type="puts"),
+        ],
+        ignore_index=True,
+    )
+
+
+def display_greeks(
+    other_args: List[str],
+    ticker: str,
+    expiry_date: str,
+    last_adj_close_price: float,
+    options,
+    yf_ticker_data,
+):
+    """Display the implied volatility and Greeks of an option chain
+
+    Parameters
+    ----------
+    other_args : List[str]
+        Command line arguments to be processed with argparse
+    ticker : str
+        Ticker of the options
+    expiry_date : str
+        Selected expiry date
+    last_adj_close_price : float
+        Last adjusted closing price
+    options
+        Option chain of the selected expiry date, with calls and puts
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+    """
+    parser = argparse.ArgumentParser(
+        add_help=False,
+        prog="greeks",
+        description="""
+            Display the Black-Scholes implied volatility, delta, gamma, vega (per volatility
+            point) and theta (per day) of the options of the selected expiry date, or of
+            every expiry date. [Source: Yahoo Finance]
+        """,
+    )
+    add_pricing_arguments(parser)
+    parser.add_argument(
+        "-a",
+        "--all",
+        action="store_true",
+        default=False,
+        dest="b_all",
+        help="options of every expiry date.",
+    )
+    parser.add_argument(
+        "-e",
+        "--export",
+        dest="s_export",
+        type=str,
+        default="",
+        help="csv file to export the options of the strike range to.",
+    )
+
+    try:
+        ns_parser = parse_known_args_and_warn(parser, other_args)
+        if not ns_parser:
+            return
+
+        df_chains = get_chains(yf_ticker_data, options, expiry_date, ns_parser.b_all)
+
+        df_greeks = greeks_model.get_chains_greeks(
+            df_chains,
+            last_adj_close_price,
+            ns_parser.rate / 100,
+            ns_parser.div / 100,
+        )
+
+        min_strike, max_strike = get_strike_range(ns_parser, last_adj_close_price)
+        df_greeks = df_greeks[
+            (df_greeks["strike"] >= min_strike) & (df_greeks["strike"] <= max_strike)
+        ]
+
+        s_expiry = "every expiry date" if ns_parser.b_all else expiry_date
+        l_columns = ["expiry", "strike", "lastPrice", "openInterest"]
+        l_columns += greeks_model.GREEKS_COLUMNS
+        for s_type in ["calls", "puts"]:
+            print(f"\n{ticker} {s_type} for {s_expiry}:")
+            print(
+                tabulate(
+                    df_greeks.loc[df_greeks["type"] == s_type, l_columns],
+                    headers=["Expiry", "Strike", "Last", "OI", "IV", "Delta"]
+                    + ["Gamma", "Vega", "Theta"],
+                    tablefmt="fancy_grid",
+                    showindex=False,
+                    floatfmt=".4f",
+                )
+            )
+        print("")
+
+        if ns_parser.s_export:
+            df_greeks.to_csv(ns_parser.s_export, index=False)
+            print(f"Exported to {ns_parser.s_export}\n")
+
+    except Exception as e:
+        print(e, "\n")
+        return
+
+
+def plot_gex(
+    other_args: List[str],
+    ticker: str,
+    expiry_date: str,
+    last_adj_close_price: float,
+    options,
+    yf_ticker_data,
+):
+    """Plot the gamma exposure of option dealers by strike
+
+    Parameters
+    ----------
+    other_args : List[str]
+        Command line arguments to be processed with argparse
+    ticker : str
+        Ticker of the options
+    expiry_date : str
+        Selected expiry date
+    last_adj_close_price : float
+        Last adjusted closing price
+    options
+        Option chain of the selected expiry date, with calls and puts
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+    """
+    parser = argparse.ArgumentParser(
+        add_help=False,
+        prog="gex",
+        description="""
+            Plot the gamma exposure by strike of every expiry date, in dollars per 1%
+            move of the stock, assuming dealers long the calls and short the puts.
+            [Source: Yahoo Finance]
+        """,
+    )
+    add_pricing_arguments(parser)
+    parser.add_argument(
+        "-s",
+        "--selected",
+        action="store_true",
+        default=False,
+        dest="b_selected",
+        help="options of the selected expiry date only.",
+    )
+
+    try:
+        ns_parser = parse_known_args_and_warn(parser, other_args)
+        if not ns_parser:
+            return
+
+        df_chains = get_chains(
+            yf_ticker_data, options, expiry_date, not ns_parser.b_selected
+        )
+
+        df_greeks = greeks_model.get_chains_greeks(
+            df_chains,
+            last_adj_close_price,
+            ns_parser.rate / 100,
+            ns_parser.div / 100,
+        )
+        df_gex = greeks_model.get_gex_by_strike(df_greeks, last_adj_close_price)
+
+        min_strike, max_strike = get_strike_range(ns_parser, last_adj_close_price)
+        df_gex = df_gex[(df_gex.index >= min_strike) & (df_gex.index <= max_strike)]
+
+        plt.figure(figsize=plot_autoscale(), dpi=cfgPlot.PLOT_DPI)
+        plt.axvline(last_adj_close_price, lw=2)
+        plt.bar(df_gex.index, df_gex["calls"] / 1e6, color="green", width=0.45)
+        plt.bar(df_gex.index, df_gex["puts"] / 1e6, color="red", width=0.45)
+        plt.plot(df_gex.index, df_gex["total"] / 1e6, color="k", lw=1)
+        s_expiry = expiry_date if ns_parser.b_selected else "every expiry date"
+        plt.title(f"{ticker} gamma exposure for {s_expiry}")
+        plt.legend(["Stock Price", "Net", "Calls", "Puts"])
+        plt.xlabel("Strike Price")
+        plt.ylabel("Gamma exposure ($M per 1% move)")
+        plt.grid(b=True, which="major", color="#666666", linestyle="-")
+
+        if gtff.USE_ION:
+            plt.ion()
+        plt.show()
+
+        print(
+            f"\nNet gamma exposure of the strike range: "
+            f"{df_gex['total'].sum() / 1e6:.2f} $M per 1% move\n"
+        )
+
+    except Exception as e:
+        print(e, "\n")
+        return
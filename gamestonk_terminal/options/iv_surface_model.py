@@ -0,0 +1,259 @@
+"""Implied volatility surface of option chains, and its snapshots stored on disk"""
+__docformat__ = "numpy"
+
+import os
+import pathlib
+import re
+from datetime import datetime
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal import config_terminal as cfg
+from gamestonk_terminal.ohlcv_cache import CACHE_FORMAT
+from gamestonk_terminal.options.greeks_model import EXPIRY_TIME, YEAR_DAYS
+
+# Regular grid of the surface: strike / price, and calendar days to expiry. Snapshots
+# taken on different days share the grid, so that they can be compared point by point.
+MONEYNESS_GRID = np.round(np.arange(0.7, 1.3001, 0.05), 2)
+DAYS_GRID = np.array([7, 14, 30, 60, 90, 180, 365, 730])
+
+SNAPSHOT_TIME_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def get_surface_points(
+    df_chains: pd.DataFrame, spot: float, now: Optional[datetime] = None
+) -> pd.DataFrame:
+    """Implied volatilities of the out of the money options of option chains
+
+    Parameters
+    ----------
+    df_chains : pd.DataFrame
+        Option chains with expiry, type ('calls' or 'puts'), strike and iv columns, as
+        from greeks_model.get_chains_greeks
+    spot : float
+        Underlying price
+    now : Optional[datetime]
+        Valuation time, now by default
+
+    Returns
+    -------
+    pd.DataFrame
+        expiry, years to expiry, strike, moneyness and iv of the calls above the price
+        and of the puts below it, without missing implied volatilities, sorted by expiry
+        and strike
+    """
+    now = now or datetime.now()
+    strike = df_chains["strike"].values.astype(float)
+    iv = pd.to_numeric(df_chains["iv"], errors="coerce").values
+    is_call = (df_chains["type"] == "calls").values
+    b_otm = np.where(is_call, strike >= spot, strike < spot)
+
+    expiries = pd.to_datetime(df_chains["expiry"]) + EXPIRY_TIME
+    years = (expiries - now).dt.total_seconds().values / (YEAR_DAYS * 24 * 3600)
+
+    df_points = pd.DataFrame(
+        {
+            "expiry": df_chains["expiry"].values,
+            "years": years,
+            "strike": strike,
+            "moneyness": strike / spot,
+            "iv": iv,
+        }
+    )
+    df_points = df_points[b_otm & (years > 0) & (iv > 0)]
+    return df_points.sort_values(["years", "strike"]).reset_index(drop=True)
+
+
+def interpolate_surface(
+    df_points: pd.DataFrame,
+    moneyness: np.ndarray = MONEYNESS_GRID,
+    days: np.ndarray = DAYS_GRID,
+) -> pd.DataFrame:
+    """Implied volatility surface on a regular moneyness x days to expiry grid
+
+    Total variances, iv^2 x years, are interpolated linearly in moneyness along each
+    expiry, and then linearly in time between the expiries around each grid maturity,
+    for every grid point at once. The surface is not extrapolated beyond the strikes
+    of an expiry, nor beyond the first and last expiries.
+
+    Parameters
+    ----------
+    df_points : pd.DataFrame
+        Implied volatilities with years, moneyness and iv columns, from
+        get_surface_points
+    moneyness : np.ndarray
+        Ascending strikes / price of the grid
+    days : np.ndarray
+        Ascending calendar days to expiry of the grid
+
+    Returns
+    -------
+    pd.DataFrame
+        Implied volatilities indexed by moneyness, with a column per days to expiry.
+        NaN outside the quoted strikes and expiries.
+    """
+    moneyness = np.asarray(moneyness, dtype=float)
+    grid_years = np.asarray(days, dtype=float) / YEAR_DAYS
+
+    # Total variance of every expiry at the grid moneyness: expiries x moneyness
+    l_years = list()
+    l_variances = list()
+    for years, df_expiry in df_points.groupby("years", sort=True):
+        if len(df_expiry) < 2:
+            continue
+        df_expiry = df_expiry.groupby("moneyness")["iv"].mean()
+        l_years.append(years)
+        l_variances.append(
+            np.interp(
+                moneyness,
+                df_expiry.index.values,
+                df_expiry.values ** 2 * years,
+                left=np.nan,
+                right=np.nan,
+            )
+        )
+
+    surface = np.full((len(moneyness), len(grid_years)), np.nan)
+    if len(l_years) >= 2:
+        expiry_years = np.array(l_years)
+        variances = np.array(l_variances)
+
+        # Expiries around each grid maturity, and the weight of the later one
+        idx = np.clip(np.searchsorted(expiry_years, grid_years), 1, len(l_years) - 1)
+        t0 = expiry_years[idx - 1]
+        t1 = expiry_years[idx]
+        weight = (grid_years - t0) / (t1 - t0)
+        b_inside = (grid_years >= expiry_years[0]) & (grid_years <= expiry_years[-1])
+
+        variance = (
+            variances[idx - 1].T * (1 - weight) + variances[idx].T * weight
+        )  # moneyness x days
+        with np.errstate(invalid="ignore"):
+            surface[:, b_inside] = np.sqrt(variance[:, b_inside] / grid_years[b_inside])
+
+    return pd.DataFrame(
+        surface,
+        index=pd.Index(moneyness, name="moneyness"),
+        columns=pd.Index(np.asarray(days), name="days"),
+    )
+
+
+def get_snapshot_dir(ticker: str) -> pathlib.Path:
+    """Directory of the stored surface snapshots of a ticker"""
+    return pathlib.Path(
+        cfg.DATA_CACHE_DIR,
+        "iv_surface",
+        re.sub(r"[^A-Za-z0-9_.\-]", "_", ticker.upper()),
+    )
+
+
+def save_snapshot(
+    df_surface: pd.DataFrame, ticker: str, now: Optional[datetime] = None
+) -> pathlib.Path:
+    """Store a surface, as float32 implied volatilities, in a file named after its time
+
+    Parameters
+    ----------
+    df_surface : pd.DataFrame
+        Surface from interpolate_surface
+    ticker : str
+        Ticker of the options
+    now : Optional[datetime]
+        Time of the snapshot, now by default
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the snapshot
+    """
+    now = now or datetime.now()
+    snapshot_file = pathlib.Path(
+        get_snapshot_dir(ticker),
+        f"{now.strftime(SNAPSHOT_TIME_FORMAT)}.{CACHE_FORMAT}",
+    )
+    os.makedirs(snapshot_file.parent, exist_ok=True)
+
+    # Parquet needs string column names
+    df_snapshot = df_surface.astype(np.float32)
+    df_snapshot.columns = df_snapshot.columns.astype(str)
+    if CACHE_FORMAT == "parquet":
+        df_snapshot.to_parquet(snapshot_file)
+    else:
+        df_snapshot.to_pickle(snapshot_file)
+    return snapshot_file
+
+
+def list_snapshots(ticker: str) -> List[datetime]:
+    """Times of the stored surface snapshots of a ticker
+
+    Parameters
+    ----------
+    ticker : str
+        Ticker of the options
+
+    Returns
+    -------
+    List[datetime]
+        Snapshot times, from oldest to newest
+    """
+    snapshot_dir = get_snapshot_dir(ticker)
+    if not os.path.isdir(snapshot_dir):
+        return []
+
+    l_times = list()
+    for snapshot_file in snapshot_dir.glob(f"*.{CACHE_FORMAT}"):
+        try:
+            l_times.append(datetime.strptime(snapshot_file.stem, SNAPSHOT_TIME_FORMAT))
+        except ValueError:
+            continue
+    return sorted(l_times)
+
+
+def load_snapshot(ticker: str, snapshot_time: datetime) -> pd.DataFrame:
+    """Stored surface snapshot of a ticker
+
+    Parameters
+    ----------
+    ticker : str
+        Ticker of the options
+    snapshot_time : datetime
+        Time of the snapshot, from list_snapshots
+
+    Returns
+    -------
+    pd.DataFrame
+        Implied volatilities indexed by moneyness, with a column per days to expiry
+    """
+    snapshot_file = pathlib.Path(
+        get_snapshot_dir(ticker),
+        f"{snapshot_time.strftime(SNAPSHOT_TIME_FORMAT)}.{CACHE_FORMAT}",
+    )
+    if CACHE_FORMAT == "parquet":
+        df_surface = pd.read_parquet(snapshot_file)
+    else:
+        df_surface = pd.read_pickle(snapshot_file)
+
+    df_surface = df_surface.astype(float)
+    df_surface.columns = pd.Index(df_surface.columns.astype(int), name="days")
+    return df_surface
+
+
+def diff_surfaces(df_old: pd.DataFrame, df_new: pd.DataFrame) -> pd.DataFrame:
+    """Change of implied volatility between two surfaces, on their common grid points
+
+    Parameters
+    ----------
+    df_old : pd.DataFrame
+        Earlier surface
+    df_new : pd.DataFrame
+        Later surface
+
+    Returns
+    -------
+    pd.DataFrame
+        New minus old implied volatilities, indexed by moneyness with a column per days
+        to expiry. NaN where either surface has no value.
+    """
+    df_old, df_new = df_old.align(df_new, join="inner")
+    return df_new - df_old
@@ -0,0 +1,223 @@
+""" Implied volatility surface view """
+__docformat__ = "numpy"
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from gamestonk_terminal.helper_funcs import (
+    plot_autoscale,
+    check_non_negative,
+    parse_known_args_and_warn,
+)
+from gamestonk_terminal.options import (
+    chains_model,
+    greeks_model,
+    greeks_view,
+    iv_surface_model,
+    tradier_view,
+    yahoo_view,
+)
+from gamestonk_terminal import config_plot as cfgPlot
+from gamestonk_terminal import feature_flags as gtff
+
+
+def get_tradier_chains(ticker: str, expiries: List[str]) -> pd.DataFrame:
+    """Tradier option chains of several expiry dates, with their implied volatilities
+
+    Parameters
+    ----------
+    ticker : str
+        Ticker of the options
+    expiries : List[str]
+        Expiry dates, formatted YYYY-MM-DD
+
+    Returns
+    -------
+    pd.DataFrame
+        expiry, type ('calls' or 'puts'), strike and iv of every option
+    """
+    with ThreadPoolExecutor(max_workers=chains_model.CHAINS_WORKERS) as executor:
+        l_chains = list(
+            executor.map(
+                lambda expiry: tradier_view.get_option_chains(ticker, expiry), expiries
+            )
+        )
+
+    return pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "expiry": expiry,
+                    "type": df_chain["option_type"].map(
+                        {"call": "calls", "put": "puts"}
+                    ),
+                    "strike": df_chain["strike"].astype(float),
+                    "iv": pd.to_numeric(df_chain["mid_iv"], errors="coerce"),
+                }
+            )
+            for expiry, df_chain in zip(expiries, l_chains)
+            if not df_chain.empty
+        ],
+        ignore_index=True,
+    )
+
+
+def plot_surface(df_surface: pd.DataFrame, title: str, label: str):
+    """Plot a surface, or a surface change, as a moneyness x days to expiry heatmap
+
+    Parameters
+    ----------
+    df_surface : pd.DataFrame
+        Implied volatilities indexed by moneyness, with a column per days to expiry
+    title : str
+        Title of the plot
+    label : str
+        Label of the color bar
+    """
+    _, ax = plt.subplots(figsize=plot_autoscale(), dpi=cfgPlot.PLOT_DPI)
+    im = ax.imshow(
+        np.ma.masked_invalid(100 * df_surface.values.astype(float)),
+        cmap="RdYlGn_r",
+        aspect="auto",
+        origin="lower",
+    )
+    ax.set_xticks(range(len(df_surface.columns)))
+    ax.set_xticklabels(df_surface.columns)
+    ax.set_yticks(range(len(df_surface.index)))
+    ax.set_yticklabels([f"{x:.0%}" for x in df_surface.index])
+    ax.set_xlabel("Days to expiry")
+    ax.set_ylabel("Strike / Price")
+    ax.set_title(title)
+    plt.colorbar(im, ax=ax, label=label)
+
+    if gtff.USE_ION:
+        plt.ion()
+    plt.show()
+
+
+def display_iv_surface(
+    other_args: List[str], ticker: str, last_adj_close_price: float, yf_ticker_data
+):
+    """Display the implied volatility surface of every expiry date, store it, and
+    compare it with a stored snapshot
+
+    Parameters
+    ----------
+    other_args : List[str]
+        Command line arguments to be processed with argparse
+    ticker : str
+        Ticker of the options
+    last_adj_close_price : float
+        Last adjusted closing price
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+    """
+    parser = argparse.ArgumentParser(
+        add_help=False,
+        prog="surface",
+        description="""
+            Display the implied volatility surface of the out of the money options of
+            every expiry date, interpolated on a strike / price x days to expiry grid,
+            and store it as a snapshot. Snapshots share the grid, so that the surface
+            can be compared with a previous one. [Source: Yahoo Finance or Tradier]
+        """,
+    )
+    greeks_view.add_pricing_arguments(parser, b_strikes=False)
+    parser.add_argument(
+        "-s",
+        "--source",
+        dest="source",
+        choices=["yf", "tr"],
+        default="yf",
+        help="implied volatilities solved from Yahoo Finance prices, or from Tradier.",
+    )
+    parser.add_argument(
+        "-c",
+        "--compare",
+        dest="n_compare",
+        type=check_non_negative,
+        default=0,
+        help="compare with the n-th previous stored snapshot, 1 being the latest one.",
+    )
+    parser.add_argument(
+        "--no-save",
+        action="store_true",
+        default=False,
+        dest="b_no_save",
+        help="do not store the surface as a snapshot.",
+    )
+
+    try:
+        ns_parser = parse_known_args_and_warn(parser, other_args)
+        if not ns_parser:
+            return
+
+        l_snapshots = iv_surface_model.list_snapshots(ticker)
+        if ns_parser.n_compare > len(l_snapshots):
+            print(f"Only {len(l_snapshots)} snapshots of {ticker} are stored\n")
+            return
+
+        expiries = chains_model.get_expiry_dates(yf_ticker_data)
+        if ns_parser.source == "tr":
+            df_chains = get_tradier_chains(ticker, expiries)
+        else:
+            df_chains = greeks_model.get_chains_greeks(
+                yahoo_view.get_option_chains_by_expiry(yf_ticker_data, expiries),
+                last_adj_close_price,
+                ns_parser.rate / 100,
+                ns_parser.div / 100,
+            )
+
+        df_points = iv_surface_model.get_surface_points(df_chains, last_adj_close_price)
+        df_surface = iv_surface_model.interpolate_surface(df_points)
+
+        print(f"\n{ticker} implied volatility surface (%):")
+        print(
+            tabulate(
+                100 * df_surface,
+                headers=[f"{days}d" for days in df_surface.columns],
+                showindex=[f"{x:.0%}" for x in df_surface.index],
+                tablefmt="fancy_grid",
+                floatfmt=".1f",
+            )
+        )
+
+        if ns_parser.n_compare:
+            snapshot_time = l_snapshots[-ns_parser.n_compare]
+            df_diff = iv_surface_model.diff_surfaces(
+                iv_surface_model.load_snapshot(ticker, snapshot_time), df_surface
+            )
+            s_since = snapshot_time.strftime("%Y-%m-%d %H:%M")
+            print(f"\nChange since {s_since} (volatility points):")
+            print(
+                tabulate(
+                    100 * df_diff,
+                    headers=[f"{days}d" for days in df_diff.columns],
+                    showindex=[f"{x:.0%}" for x in df_diff.index],
+                    tablefmt="fancy_grid",
+                    floatfmt="+.1f",
+                )
+            )
+            plot_surface(
+                df_diff,
+                f"{ticker} implied volatility change since {s_since}",
+                "Volatility points",
+            )
+        else:
+            plot_surface(
+                df_surface, f"{ticker} implied volatility surface", "Volatility (%)"
+            )
+
+        if not ns_parser.b_no_save:
+            snapshot_file = iv_surface_model.save_snapshot(df_surface, ticker)
+            print(f"Snapshot stored in {snapshot_file}")
+        print("")
+
+    except Exception as e:
+        print(e, "\n")
+        return
@@ -10,7 +10,14 @@ import yfinance as yf
 from prompt_toolkit.completion import NestedCompleter
 from gamestonk_terminal.helper_funcs import get_flair, parse_known_args_and_warn
 from gamestonk_terminal import feature_flags as gtff
-from gamestonk_terminal.options import yahoo_view, tradier_view, barchart_view
+from gamestonk_terminal.options import (
+    chains_model,
+    yahoo_view,
+    tradier_view,
+    barchart_view,
+    greeks_view,
+    iv_surface_view,
+)
 from gamestonk_terminal.menu import session
 
 
@@ -18,14 +25,30 @@ class OptionsController:
     """Options Controller class."""
 
     # Command choices
-    CHOICES = ["help", "q", "quit", "exp", "voi", "vcalls", "vputs", "chains", "info"]
+    CHOICES = [
+        "help",
+        "q",
+        "quit",
+        "exp",
+        "voi",
+        "vcalls",
+        "vputs",
+        "maxpain",
+        "greeks",
+        "gex",
+        "surface",
+        "chains",
+        "info",
+    ]
 
     def __init__(self, ticker: str, stock: pd.DataFrame):
         """Construct data."""
         self.ticker = ticker
         self.yf_ticker_data = yf.Ticker(self.ticker)
-        self.expiry_date = self.yf_ticker_data.options[0]
-        self.options = self.yf_ticker_data.option_chain(self.expiry_date)
+        # Option chains are downloaded in the background, and when first used. The
+        # downloads not started yet are cancelled when leaving the menu.
+        self.prefetch = chains_model.prefetch_ticker_chains(self.yf_ticker_data)
+        self.selected_date = ""
         self.last_adj_close_price = stock["5. adjusted close"].values[-1]
 
         self.op_parser = argparse.ArgumentParser(add_help=False, prog="op")
@@ -34,6 +57,21 @@ class OptionsController:
             choices=self.CHOICES,
         )
 
+    @property
+    def expiries(self) -> List[str]:
+        """Expiry dates of the options of the ticker"""
+        return chains_model.get_expiry_dates(self.yf_ticker_data)
+
+    @property
+    def expiry_date(self) -> str:
+        """Selected expiry date, the nearest one by default"""
+        return self.selected_date or self.expiries[0]
+
+    @property
+    def options(self):
+        """Option chain of the selected expiry date"""
+        return chains_model.get_option_chain(self.yf_ticker_data, self.expiry_date)
+
     def expiry_dates(self, other_args: List[str]):
         """Print all available expiry dates."""
         parser = argparse.ArgumentParser(
@@ -48,7 +86,7 @@ class OptionsController:
             action="store",
             type=int,
             default=-1,
-            choices=range(len(self.yf_ticker_data.options)),
+            choices=range(len(self.expiries)),
             help=f"Expiry date index for {self.ticker}.",
         )
 
@@ -64,13 +102,12 @@ class OptionsController:
             # Print possible expiry dates
             if ns_parser.n_date == -1:
                 print("\nAvailable expiry dates:")
-                for i, d in enumerate(self.yf_ticker_data.options):
+                for i, d in enumerate(self.expiries):
                     print(f"   {(2-len(str(i)))*' '}{i}.  {d}")
 
             # It means an expiry date was correctly selected
             else:
-                self.expiry_date = self.yf_ticker_data.options[ns_parser.n_date]
-                self.options = self.yf_ticker_data.option_chain(self.expiry_date)
+                self.selected_date = self.expiries[ns_parser.n_date]
                 print(f"\nSelected expiry date : {self.expiry_date}")
 
         except Exception as e:
@@ -93,6 +130,10 @@ class OptionsController:
         print("   voi           volume + open interest options trading plot")
         print("   vcalls        calls volume + open interest plot")
         print("   vputs         puts volume + open interest plot")
+        print("   maxpain       max pain of every expiry date")
+        print("   greeks        implied volatility and greeks of the option chains")
+        print("   gex           gamma exposure by strike")
+        print("   surface       implied volatility surface, and its change over time")
         print("")
         print("   chains        display option chains")
         print("   info          display option information (volatility, IV rank etc)")
@@ -121,10 +162,13 @@ class OptionsController:
 
     def call_q(self, _):
         """Process Q command - quit the menu."""
+        chains_model.cancel_prefetch(self.prefetch)
         return False
 
     def call_quit(self, _):
         """Process Quit command - quit the program."""
+        chains_model.cancel_prefetch(self.prefetch)
+        chains_model.shutdown()
         return True
 
     def call_exp(self, other_args: List[str]):
@@ -162,6 +206,46 @@ class OptionsController:
             self.options.puts,
         )
 
+    def call_maxpain(self, other_args: List[str]):
+        """Process maxpain command."""
+        yahoo_view.display_max_pain(
+            other_args,
+            self.ticker,
+            self.yf_ticker_data,
+            self.last_adj_close_price,
+        )
+
+    def call_greeks(self, other_args: List[str]):
+        """Process greeks command."""
+        greeks_view.display_greeks(
+            other_args,
+            self.ticker,
+            self.expiry_date,
+            self.last_adj_close_price,
+            self.options,
+            self.yf_ticker_data,
+        )
+
+    def call_gex(self, other_args: List[str]):
+        """Process gex command."""
+        greeks_view.plot_gex(
+            other_args,
+            self.ticker,
+            self.expiry_date,
+            self.last_adj_close_price,
+            self.options,
+            self.yf_ticker_data,
+        )
+
+    def call_surface(self, other_args: List[str]):
+        """Process surface command."""
+        iv_surface_view.display_iv_surface(
+            other_args,
+            self.ticker,
+            self.last_adj_close_price,
+            self.yf_ticker_data,
+        )
+
     def call_chains(self, other_args):
         tradier_view.display_chains(self.ticker, self.expiry_date, other_args)
 
@@ -8,6 +8,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
+from tabulate import tabulate
 
 from gamestonk_terminal.helper_funcs import (
     plot_autoscale,
@@ -16,6 +17,7 @@ from gamestonk_terminal.helper_funcs import (
 )
 from gamestonk_terminal import config_plot as cfgPlot
 from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal.options import chains_model
 
 
 def plot_volume_open_interest(
@@ -461,31 +463,38 @@ def plot_puts_volume_open_interest(
         return
 
 
-def get_loss_at_strike(strike: float, chain: pd.DataFrame) -> float:
+def get_loss_at_strikes(
+    strikes: np.ndarray, oi_calls: np.ndarray, oi_puts: np.ndarray
+) -> np.ndarray:
     """
-    Function to get the loss at the given expiry
+    Function to get the total loss at expiry, for an expiry price at each of the strikes
     Parameters
     ----------
-    strike: Union[int,float]
-        Value to calculate total loss at
-    chain: Dataframe:
-        Dataframe containing at least strike and openInterest
+    strikes: np.ndarray
+        Strikes sorted in ascending order
+    oi_calls: np.ndarray
+        Calls open interest at each strike
+    oi_puts: np.ndarray
+        Puts open interest at each strike, negative as in the _view code
 
     Returns
     -------
-    loss: Union[float,int]
-        Total loss
+    loss: np.ndarray
+        Total loss for an expiry price at each strike
     """
+    oi_calls = np.nan_to_num(oi_calls.astype(float))
+    # The sign change below is due to a sign change for plotting in the _view code
+    oi_puts = -np.nan_to_num(oi_puts.astype(float))
 
-    itm_calls = chain[chain.index < strike][["OI_call"]]
-    itm_calls["loss"] = (strike - itm_calls.index) * itm_calls["OI_call"]
-    call_loss = itm_calls["loss"].sum()
-    # The *-1 below is due to a sign change for plotting in the _view code
-    itm_puts = chain[chain.index > strike][["OI_put"]]
-    itm_puts["loss"] = (itm_puts.index - strike) * itm_puts["OI_put"] * -1
-    put_loss = itm_puts.loss.sum()
-    loss = call_loss + put_loss
-    return loss
+    # Calls with strike K < P lose (P - K) * OI, so the loss at P is P * sum(OI) - sum(K * OI)
+    # over the lower strikes. Strikes equal to P have no loss, so cumulative sums can include them.
+    call_loss = strikes * np.cumsum(oi_calls) - np.cumsum(strikes * oi_calls)
+    # Puts with strike K > P lose (K - P) * OI, which uses the sums over the higher strikes
+    put_oi_above = oi_puts.sum() - np.cumsum(oi_puts)
+    put_koi_above = (strikes * oi_puts).sum() - np.cumsum(strikes * oi_puts)
+    put_loss = put_koi_above - strikes * put_oi_above
+
+    return call_loss + put_loss
 
 
 def get_max_pain(chain: pd.DataFrame) -> int:
@@ -502,16 +511,153 @@ def get_max_pain(chain: pd.DataFrame) -> int:
         Max pain value
     """
 
-    strikes = np.array(chain.index)
     if ("OI_call" not in chain.columns) or ("OI_put" not in chain.columns):
         print("Incorrect columns.  Unable to parse max pain")
         return np.nan
 
-    loss = []
-    for price_at_exp in strikes:
-        loss.append(get_loss_at_strike(price_at_exp, chain))
-
-    chain["loss"] = loss
+    df_sorted = chain.sort_index()
+    chain["loss"] = pd.Series(
+        get_loss_at_strikes(
+            df_sorted.index.values.astype(float),
+            df_sorted["OI_call"].values,
+            df_sorted["OI_put"].values,
+        ),
+        index=df_sorted.index,
+    )
     max_pain = chain["loss"].idxmin()
 
     return max_pain
+
+
+def get_max_pain_by_expiry(df_chains: pd.DataFrame) -> pd.Series:
+    """
+    Returns the max pain of every expiry date, computed in a single pass over all chains
+    Parameters
+    ----------
+    df_chains: pd.DataFrame
+        Option chains of all the expiry dates, with expiry, type ('calls' or 'puts'),
+        strike and openInterest columns
+
+    Returns
+    -------
+    max_pain: pd.Series
+        Max pain indexed by expiry date
+    """
+    df_chains = df_chains.assign(openInterest=df_chains["openInterest"].fillna(0))
+    # Only strikes with both calls and puts are considered, as in get_calls_puts_maxpain
+    df_oi = df_chains.pivot_table(
+        index=["expiry", "strike"],
+        columns="type",
+        values="openInterest",
+        aggfunc="sum",
+    ).dropna()
+
+    strikes = df_oi.index.get_level_values("strike").values.astype(float)
+    oi_calls = df_oi["calls"].values
+    oi_puts = df_oi["puts"].values
+
+    df_sums = pd.DataFrame(
+        {
+            "oi_calls": oi_calls,
+            "koi_calls": strikes * oi_calls,
+            "oi_puts": oi_puts,
+            "koi_puts": strikes * oi_puts,
+        },
+        index=df_oi.index,
+    )
+    df_cumsums = df_sums.groupby(level="expiry").cumsum()
+    df_totals = df_sums.groupby(level="expiry").transform("sum")
+
+    call_loss = strikes * df_cumsums["oi_calls"] - df_cumsums["koi_calls"]
+    put_loss = (df_totals["koi_puts"] - df_cumsums["koi_puts"]) - strikes * (
+        df_totals["oi_puts"] - df_cumsums["oi_puts"]
+    )
+    loss = call_loss + put_loss
+
+    return loss.groupby(level="expiry").idxmin().map(lambda idx: idx[1])
+
+
+def get_option_chains_by_expiry(yf_ticker_data, expiries: List[str]) -> pd.DataFrame:
+    """
+    Gets the Yahoo Finance option chains of several expiry dates as a single dataframe,
+    downloaded concurrently and cached
+    Parameters
+    ----------
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+    expiries: List[str]
+        Expiry dates, formatted YYYY-MM-DD
+
+    Returns
+    -------
+    df_chains: pd.DataFrame
+        Calls and puts of every expiry date, with additional expiry and type columns
+    """
+    l_chains = list()
+    for expiry, option_chain in zip(
+        expiries, chains_model.get_option_chains(yf_ticker_data, expiries)
+    ):
+        l_chains.append(option_chain.calls.assign(expiry=expiry, type="calls"))
+        l_chains.append(option_chain.puts.assign(expiry=expiry, type="puts"))
+
+    return pd.concat(l_chains, ignore_index=True)
+
+
+def display_max_pain(
+    other_args: List[str], ticker: str, yf_ticker_data, last_adj_close_price: float
+):
+    """Display the max pain of every expiry date
+
+    Parameters
+    ----------
+    other_args : List[str]
+        Command line arguments to be processed with argparse
+    ticker : str
+        Ticker to get max pain for
+    yf_ticker_data: yf.Ticker
+        Yahoo Finance ticker object
+    last_adj_close_price: float
+        Last adjusted closing price
+    """
+    parser = argparse.ArgumentParser(
+        add_help=False,
+        prog="maxpain",
+        description="""
+            Display the max pain of every expiry date. [Source: Yahoo Finance]
+        """,
+    )
+
+    try:
+        ns_parser = parse_known_args_and_warn(parser, other_args)
+        if not ns_parser:
+            return
+
+        df_chains = get_option_chains_by_expiry(
+            yf_ticker_data, chains_model.get_expiry_dates(yf_ticker_data)
+        )
+        max_pain = get_max_pain_by_expiry(df_chains)
+
+        df_max_pain = pd.DataFrame(
+            {
+                "Max pain": max_pain.values,
+                "Distance to price": [
+                    f"{100 * (strike / last_adj_close_price - 1):.2f} %"
+                    for strike in max_pain.values
+                ],
+            },
+            index=max_pain.index,
+        )
+        print(f"\n{ticker} max pain by expiry date:")
+        print(
+            tabulate(
+                df_max_pain,
+                headers=["Expiry", *df_max_pain.columns],
+                tablefmt="fancy_grid",
+                floatfmt=".2f",
+            )
+        )
+        print("")
+
+    except Exception as e:
+        print(e, "\n")
+        return
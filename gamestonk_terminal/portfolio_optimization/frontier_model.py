@@ -0,0 +1,173 @@
+"""Monte Carlo simulation of random portfolios, streamed in chunks"""
+__docformat__ = "numpy"
+
+import multiprocessing
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# Portfolios drawn at once, each chunk holding chunk_size x n_assets weights
+DEFAULT_CHUNK_SIZE = 10000
+
+# Simulated portfolios kept to be plotted, drawn uniformly from every chunk
+PLOT_SAMPLE_SIZE = 5000
+
+# Expected returns and covariance of the simulation, set once per process by init_worker
+_mu: Optional[np.ndarray] = None
+_cov: Optional[np.ndarray] = None
+
+
+def get_pareto_frontier(stds: np.ndarray, rets: np.ndarray) -> np.ndarray:
+    """Indices of the portfolios that no other portfolio beats in both risk and return
+
+    Parameters
+    ----------
+    stds : np.ndarray
+        Volatilities of the portfolios
+    rets : np.ndarray
+        Expected returns of the portfolios
+
+    Returns
+    -------
+    np.ndarray
+        Indices of the frontier portfolios, by ascending volatility
+    """
+    order = np.lexsort((-rets, stds))
+    sorted_rets = rets[order]
+    # A portfolio is on the frontier when it returns more than every less risky one
+    prev_max = np.maximum.accumulate(np.concatenate([[-np.inf], sorted_rets[:-1]]))
+    return order[sorted_rets > prev_max]
+
+
+def init_worker(mu: np.ndarray, cov: np.ndarray):
+    """Set the expected returns and covariance of the simulation run by this process"""
+    global _mu, _cov  # pylint: disable=global-statement
+    _mu = mu
+    _cov = cov
+
+
+def simulate_chunk(job: Tuple[np.random.SeedSequence, int, int]) -> Tuple:
+    """Simulate a chunk of random long only portfolios, and reduce it to the points to keep
+
+    Parameters
+    ----------
+    job : Tuple[np.random.SeedSequence, int, int]
+        Seed of the chunk, number of portfolios and number of them to keep for plotting
+
+    Returns
+    -------
+    Tuple
+        Weights, volatilities and returns of the frontier portfolios, of the maximum
+        Sharpe ratio and minimum volatility portfolios, and of the plotted sample
+    """
+    seed, n_port, n_sample = job
+    assert _mu is not None and _cov is not None, "init_worker sets the simulation"
+    rng = np.random.default_rng(seed)
+    weights = rng.dirichlet(np.ones(len(_mu)), n_port)
+
+    rets = weights @ _mu
+    # Variance of every portfolio, without the n_port x n_port matrix of w S w'
+    stds = np.sqrt(np.einsum("ij,ij->i", weights @ _cov, weights))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpes = rets / stds
+    idx = np.concatenate(
+        [
+            get_pareto_frontier(stds, rets),
+            [np.nanargmax(sharpes), np.argmin(stds)],
+            np.arange(n_sample),
+        ]
+    )
+    return weights[idx], stds[idx], rets[idx]
+
+
+def simulate_portfolios(
+    mu: pd.Series,
+    cov: pd.DataFrame,
+    n_port: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    n_jobs: int = 1,
+    seed: Optional[int] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Simulate random long only portfolios, with Dirichlet distributed weights
+
+    Portfolios are drawn in chunks of chunk_size, possibly in parallel worker processes,
+    and each chunk is reduced to its frontier and summary portfolios, so that memory
+    does not grow with the number of portfolios.
+
+    Parameters
+    ----------
+    mu : pd.Series
+        Expected returns of the assets
+    cov : pd.DataFrame
+        Covariance of the assets returns
+    n_port : int
+        Number of portfolios to simulate
+    chunk_size : int
+        Number of portfolios simulated at once
+    n_jobs : int
+        Number of worker processes
+    seed : Optional[int]
+        Seed of the simulation. Results of a seed depend on chunk_size, but not on
+        n_jobs.
+
+    Returns
+    -------
+    pd.DataFrame
+        Frontier portfolios, by ascending volatility: volatility, return and sharpe
+        columns, and a weight column per asset
+    pd.DataFrame
+        'Max Sharpe' and 'Min Volatility' portfolios, with the same columns
+    pd.DataFrame
+        Up to PLOT_SAMPLE_SIZE simulated portfolios, with the same columns
+    """
+    l_chunks = [
+        min(chunk_size, n_port - start) for start in range(0, n_port, chunk_size)
+    ]
+    l_seeds = np.random.SeedSequence(seed).spawn(len(l_chunks))
+    l_jobs = [
+        (
+            chunk_seed,
+            n_chunk,
+            min(n_chunk, int(np.ceil(PLOT_SAMPLE_SIZE * n_chunk / n_port))),
+        )
+        for chunk_seed, n_chunk in zip(l_seeds, l_chunks)
+    ]
+
+    mu_values = mu.values.astype(float)
+    cov_values = cov.loc[mu.index, mu.index].values.astype(float)
+    if n_jobs > 1 and len(l_jobs) > 1:
+        with multiprocessing.get_context("spawn").Pool(
+            processes=min(n_jobs, len(l_jobs)),
+            initializer=init_worker,
+            initargs=(mu_values, cov_values),
+        ) as pool:
+            l_results: List[Tuple] = pool.map(simulate_chunk, l_jobs)
+    else:
+        init_worker(mu_values, cov_values)
+        l_results = list(map(simulate_chunk, l_jobs))
+
+    weights = np.concatenate([result[0] for result in l_results])
+    df_port = pd.DataFrame(weights, columns=mu.index)
+    df_port.insert(0, "volatility", np.concatenate([result[1] for result in l_results]))
+    df_port.insert(1, "return", np.concatenate([result[2] for result in l_results]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df_port.insert(2, "sharpe", df_port["return"] / df_port["volatility"])
+
+    df_frontier = df_port.iloc[
+        get_pareto_frontier(df_port["volatility"].values, df_port["return"].values)
+    ].reset_index(drop=True)
+
+    df_best = df_port.loc[
+        [df_port["sharpe"].idxmax(), df_port["volatility"].idxmin()]
+    ].set_index(pd.Index(["Max Sharpe", "Min Volatility"]))
+
+    # The plotted sample is the tail of every chunk result
+    l_sample = list()
+    start = 0
+    for (_, _, n_sample), result in zip(l_jobs, l_results):
+        start += len(result[1])
+        l_sample.append(df_port.iloc[start - n_sample : start])
+    df_sample = pd.concat(l_sample, ignore_index=True).head(PLOT_SAMPLE_SIZE)
+
+    return df_frontier, df_best, df_sample
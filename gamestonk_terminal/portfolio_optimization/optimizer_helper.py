@@ -2,19 +2,39 @@
 __docformat__ = "numpy"
 
 import argparse
-from typing import List
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
 import math
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import yfinance as yf
 from pypfopt.efficient_frontier import EfficientFrontier
 from pypfopt import risk_models
 from pypfopt import expected_returns
+from gamestonk_terminal import config_terminal as cfg
 from gamestonk_terminal.config_plot import PLOT_DPI
 from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal import market_data
 from gamestonk_terminal.helper_funcs import plot_autoscale
 
+# Covariance estimators of pypfopt risk_models.risk_matrix
+risk_model_choices = [
+    "sample_cov",
+    "semicovariance",
+    "exp_cov",
+    "ledoit_wolf",
+    "ledoit_wolf_constant_variance",
+    "ledoit_wolf_single_factor",
+    "ledoit_wolf_constant_correlation",
+    "oracle_approximating",
+]
+
+# Cache shared by the optimizers, for DATA_CACHE_MAX_AGE minutes:
+# (sorted tickers, period) -> (fetch time, prices, {risk model: (expected returns, covariance)})
+_estimates: Dict[Tuple[Tuple[str, ...], str], Tuple[datetime, pd.DataFrame, Dict]] = {}
+_lock = threading.Lock()
+
 l_valid_property_infos = [
     "previousClose",
     "regularMarketOpen",
@@ -118,8 +138,27 @@ def check_valid_property_type(aproperty: str) -> str:
     raise argparse.ArgumentTypeError(f"{aproperty} is not a valid info")
 
 
+def _get_cached_entry(list_of_stocks: List[str], period: str) -> Tuple:
+    """Cache entry of a ticker set and period, downloading its prices if needed"""
+    key = (tuple(sorted(list_of_stocks)), period)
+    with _lock:
+        now = datetime.now()
+        max_age = timedelta(minutes=cfg.DATA_CACHE_MAX_AGE)
+        for stale_key in [k for k, v in _estimates.items() if now - v[0] >= max_age]:
+            del _estimates[stale_key]
+        entry = _estimates.get(key)
+    if entry is None:
+        stock_prices = market_data.get_adjusted_closes(list_of_stocks, period=period)
+        entry = (datetime.now(), stock_prices, dict())
+        if not stock_prices.empty:
+            with _lock:
+                _estimates[key] = entry
+    return entry
+
+
 def process_stocks(list_of_stocks: List[str], period: str = "3mo") -> pd.DataFrame:
-    """Get adjusted closing price for each stock in the list
+    """Get adjusted closing price for each stock in the list, downloaded once per ticker
+    set and period for DATA_CACHE_MAX_AGE minutes
 
     Parameters
     ----------
@@ -134,22 +173,57 @@ def process_stocks(list_of_stocks: List[str], period: str = "3mo") -> pd.DataFra
         DataFrame containing daily (adjusted) close prices for each stock in list
     """
 
-    stock_prices = yf.download(
-        list_of_stocks, period=period, progress=False, group_by="ticker"
-    )
-    stock_closes = pd.DataFrame(index=stock_prices.index)
-    for stock in list_of_stocks:
-        stock_closes[stock] = stock_prices[stock]["Adj Close"]
-    return stock_closes
+    return _get_cached_entry(list_of_stocks, period)[1]
+
+
+def get_returns_and_risk(
+    list_of_stocks: List[str], period: str = "3mo", risk_model: str = "sample_cov"
+) -> Tuple[pd.Series, pd.DataFrame]:
+    """Get the expected returns and covariance of the stocks, estimated once per ticker
+    set, period and risk model for DATA_CACHE_MAX_AGE minutes
+
+    Parameters
+    ----------
+    list_of_stocks: List[str]
+        List of tickers to get historical data for
+    period: str
+        Period to get data from yfinance
+    risk_model: str
+        Covariance estimator, one of risk_model_choices
+
+    Returns
+    -------
+    mu: pd.Series
+        Annualised mean historical returns
+    S: pd.DataFrame
+        Annualised covariance of the returns
+    """
+    _, stock_prices, d_risk_models = _get_cached_entry(list_of_stocks, period)
+    with _lock:
+        estimate = d_risk_models.get(risk_model)
+    if estimate is None:
+        estimate = (
+            expected_returns.mean_historical_return(stock_prices),
+            risk_models.risk_matrix(stock_prices, method=risk_model),
+        )
+        with _lock:
+            d_risk_models[risk_model] = estimate
+    return estimate
 
 
-def prepare_efficient_frontier(stock_prices: pd.DataFrame):
-    """Take in a dataframe of prices and return an efficient frontier object
+def prepare_efficient_frontier(
+    list_of_stocks: List[str], period: str = "3mo", risk_model: str = "sample_cov"
+) -> EfficientFrontier:
+    """Get an efficient frontier object of the stocks, from the cached estimates
 
     Parameters
     ----------
-    stock_prices : DataFrame
-        DataFrame where indices are DateTime and columns are stocks
+    list_of_stocks: List[str]
+        List of tickers to get historical data for
+    period: str
+        Period to get data from yfinance
+    risk_model: str
+        Covariance estimator, one of risk_model_choices
 
     Returns
     -------
@@ -157,12 +231,17 @@ def prepare_efficient_frontier(stock_prices: pd.DataFrame):
         EfficientFrontier object
     """
 
-    mu = expected_returns.mean_historical_return(stock_prices)
-    S = risk_models.sample_cov(stock_prices)
+    mu, S = get_returns_and_risk(list_of_stocks, period, risk_model)
     ef = EfficientFrontier(mu, S)
     return ef
 
 
+def clear_cache():
+    """Forget every price and estimate of the optimizers"""
+    with _lock:
+        _estimates.clear()
+
+
 def display_weights(weights: dict):
     """Print weights in a nice format
 
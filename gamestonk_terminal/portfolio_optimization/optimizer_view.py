@@ -2,22 +2,23 @@
 __docformat__ = "numpy"
 
 import argparse
+import os
 from typing import List
 import matplotlib.pyplot as plt
-import numpy as np
 import yfinance as yf
 from pypfopt import plotting
-from pypfopt import risk_models
-from pypfopt import expected_returns
 from pypfopt import EfficientFrontier
 from gamestonk_terminal.helper_funcs import (
     parse_known_args_and_warn,
     plot_autoscale,
     check_non_negative,
+    check_positive,
 )
+from gamestonk_terminal.portfolio_optimization import frontier_model
 from gamestonk_terminal.portfolio_optimization.optimizer_helper import (
-    process_stocks,
+    get_returns_and_risk,
     prepare_efficient_frontier,
+    risk_model_choices,
     pie_chart_weights,
     display_weights,
     check_valid_property_type,
@@ -234,6 +235,14 @@ def max_sharpe(stocks: List[str], other_args: List[str]):
         help="period to get yfinance data from",
         choices=period_choices,
     )
+    parser.add_argument(
+        "-m",
+        "--risk-model",
+        default="sample_cov",
+        dest="risk_model",
+        help="covariance estimator, e.g. shrunk with ledoit_wolf",
+        choices=risk_model_choices,
+    )
     parser.add_argument(
         "-v",
         "--value",
@@ -272,9 +281,7 @@ def max_sharpe(stocks: List[str], other_args: List[str]):
             print("Please have at least 2 loaded tickers to calculate weights.\n")
             return
 
-        period = ns_parser.period
-        stock_prices = process_stocks(stocks, period)
-        ef = prepare_efficient_frontier(stock_prices)
+        ef = prepare_efficient_frontier(stocks, ns_parser.period, ns_parser.risk_model)
 
         sp = d_period[ns_parser.period]
 
@@ -325,6 +332,14 @@ def min_volatility(stocks: List[str], other_args: List[str]):
         help="period to get yfinance data from",
         choices=period_choices,
     )
+    parser.add_argument(
+        "-m",
+        "--risk-model",
+        default="sample_cov",
+        dest="risk_model",
+        help="covariance estimator, e.g. shrunk with ledoit_wolf",
+        choices=risk_model_choices,
+    )
     parser.add_argument(
         "-v",
         "--value",
@@ -350,9 +365,7 @@ def min_volatility(stocks: List[str], other_args: List[str]):
             print("Please have at least 2 loaded tickers to calculate weights.\n")
             return
 
-        period = ns_parser.period
-        stock_prices = process_stocks(stocks, period)
-        ef = prepare_efficient_frontier(stock_prices)
+        ef = prepare_efficient_frontier(stocks, ns_parser.period, ns_parser.risk_model)
 
         sp = d_period[ns_parser.period]
 
@@ -403,6 +416,14 @@ def max_quadratic_utility(stocks: List[str], other_args: List[str]):
         help="period to get yfinance data from",
         choices=period_choices,
     )
+    parser.add_argument(
+        "-m",
+        "--risk-model",
+        default="sample_cov",
+        dest="risk_model",
+        help="covariance estimator, e.g. shrunk with ledoit_wolf",
+        choices=risk_model_choices,
+    )
     parser.add_argument(
         "-v",
         "--value",
@@ -451,9 +472,7 @@ def max_quadratic_utility(stocks: List[str], other_args: List[str]):
             print("Please have at least 2 loaded tickers to calculate weights.\n")
             return
 
-        period = ns_parser.period
-        stock_prices = process_stocks(stocks, period)
-        ef = prepare_efficient_frontier(stock_prices)
+        ef = prepare_efficient_frontier(stocks, ns_parser.period, ns_parser.risk_model)
 
         sp = d_period[ns_parser.period]
 
@@ -509,6 +528,14 @@ def efficient_risk(stocks: List[str], other_args: List[str]):
         help="period to get yfinance data from",
         choices=period_choices,
     )
+    parser.add_argument(
+        "-m",
+        "--risk-model",
+        default="sample_cov",
+        dest="risk_model",
+        help="covariance estimator, e.g. shrunk with ledoit_wolf",
+        choices=risk_model_choices,
+    )
     parser.add_argument(
         "-v",
         "--value",
@@ -556,9 +583,7 @@ def efficient_risk(stocks: List[str], other_args: List[str]):
             print("Please have at least 2 loaded tickers to calculate weights.\n")
             return
 
-        period = ns_parser.period
-        stock_prices = process_stocks(stocks, period)
-        ef = prepare_efficient_frontier(stock_prices)
+        ef = prepare_efficient_frontier(stocks, ns_parser.period, ns_parser.risk_model)
 
         sp = d_period[ns_parser.period]
 
@@ -614,6 +639,14 @@ def efficient_return(stocks: List[str], other_args: List[str]):
         help="period to get yfinance data from",
         choices=period_choices,
     )
+    parser.add_argument(
+        "-m",
+        "--risk-model",
+        default="sample_cov",
+        dest="risk_model",
+        help="covariance estimator, e.g. shrunk with ledoit_wolf",
+        choices=risk_model_choices,
+    )
     parser.add_argument(
         "-v",
         "--value",
@@ -661,9 +694,7 @@ def efficient_return(stocks: List[str], other_args: List[str]):
             print("Please have at least 2 loaded tickers to calculate weights.\n")
             return
 
-        period = ns_parser.period
-        stock_prices = process_stocks(stocks, period)
-        ef = prepare_efficient_frontier(stock_prices)
+        ef = prepare_efficient_frontier(stocks, ns_parser.period, ns_parser.risk_model)
 
         sp = d_period[ns_parser.period]
 
@@ -721,6 +752,14 @@ def show_ef(stocks: List[str], other_args: List[str]):
         help="period to get yfinance data from",
         choices=period_choices,
     )
+    parser.add_argument(
+        "-m",
+        "--risk-model",
+        default="sample_cov",
+        dest="risk_model",
+        help="covariance estimator, e.g. shrunk with ledoit_wolf",
+        choices=risk_model_choices,
+    )
     parser.add_argument(
         "-n",
         "--number-portfolios",
@@ -729,6 +768,22 @@ def show_ef(stocks: List[str], other_args: List[str]):
         dest="n_port",
         help="number of portfolios to simulate",
     )
+    parser.add_argument(
+        "-c",
+        "--chunk",
+        default=frontier_model.DEFAULT_CHUNK_SIZE,
+        type=check_positive,
+        dest="chunk_size",
+        help="number of portfolios simulated at once",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        type=check_positive,
+        dest="n_jobs",
+        help=f"number of worker processes simulating chunks, up to {os.cpu_count()}",
+    )
 
     try:
         if other_args:
@@ -741,19 +796,29 @@ def show_ef(stocks: List[str], other_args: List[str]):
             print("Please have at least 2 loaded tickers to calculate weights.\n")
             return
 
-        stock_prices = process_stocks(stocks, ns_parser.period)
-        mu = expected_returns.mean_historical_return(stock_prices)
-        S = risk_models.sample_cov(stock_prices)
+        mu, S = get_returns_and_risk(stocks, ns_parser.period, ns_parser.risk_model)
         ef = EfficientFrontier(mu, S)
         _, ax = plt.subplots(figsize=plot_autoscale(), dpi=PLOT_DPI)
 
-        # Generate random portfolios
-        n_samples = ns_parser.n_port
-        w = np.random.dirichlet(np.ones(len(mu)), n_samples)
-        rets = w.dot(mu)
-        stds = np.sqrt(np.diag(w @ S @ w.T))
-        sharpes = rets / stds
-        ax.scatter(stds, rets, marker=".", c=sharpes, cmap="viridis_r")
+        # Generate random portfolios, keeping only the points to plot
+        if ns_parser.n_port:
+            df_frontier, df_best, df_sample = frontier_model.simulate_portfolios(
+                mu, S, ns_parser.n_port, ns_parser.chunk_size, ns_parser.n_jobs
+            )
+            ax.scatter(
+                df_sample["volatility"],
+                df_sample["return"],
+                marker=".",
+                c=df_sample["sharpe"],
+                cmap="viridis_r",
+            )
+            ax.plot(
+                df_frontier["volatility"],
+                df_frontier["return"],
+                color="gray",
+                lw=1,
+                label="Simulated frontier",
+            )
 
         plotting.plot_efficient_frontier(ef, ax=ax, show_assets=True)
         # Find the tangency portfolio
@@ -772,6 +837,10 @@ def show_ef(stocks: List[str], other_args: List[str]):
             plt.ion()
 
         plt.show()
+
+        if ns_parser.n_port:
+            print(f"\nBest of the {ns_parser.n_port} simulated portfolios:")
+            print(df_best.round(4).T.to_string())
         print("")
 
     except Exception as e:
@@ -0,0 +1,349 @@
+"""ARIMA order search and fitted model cache"""
+__docformat__ = "numpy"
+
+import multiprocessing
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import pmdarima
+from statsmodels.tsa.arima.model import ARIMA, ARIMAResults
+from gamestonk_terminal.helper_funcs import get_data_key
+
+# Fitted models and searched orders of the last price series, shared by the arima
+# commands of the pred and ra menus
+ARIMA_CACHE_SIZE = 16
+_fits: OrderedDict = OrderedDict()
+_searches: OrderedDict = OrderedDict()
+_lock = threading.Lock()
+
+# Weekly seasonality of daily prices
+SEASONAL_PERIODS = 5
+
+# Prices of the order search and size of their holdout for the oob criteria, set once
+# per worker process by init_worker
+_values: Optional[np.ndarray] = None
+_out_of_sample_size = 0
+
+# A candidate is an (p,d,q) order and a (P,D,Q,m) seasonal order
+Candidate = Tuple[Tuple[int, int, int], Tuple[int, int, int, int]]
+
+
+def _get_cached(cache: OrderedDict, key: Tuple):
+    with _lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    return None
+
+
+def _set_cached(cache: OrderedDict, key: Tuple, value):
+    with _lock:
+        cache[key] = value
+        if len(cache) > ARIMA_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def get_fit(
+    prices: pd.Series,
+    order: Tuple[int, int, int],
+    seasonal_order: Tuple[int, int, int, int] = (0, 0, 0, 0),
+) -> ARIMAResults:
+    """ARIMA model of an order fitted to a price series, fitted once per series and order
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Prices to fit
+    order : Tuple[int, int, int]
+        (p,d,q) order
+    seasonal_order : Tuple[int, int, int, int]
+        (P,D,Q,m) seasonal order
+
+    Returns
+    -------
+    ARIMAResults
+        Fitted model
+    """
+    key = (get_data_key(prices), tuple(order), tuple(seasonal_order))
+    model_fit = _get_cached(_fits, key)
+    if model_fit is None:
+        model_fit = ARIMA(
+            prices.values, order=order, seasonal_order=seasonal_order
+        ).fit()
+        _set_cached(_fits, key, model_fit)
+    return model_fit
+
+
+def init_worker(values: np.ndarray, out_of_sample_size: int = 0):
+    """Set the prices of the order search run by this process, and the size of their
+    holdout, 0 not to compute the oob criteria"""
+    global _values, _out_of_sample_size  # pylint: disable=global-statement
+    _values = values
+    _out_of_sample_size = out_of_sample_size
+
+
+def fit_candidate(candidate: Candidate) -> Dict:
+    """Fit a candidate order to the prices of the search, and get its information criteria
+
+    Parameters
+    ----------
+    candidate : Candidate
+        (p,d,q) order and (P,D,Q,m) seasonal order
+
+    Returns
+    -------
+    Dict
+        Orders and information criteria, NaN when the model could not be fitted. With a
+        holdout, oob is the mean squared error of the forecast of the holdout by the model
+        fitted to the prices before it, as in auto_arima.
+    """
+    assert _values is not None, "init_worker sets the prices of the process"
+    order, seasonal_order = candidate
+    d_fit: Dict[str, Any] = {"order": order, "seasonal_order": seasonal_order}
+    l_ics = ["aic", "aicc", "bic", "hqic"] + (["oob"] if _out_of_sample_size else [])
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            model_fit = ARIMA(_values, order=order, seasonal_order=seasonal_order).fit()
+            d_fit.update({ic: getattr(model_fit, ic) for ic in l_ics if ic != "oob"})
+            if _out_of_sample_size:
+                holdout = _values[-_out_of_sample_size:]
+                forecast = (
+                    ARIMA(
+                        _values[:-_out_of_sample_size],
+                        order=order,
+                        seasonal_order=seasonal_order,
+                    )
+                    .fit()
+                    .forecast(_out_of_sample_size)
+                )
+                d_fit["oob"] = float(np.mean((holdout - forecast) ** 2))
+    except Exception:  # pylint: disable=broad-except
+        d_fit.update({ic: np.nan for ic in l_ics})
+    return d_fit
+
+
+def get_neighbors(
+    candidate: Candidate, max_p: int, max_q: int, max_seasonal: int
+) -> List[Candidate]:
+    """Candidates one step away from a candidate, as in the stepwise search of auto_arima
+
+    Parameters
+    ----------
+    candidate : Candidate
+        Current best candidate
+    max_p : int
+        Maximum p
+    max_q : int
+        Maximum q
+    max_seasonal : int
+        Maximum P and Q, 0 without seasonality
+
+    Returns
+    -------
+    List[Candidate]
+        Candidates with p, q, p and q together, P or Q changed by one
+    """
+    (p, d, q), (P, D, Q, m) = candidate
+    l_steps = [
+        (dp, dq, 0, 0)
+        for dp, dq in [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1)]
+    ] + [(0, 0, dP, dQ) for dP, dQ in [(-1, 0), (1, 0), (0, -1), (0, 1)]]
+    return [
+        ((p + dp, d, q + dq), (P + dP, D, Q + dQ, m))
+        for dp, dq, dP, dQ in l_steps
+        if 0 <= p + dp <= max_p
+        and 0 <= q + dq <= max_q
+        and 0 <= P + dP <= max_seasonal
+        and 0 <= Q + dQ <= max_seasonal
+    ]
+
+
+def search_order(
+    prices: pd.Series,
+    method: str = "stepwise",
+    ic: str = "aic",
+    seasonal: bool = False,
+    max_p: int = 5,
+    max_q: int = 5,
+    n_jobs: int = 1,
+    out_of_sample_size: int = 5,
+) -> Tuple[Candidate, pd.DataFrame]:
+    """Search the ARIMA order of a price series minimizing an information criteria
+
+    The degree of differencing is selected with KPSS tests, as auto_arima does, and the
+    candidate orders are fitted in parallel worker processes. Searches are cached per
+    price series and search arguments.
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Prices to fit
+    method : str
+        'stepwise' to move from the best candidate to its neighbors while they improve,
+        as auto_arima, or 'grid' to fit every candidate
+    ic : str
+        Information criteria to minimize.  One of [aic, aicc, bic, hqic, oob], oob being
+        the mean squared error of the forecast of the last out_of_sample_size prices
+    seasonal : bool
+        Also search weekly seasonal (P,0,Q) orders, with P and Q up to 1
+    max_p : int
+        Maximum p
+    max_q : int
+        Maximum q
+    n_jobs : int
+        Number of worker processes
+    out_of_sample_size : int
+        Number of last prices held out to compute the oob criteria
+
+    Returns
+    -------
+    Tuple[Candidate, pd.DataFrame]
+        Best (p,d,q) order and (P,D,Q,m) seasonal order, and the information criteria of
+        every fitted candidate sorted from best to worst
+    """
+    if ic == "oob":
+        if not 0 < out_of_sample_size < len(prices) - 1:
+            raise ValueError(
+                "The oob criteria needs a holdout shorter than the price series"
+            )
+    else:
+        out_of_sample_size = 0
+    key = (get_data_key(prices), method, ic, seasonal, max_p, max_q, out_of_sample_size)
+    search = _get_cached(_searches, key)
+    if search is not None:
+        return search
+
+    values = prices.values.astype(float)
+    d = pmdarima.arima.ndiffs(values, test="kpss", max_d=2)
+    m = SEASONAL_PERIODS if seasonal else 0
+    max_seasonal = 1 if seasonal else 0
+
+    if method == "grid":
+        l_candidates = [
+            ((p, d, q), (P, 0, Q, m))
+            for p in range(max_p + 1)
+            for q in range(max_q + 1)
+            for P in range(max_seasonal + 1)
+            for Q in range(max_seasonal + 1)
+        ]
+    else:
+        # Starting candidates of the stepwise search of auto_arima
+        l_candidates = list(
+            OrderedDict.fromkeys(
+                (
+                    (min(p, max_p), d, min(q, max_q)),
+                    (min(P, max_seasonal), 0, min(Q, max_seasonal), m),
+                )
+                for p, q, P, Q in [
+                    (2, 2, 1, 1),
+                    (0, 0, 0, 0),
+                    (1, 0, 1, 0),
+                    (0, 1, 0, 1),
+                ]
+            )
+        )
+
+    pool = None
+    fit_map: Callable[..., Iterable[Dict]] = map
+    if n_jobs > 1:
+        pool = multiprocessing.get_context("spawn").Pool(
+            processes=n_jobs,
+            initializer=init_worker,
+            initargs=(values, out_of_sample_size),
+        )
+        fit_map = pool.map
+    else:
+        init_worker(values, out_of_sample_size)
+
+    try:
+        d_fits = {
+            d_fit["order"] + d_fit["seasonal_order"]: d_fit
+            for d_fit in fit_map(fit_candidate, l_candidates)
+        }
+        if method != "grid":
+            # Stepwise: fit the neighbors of the best candidate, until none improves it
+            while True:
+                best = min(
+                    d_fits.values(),
+                    key=lambda d_fit: np.nan_to_num(d_fit[ic], nan=np.inf),
+                )
+                l_neighbors = [
+                    candidate
+                    for candidate in get_neighbors(
+                        (best["order"], best["seasonal_order"]),
+                        max_p,
+                        max_q,
+                        max_seasonal,
+                    )
+                    if candidate[0] + candidate[1] not in d_fits
+                ]
+                if not l_neighbors:
+                    break
+                l_new = list(fit_map(fit_candidate, l_neighbors))
+                d_fits.update(
+                    {d_fit["order"] + d_fit["seasonal_order"]: d_fit for d_fit in l_new}
+                )
+                if not any(d_fit[ic] < best[ic] for d_fit in l_new):
+                    break
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    df_fits = (
+        pd.DataFrame(list(d_fits.values()))
+        .sort_values(ic, na_position="last", kind="mergesort")
+        .reset_index(drop=True)
+    )
+    if df_fits[ic].isna().all():
+        raise ValueError("No ARIMA order could be fitted")
+
+    best_candidate = (df_fits["order"].iloc[0], df_fits["seasonal_order"].iloc[0])
+    _set_cached(_searches, key, (best_candidate, df_fits))
+    return best_candidate, df_fits
+
+
+def get_auto_fit(
+    prices: pd.Series,
+    method: str = "stepwise",
+    ic: str = "aic",
+    seasonal: bool = False,
+    max_p: int = 5,
+    max_q: int = 5,
+    n_jobs: int = 1,
+    out_of_sample_size: int = 5,
+) -> ARIMAResults:
+    """ARIMA model of the searched order fitted to a price series
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Prices to fit
+    method : str
+        Search method.  One of [stepwise, grid]
+    ic : str
+        Information criteria to minimize
+    seasonal : bool
+        Also search weekly seasonal orders
+    max_p : int
+        Maximum p
+    max_q : int
+        Maximum q
+    n_jobs : int
+        Number of worker processes of the search
+    out_of_sample_size : int
+        Number of last prices held out to compute the oob criteria
+
+    Returns
+    -------
+    ARIMAResults
+        Fitted model, cached with the search
+    """
+    (order, seasonal_order), _ = search_order(
+        prices, method, ic, seasonal, max_p, max_q, n_jobs, out_of_sample_size
+    )
+    return get_fit(prices, order, seasonal_order)
@@ -7,9 +7,8 @@ import datetime
 import matplotlib.pyplot as plt
 import pandas as pd
 from pandas.plotting import register_matplotlib_converters
-import pmdarima
-from statsmodels.tsa.arima.model import ARIMA
 from gamestonk_terminal.helper_funcs import (
+    check_non_negative,
     check_positive,
     parse_known_args_and_warn,
     valid_date,
@@ -22,6 +21,8 @@ from gamestonk_terminal.prediction_techniques.pred_helper import (
     price_prediction_backtesting_color,
     print_prediction_kpis,
 )
+from gamestonk_terminal.prediction_techniques import arima_model
+from gamestonk_terminal.prediction_techniques import walk_forward_view
 
 from gamestonk_terminal.config_plot import PLOT_DPI
 from gamestonk_terminal import feature_flags as gtff
@@ -74,7 +75,7 @@ def arima(other_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
         type=str,
         default="aic",
         choices=["aic", "aicc", "bic", "hqic", "oob"],
-        help="information criteria.",
+        help="information criteria, oob being the error of the forecast of the last prediction days.",
     )
     parser.add_argument(
         "-s",
@@ -92,6 +93,31 @@ def arima(other_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
         type=str,
         help="arima model order (p,d,q) in format: p,d,q.",
     )
+    parser.add_argument(
+        "--search",
+        action="store",
+        dest="s_method",
+        type=str,
+        default="stepwise",
+        choices=["stepwise", "grid"],
+        help="order search, stepwise from the best order or over the whole grid.",
+    )
+    parser.add_argument(
+        "--max-p",
+        action="store",
+        dest="n_max_p",
+        type=check_non_negative,
+        default=5,
+        help="maximum p of the order search.",
+    )
+    parser.add_argument(
+        "--max-q",
+        action="store",
+        dest="n_max_q",
+        type=check_non_negative,
+        default=5,
+        help="maximum q of the order search.",
+    )
     parser.add_argument(
         "-r",
         "--results",
@@ -110,11 +136,38 @@ def arima(other_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
         help="The end date (format YYYY-MM-DD) to select - Backtesting",
     )
 
+    walk_forward_view.add_walk_forward_arguments(parser)
+
     try:
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if not ns_parser:
             return
 
+        # WALK-FORWARD BACKTESTING
+        if ns_parser.n_folds:
+            t_order = (
+                tuple(int(ord) for ord in ns_parser.s_order.split(","))
+                if ns_parser.s_order
+                else None
+            )
+            walk_forward_view.walk_forward(
+                s_ticker,
+                df_stock,
+                "arima",
+                {
+                    "order": t_order,
+                    "method": ns_parser.s_method,
+                    "ic": ns_parser.s_ic,
+                    "seasonal": ns_parser.b_seasonal,
+                    "max_p": ns_parser.n_max_p,
+                    "max_q": ns_parser.n_max_q,
+                },
+                ns_parser,
+                5 + ns_parser.n_days,
+                f"ARIMA {str(t_order)}" if t_order else f"{ns_parser.s_method} ARIMA",
+            )
+            return
+
         # BACKTESTING
         if ns_parser.s_end_date:
 
@@ -150,31 +203,23 @@ def arima(other_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
 
         # Machine Learning model
         if ns_parser.s_order:
-            t_order = tuple(int(ord) for ord in ns_parser.s_order.split(","))
-            model = ARIMA(df_stock["5. adjusted close"].values, order=t_order).fit()
-            l_predictions = model.predict(
-                start=len(df_stock["5. adjusted close"]) + 1,
-                end=len(df_stock["5. adjusted close"]) + ns_parser.n_days,
-            )
+            p, d, q = (int(ord) for ord in ns_parser.s_order.split(","))
+            t_order = (p, d, q)
+            model = arima_model.get_fit(df_stock["5. adjusted close"], t_order)
         else:
-            if ns_parser.b_seasonal:
-                model = pmdarima.auto_arima(
-                    df_stock["5. adjusted close"].values,
-                    error_action="ignore",
-                    seasonal=True,
-                    m=5,
-                    information_criteria=ns_parser.s_ic,
-                )
-            else:
-                model = pmdarima.auto_arima(
-                    df_stock["5. adjusted close"].values,
-                    error_action="ignore",
-                    seasonal=False,
-                    information_criteria=ns_parser.s_ic,
-                )
-            l_predictions = [
-                i if i > 0 else 0 for i in model.predict(n_periods=ns_parser.n_days)
-            ]
+            model = arima_model.get_auto_fit(
+                df_stock["5. adjusted close"],
+                ns_parser.s_method,
+                ns_parser.s_ic,
+                ns_parser.b_seasonal,
+                ns_parser.n_max_p,
+                ns_parser.n_max_q,
+                ns_parser.n_jobs,
+                ns_parser.n_days,
+            )
+        l_predictions = [
+            i if i > 0 else 0 for i in model.forecast(steps=ns_parser.n_days)
+        ]
 
         # Prediction data
         l_pred_days = get_next_stock_market_days(
@@ -204,11 +249,11 @@ def arima(other_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
             # BACKTESTING
             if ns_parser.s_end_date:
                 plt.title(
-                    f"BACKTESTING: ARIMA {model.order} on {s_ticker} - {ns_parser.n_days} days prediction"
+                    f"BACKTESTING: ARIMA {model.model.order} on {s_ticker} - {ns_parser.n_days} days prediction"
                 )
             else:
                 plt.title(
-                    f"ARIMA {model.order} on {s_ticker} - {ns_parser.n_days} days prediction"
+                    f"ARIMA {model.model.order} on {s_ticker} - {ns_parser.n_days} days prediction"
                 )
         plt.xlim(
             df_stock.index[0], get_next_stock_market_days(df_pred.index[-1], 1)[-1]
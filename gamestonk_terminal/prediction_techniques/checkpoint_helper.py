@@ -0,0 +1,186 @@
+""" Neural network checkpoint helper functions """
+__docformat__ = "numpy"
+
+import glob
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from gamestonk_terminal import config_terminal as cfg
+from gamestonk_terminal import config_neural_network_models as cfg_nn_models
+
+
+def get_data_hash(*arrays: np.ndarray) -> str:
+    """
+    Hash of the data a model is trained on
+    Parameters
+    ----------
+    arrays: np.ndarray
+        Training, validation and forecast arrays
+
+    Returns
+    -------
+    str
+        Hex digest of the arrays
+    """
+    data_hash = hashlib.sha1()
+    for array in arrays:
+        data_hash.update(np.ascontiguousarray(array).tobytes())
+    return data_hash.hexdigest()
+
+
+def get_checkpoint_dir(
+    s_ticker: str,
+    data_start: str,
+    model_layers: List[Any],
+    hyperparameters: Dict[str, Any],
+) -> str:
+    """
+    Directory holding the checkpoints of a model, for every end date it was trained up to
+    Parameters
+    ----------
+    s_ticker: str
+        Stock ticker
+    data_start: str
+        First date of the training data
+    model_layers: List[Any]
+        List of layers with parameters as a dictionary in config_neural_network_models.py
+    hyperparameters: Dict[str, Any]
+        Options the model is trained with
+
+    Returns
+    -------
+    str
+        Path of the checkpoint directory
+    """
+    model_config = json.dumps(
+        {
+            "ticker": s_ticker.upper(),
+            "start": data_start,
+            "layers": model_layers,
+            "hyperparameters": hyperparameters,
+            "optimizer": cfg_nn_models.Optimizer,
+            "loss": cfg_nn_models.Loss,
+            "early_stop_patience": cfg_nn_models.Early_Stop_Patience,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return os.path.join(
+        cfg.DATA_CACHE_DIR,
+        "models",
+        f"{s_ticker.upper()}_{hashlib.sha1(model_config.encode()).hexdigest()[:16]}",
+    )
+
+
+def get_checkpoint_path(checkpoint_dir: str, loop: int, data_end: str) -> str:
+    """
+    Path of the checkpoint of a loop model, trained up to an end date
+    Parameters
+    ----------
+    checkpoint_dir: str
+        Checkpoint directory of the model
+    loop: int
+        Index of the model in the loop ensemble
+    data_end: str
+        Last date of the training data
+
+    Returns
+    -------
+    str
+        Path of the h5 model file, its json metadata shares the same stem
+    """
+    s_end = re.sub(r"[^0-9]", "", data_end)
+    return os.path.join(checkpoint_dir, f"loop{loop}_{s_end}.h5")
+
+
+def find_checkpoint(
+    checkpoint_dir: str, loop: int, data_end: str, data_hash: str
+) -> Tuple[Optional[str], bool]:
+    """
+    Find the checkpoint to start a loop model from
+    Parameters
+    ----------
+    checkpoint_dir: str
+        Checkpoint directory of the model
+    loop: int
+        Index of the model in the loop ensemble
+    data_end: str
+        Last date of the training data
+    data_hash: str
+        Hash of the training data
+
+    Returns
+    -------
+    Optional[str]
+        Path of the checkpoint trained on the same data, or else on the latest data before
+        the end date. None when there is no such checkpoint.
+    bool
+        True if the checkpoint was trained on the same data, and can predict without training
+    """
+    exact_path = get_checkpoint_path(checkpoint_dir, loop, data_end)
+    meta = read_checkpoint_meta(exact_path)
+    if meta and meta.get("data_hash") == data_hash:
+        return exact_path, True
+
+    # Checkpoints trained on older bars can be fine-tuned on the whole training data,
+    # which includes the new bars
+    s_end = os.path.basename(exact_path)
+    l_older = sorted(
+        path
+        for path in glob.glob(os.path.join(checkpoint_dir, f"loop{loop}_*.h5"))
+        if os.path.basename(path) < s_end and read_checkpoint_meta(path)
+    )
+    return (l_older[-1], False) if l_older else (None, False)
+
+
+def read_checkpoint_meta(checkpoint_path: str) -> Dict[str, Any]:
+    """
+    Read the metadata of a checkpoint
+    Parameters
+    ----------
+    checkpoint_path: str
+        Path of the h5 model file
+
+    Returns
+    -------
+    Dict[str, Any]
+        Metadata with the end date and data hash, empty if there is no valid checkpoint
+    """
+    meta_path = os.path.splitext(checkpoint_path)[0] + ".json"
+    if not os.path.isfile(checkpoint_path) or not os.path.isfile(meta_path):
+        return {}
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Ignoring unreadable checkpoint {meta_path}: {e}")
+        return {}
+
+
+def save_checkpoint(model, checkpoint_path: str, data_end: str, data_hash: str):
+    """
+    Save a trained model and its metadata
+    Parameters
+    ----------
+    model: Sequential
+        Trained model
+    checkpoint_path: str
+        Path of the h5 model file
+    data_end: str
+        Last date of the training data
+    data_hash: str
+        Hash of the training data
+    """
+    try:
+        os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
+        model.save(checkpoint_path)
+        # The metadata is written last, so an interrupted save is never loaded
+        with open(
+            os.path.splitext(checkpoint_path)[0] + ".json", "w", encoding="utf-8"
+        ) as f:
+            json.dump({"end": data_end, "data_hash": data_hash}, f)
+    except Exception as e:
+        print(f"Unable to save checkpoint {checkpoint_path}: {e}")
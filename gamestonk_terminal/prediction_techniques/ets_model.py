@@ -0,0 +1,153 @@
+"""Exponential smoothing model"""
+__docformat__ = "numpy"
+
+from typing import Union
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+
+def get_exponential_smoothing_model(
+    data: Union[pd.Series, np.ndarray], trend, seasonal, seasonal_periods
+):
+    """
+    Perform exponential smoothing
+    Parameters
+    ----------
+    data: Union[pd.Series, np.ndarray]
+        Series of closing values
+    trend: str
+        Trend component.  One of [N, A, Ad]
+    seasonal: str
+        Seasonal component.  One of [N, A, M]
+    seasonal_periods: int
+        Number of seaosnal periods in a year
+
+
+    Returns
+    -------
+    model:
+        Exponential smoothing model
+    title: str
+        String describing selected model
+    """
+    if trend == "N":  # None
+        if seasonal == "N":  # None
+            title = "Trend='N',  Seasonal='N': Simple Exponential Smoothing"
+            ETS = ExponentialSmoothing(
+                data,
+                trend=None,
+                damped_trend=False,
+                seasonal=None,
+            )
+            model = ETS.fit(
+                smoothing_level=None, smoothing_trend=None, damping_trend=None
+            )
+
+        elif seasonal == "A":  # Additive
+            title = "Trend='N',  Seasonal='A': Exponential Smoothing"
+            ETS = ExponentialSmoothing(
+                data,
+                trend=None,
+                damped_trend=False,
+                seasonal="add",
+                seasonal_periods=seasonal_periods,
+            )
+            model = ETS.fit(smoothing_level=None, smoothing_seasonal=None)
+
+        elif seasonal == "M":  # Multiplicative
+            title = "Trend='N',  Seasonal='M': Exponential Smoothing"
+            ETS = ExponentialSmoothing(
+                data,
+                trend=None,
+                damped_trend=False,
+                seasonal="mul",
+                seasonal_periods=seasonal_periods,
+            )
+            model = ETS.fit(smoothing_level=None, smoothing_seasonal=None)
+
+    elif trend == "A":  # Additive
+        if seasonal == "N":  # None
+            title = "Trend='A',  Seasonal='N': Holt’s linear method"
+            ETS = ExponentialSmoothing(
+                data,
+                trend="add",
+                damped_trend=False,
+                seasonal=None,
+            )
+            model = ETS.fit(
+                smoothing_level=None, smoothing_trend=None, damping_trend=None
+            )
+
+        elif seasonal == "A":  # Additive
+            title = "Trend='A',  Seasonal='A': Additive Holt-Winters’ method"
+            ETS = ExponentialSmoothing(
+                data,
+                trend="add",
+                damped_trend=False,
+                seasonal="add",
+                seasonal_periods=seasonal_periods,
+            )
+            model = ETS.fit(
+                smoothing_level=None, smoothing_trend=None, smoothing_seasonal=None
+            )
+
+        elif seasonal == "M":  # Multiplicative
+            title = "Trend='A',  Seasonal='M': Multiplicative Holt-Winters’ method"
+            ETS = ExponentialSmoothing(
+                data,
+                trend="add",
+                damped_trend=False,
+                seasonal="mul",
+                seasonal_periods=seasonal_periods,
+            )
+            model = ETS.fit(
+                smoothing_level=None, smoothing_trend=None, smoothing_seasonal=None
+            )
+
+    elif trend == "Ad":  # Additive damped
+        if seasonal == "N":  # None
+            title = "Trend='Ad', Seasonal='N': Additive damped trend method"
+            ETS = ExponentialSmoothing(
+                data,
+                trend="add",
+                damped_trend=True,
+                seasonal=None,
+            )
+            model = ETS.fit(
+                smoothing_level=None, smoothing_trend=None, damping_trend=None
+            )
+
+        elif seasonal == "A":  # Additive
+            title = "Trend='Ad', Seasonal='A': Exponential Smoothing"
+            ETS = ExponentialSmoothing(
+                data,
+                trend="add",
+                damped_trend=True,
+                seasonal="add",
+                seasonal_periods=seasonal_periods,
+            )
+            model = ETS.fit(
+                smoothing_level=None,
+                smoothing_trend=None,
+                damping_trend=None,
+                smoothing_seasonal=None,
+            )
+
+        elif seasonal == "M":  # Multiplicative
+            title = "Trend='Ad', Seasonal='M': Holt-Winters’ damped method"
+            ETS = ExponentialSmoothing(
+                data,
+                trend="add",
+                damped_trend=True,
+                seasonal="mul",
+                seasonal_periods=seasonal_periods,
+            )
+            model = ETS.fit(
+                smoothing_level=None,
+                smoothing_trend=None,
+                damping_trend=None,
+                smoothing_seasonal=None,
+            )
+
+    return model, title
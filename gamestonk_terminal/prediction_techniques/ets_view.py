@@ -2,13 +2,12 @@
 __docformat__ = "numpy"
 
 import argparse
-from typing import List, Union
+from typing import List
 import datetime
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from pandas.plotting import register_matplotlib_converters
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
 
 from gamestonk_terminal.helper_funcs import (
     check_positive,
@@ -23,6 +22,10 @@ from gamestonk_terminal.prediction_techniques.pred_helper import (
     price_prediction_backtesting_color,
     print_prediction_kpis,
 )
+from gamestonk_terminal.prediction_techniques import walk_forward_view
+from gamestonk_terminal.prediction_techniques.ets_model import (
+    get_exponential_smoothing_model,
+)
 from gamestonk_terminal.config_plot import PLOT_DPI
 from gamestonk_terminal import feature_flags as gtff
 
@@ -128,11 +131,30 @@ def exponential_smoothing(other_args: List[str], s_ticker: str, df_stock: pd.Dat
         help="The end date (format YYYY-MM-DD) to select - Backtesting",
     )
 
+    walk_forward_view.add_walk_forward_arguments(parser)
+
     try:
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if not ns_parser:
             return
 
+        # WALK-FORWARD BACKTESTING
+        if ns_parser.n_folds:
+            walk_forward_view.walk_forward(
+                s_ticker,
+                df_stock,
+                "ets",
+                {
+                    "trend": ns_parser.trend,
+                    "seasonal": ns_parser.seasonal,
+                    "seasonal_periods": ns_parser.seasonal_periods,
+                },
+                ns_parser,
+                5 + ns_parser.n_days,
+                f"ETS (trend {ns_parser.trend}, seasonal {ns_parser.seasonal})",
+            )
+            return
+
         # BACKTESTING
         if ns_parser.s_end_date:
 
@@ -404,149 +426,3 @@ def exponential_smoothing(other_args: List[str], s_ticker: str, df_stock: pd.Dat
     except Exception as e:
         print(e)
         print("")
-
-
-def get_exponential_smoothing_model(
-    data: Union[pd.Series, np.ndarray], trend, seasonal, seasonal_periods
-):
-    """
-    Perform exponential smoothing
-    Parameters
-    ----------
-    data: Union[pd.Series, np.ndarray]
-        Series of closing values
-    trend: str
-        Trend component.  One of [N, A, Ad]
-    seasonal: str
-        Seasonal component.  One of [N, A, M]
-    seasonal_periods: int
-        Number of seaosnal periods in a year
-
-
-    Returns
-    -------
-    model:
-        Exponential smoothing model
-    title: str
-        String describing selected model
-    """
-    if trend == "N":  # None
-        if seasonal == "N":  # None
-            title = "Trend='N',  Seasonal='N': Simple Exponential Smoothing"
-            ETS = ExponentialSmoothing(
-                data,
-                trend=None,
-                damped_trend=False,
-                seasonal=None,
-            )
-            model = ETS.fit(
-                smoothing_level=None, smoothing_trend=None, damping_trend=None
-            )
-
-        elif seasonal == "A":  # Additive
-            title = "Trend='N',  Seasonal='A': Exponential Smoothing"
-            ETS = ExponentialSmoothing(
-                data,
-                trend=None,
-                damped_trend=False,
-                seasonal="add",
-                seasonal_periods=seasonal_periods,
-            )
-            model = ETS.fit(smoothing_level=None, smoothing_seasonal=None)
-
-        elif seasonal == "M":  # Multiplicative
-            title = "Trend='N',  Seasonal='M': Exponential Smoothing"
-            ETS = ExponentialSmoothing(
-                data,
-                trend=None,
-                damped_trend=False,
-                seasonal="mul",
-                seasonal_periods=seasonal_periods,
-            )
-            model = ETS.fit(smoothing_level=None, smoothing_seasonal=None)
-
-    elif trend == "A":  # Additive
-        if seasonal == "N":  # None
-            title = "Trend='A',  Seasonal='N': Holt’s linear method"
-            ETS = ExponentialSmoothing(
-                data,
-                trend="add",
-                damped_trend=False,
-                seasonal=None,
-            )
-            model = ETS.fit(
-                smoothing_level=None, smoothing_trend=None, damping_trend=None
-            )
-
-        elif seasonal == "A":  # Additive
-            title = "Trend='A',  Seasonal='A': Additive Holt-Winters’ method"
-            ETS = ExponentialSmoothing(
-                data,
-                trend="add",
-                damped_trend=False,
-                seasonal="add",
-                seasonal_periods=seasonal_periods,
-            )
-            model = ETS.fit(
-                smoothing_level=None, smoothing_trend=None, smoothing_seasonal=None
-            )
-
-        elif seasonal == "M":  # Multiplicative
-            title = "Trend='A',  Seasonal='M': Multiplicative Holt-Winters’ method"
-            ETS = ExponentialSmoothing(
-                data,
-                trend="add",
-                damped_trend=False,
-                seasonal="mul",
-                seasonal_periods=seasonal_periods,
-            )
-            model = ETS.fit(
-                smoothing_level=None, smoothing_trend=None, smoothing_seasonal=None
-            )
-
-    elif trend == "Ad":  # Additive damped
-        if seasonal == "N":  # None
-            title = "Trend='Ad', Seasonal='N': Additive damped trend method"
-            ETS = ExponentialSmoothing(
-                data,
-                trend="add",
-                damped_trend=True,
-                seasonal=None,
-            )
-            model = ETS.fit(
-                smoothing_level=None, smoothing_trend=None, damping_trend=None
-            )
-
-        elif seasonal == "A":  # Additive
-            title = "Trend='Ad', Seasonal='A': Exponential Smoothing"
-            ETS = ExponentialSmoothing(
-                data,
-                trend="add",
-                damped_trend=True,
-                seasonal="add",
-                seasonal_periods=seasonal_periods,
-            )
-            model = ETS.fit(
-                smoothing_level=None,
-                smoothing_trend=None,
-                damping_trend=None,
-                smoothing_seasonal=None,
-            )
-
-        elif seasonal == "M":  # Multiplicative
-            title = "Trend='Ad', Seasonal='M': Holt-Winters’ damped method"
-            ETS = ExponentialSmoothing(
-                data,
-                trend="add",
-                damped_trend=True,
-                seasonal="mul",
-                seasonal_periods=seasonal_periods,
-            )
-            model = ETS.fit(
-                smoothing_level=None,
-                smoothing_trend=None,
-                damping_trend=None,
-                smoothing_seasonal=None,
-            )
-
-    return model, title
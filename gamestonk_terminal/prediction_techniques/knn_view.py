@@ -17,6 +17,7 @@ from gamestonk_terminal.prediction_techniques.pred_helper import (
     prepare_scale_train_valid_test,
     plot_data_predictions,
 )
+from gamestonk_terminal.prediction_techniques import walk_forward_view
 
 register_matplotlib_converters()
 
@@ -118,11 +119,30 @@ def k_nearest_neighbors(other_args: List[str], s_ticker: str, df_stock: pd.DataF
         help="Specify if shuffling validation inputs.",
     )
 
+    walk_forward_view.add_walk_forward_arguments(parser)
+
     try:
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if not ns_parser:
             return
 
+        # WALK-FORWARD BACKTESTING
+        if ns_parser.n_folds:
+            walk_forward_view.walk_forward(
+                s_ticker,
+                df_stock,
+                "knn",
+                {
+                    "n_inputs": ns_parser.n_inputs,
+                    "n_jumps": ns_parser.n_jumps,
+                    "n_neighbors": ns_parser.n_neighbors,
+                },
+                ns_parser,
+                ns_parser.n_inputs + ns_parser.n_days,
+                f"KNN Model with {ns_parser.n_neighbors} Neighbors",
+            )
+            return
+
         (
             X_train,
             X_valid,
@@ -157,6 +177,8 @@ def k_nearest_neighbors(other_args: List[str], s_ticker: str, df_stock: pd.DataF
 
         preds = knn.predict(X_valid.reshape(X_valid.shape[0], X_valid.shape[1]))
         forecast_data = knn.predict(forecast_data_input.reshape(1, -1))
+        if scaler:
+            forecast_data = scaler.inverse_transform(forecast_data.reshape(-1, 1)).T
 
         forecast_data_df = pd.DataFrame(
             [i if i > 0 else 0 for i in forecast_data.T], index=future_dates
@@ -1,12 +1,17 @@
 """ Neural Networks View"""
 __docformat__ = "numpy"
 
-from typing import List, Any
+import argparse
+import multiprocessing
+import os
+import time
+from typing import Any, Dict, List, Tuple
 import traceback
 import numpy as np
 import pandas as pd
+import tensorflow as tf
 from tensorflow.keras.callbacks import EarlyStopping
-from tensorflow.keras.models import Sequential
+from tensorflow.keras.models import Sequential, load_model
 from tensorflow.keras.layers import (
     LSTM,
     SimpleRNN,
@@ -35,8 +40,17 @@ from gamestonk_terminal.prediction_techniques.pred_helper import (
     parse_args,
     restore_env,
     print_pretty_prediction,
+    PREPROCESSER,
+)
+from gamestonk_terminal.prediction_techniques.checkpoint_helper import (
+    find_checkpoint,
+    get_checkpoint_dir,
+    get_checkpoint_path,
+    get_data_hash,
+    save_checkpoint,
 )
 from gamestonk_terminal import config_neural_network_models as cfg_nn_models
+from gamestonk_terminal import feature_flags as gtff
 
 optimizers = {
     "Adam": Adam,
@@ -50,13 +64,6 @@ optimizers = {
 }
 
 
-if cfg_nn_models.Early_Stop_Patience:
-    es = EarlyStopping(monitor="val_loss", patience=cfg_nn_models.Early_Stop_Patience)
-else:
-    # Set patience to very long value
-    es = EarlyStopping(monitor="val_loss", patience=1000)
-
-
 def build_neural_network_model(
     Recurrent_Neural_Network: List[Any], n_inputs: int, n_days: int
 ) -> Sequential:
@@ -137,6 +144,250 @@ def build_neural_network_model(
     return model
 
 
+def _init_worker(n_threads: int):
+    """Limit the threads of a training process, so that parallel loops share the CPU cores"""
+    os.environ["OMP_NUM_THREADS"] = str(n_threads)
+    tf.config.threading.set_intra_op_parallelism_threads(n_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+
+def train_loop(loop_args: Tuple) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Build, train and predict with one neural network model of a loop ensemble
+    Parameters
+    ----------
+    loop_args: Tuple
+        Layers config, training and validation data, forecast input and dates, scaler,
+        hyperparameters, whether to print training progress, and the checkpoint to start from
+        and to save to
+
+    Returns
+    -------
+    preds: np.ndarray
+        Predictions on the validation data.  Shape (# validation sequences, n_days)
+    forecast_data: np.ndarray
+        Unscaled forecast of the next days.  Shape (n_days,)
+    elapsed: float
+        Training and prediction time, in seconds
+    """
+    (
+        model_layers,
+        X_train,
+        y_train,
+        X_valid,
+        y_valid,
+        forecast_data_input,
+        future_dates,
+        scaler,
+        hyperparameters,
+        verbose,
+        checkpoint,
+    ) = loop_args
+    start = time.time()
+
+    if checkpoint["load_path"]:
+        model = load_model(checkpoint["load_path"])
+        # Checkpoints of older bars are fine-tuned for fewer epochs, on the whole training data
+        n_epochs = 0 if checkpoint["is_trained"] else cfg_nn_models.Fine_Tune_Epochs
+    else:
+        # Build Neural Network model
+        model = build_neural_network_model(
+            model_layers,
+            hyperparameters["n_inputs"],
+            hyperparameters["n_days"],
+        )
+        n_epochs = hyperparameters["n_epochs"]
+
+    if n_epochs:
+        model.compile(
+            optimizer=optimizers[cfg_nn_models.Optimizer](
+                learning_rate=hyperparameters["lr"]
+            ),
+            loss=cfg_nn_models.Loss,
+        )
+
+        # Add early stopping to save time training when validation is plateaued.
+        # Set patience to very long value if it is not configured
+        es = EarlyStopping(
+            monitor="val_loss", patience=cfg_nn_models.Early_Stop_Patience or 1000
+        )
+        model.fit(
+            X_train.reshape(X_train.shape[0], X_train.shape[1], 1),
+            y_train,
+            epochs=n_epochs,
+            verbose=verbose,
+            batch_size=hyperparameters["n_batch_size"],
+            validation_data=(
+                X_valid.reshape(X_valid.shape[0], X_valid.shape[1], 1),
+                y_valid,
+            ),
+            callbacks=[es],
+        )
+
+        if checkpoint["save_path"]:
+            save_checkpoint(
+                model,
+                checkpoint["save_path"],
+                checkpoint["data_end"],
+                checkpoint["data_hash"],
+            )
+
+    preds = model.predict(
+        X_valid.reshape(X_valid.shape[0], X_valid.shape[1], 1)
+    ).reshape(X_valid.shape[0], hyperparameters["n_days"])
+    forecast_data = np.asarray(
+        forecast(forecast_data_input, future_dates, model, scaler).values.flat
+    )
+
+    return preds, forecast_data, time.time() - start
+
+
+def train_loops(
+    model_layers: List[Any],
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_valid: np.ndarray,
+    y_valid: np.ndarray,
+    forecast_data_input: np.ndarray,
+    future_dates: List,
+    scaler,
+    ns_parser: argparse.Namespace,
+    s_ticker: str,
+    data_range: Tuple[str, str],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Train the loop ensemble of a neural network, one model after the other, or concurrently across
+    CPU cores when more than one job is requested.
+
+    Trained models are saved as checkpoints. A model already trained on the same data is loaded
+    and predicts without training, and a model trained on older bars is fine-tuned on the whole
+    training data, new bars included.
+    Parameters
+    ----------
+    model_layers: List[Any]
+        List of layers with parameters as a dictionary in config_neural_network_models.py
+    X_train: np.ndarray
+        Array of training data
+    y_train: np.ndarray
+        Array of training outputs
+    X_valid: np.ndarray
+        Array of validation data
+    y_valid: np.ndarray
+        Array of validation outputs
+    forecast_data_input: np.ndarray
+        Input of the forecast
+    future_dates: List
+        List of future dates
+    scaler:
+        Fitted preprocesser
+    ns_parser: argparse.Namespace
+        Parsed arguments
+    s_ticker: str
+        Stock ticker
+    data_range: Tuple[str, str]
+        First and last dates of the data
+
+    Returns
+    -------
+    preds: np.ndarray
+        Predictions of each loop on the validation data.  Shape (n_loops, # validation sequences, n_days)
+    forecast_data: np.ndarray
+        Forecast of each loop.  Shape (n_loops, n_days)
+    """
+    hyperparameters = {
+        "n_inputs": ns_parser.n_inputs,
+        "n_days": ns_parser.n_days,
+        "n_epochs": ns_parser.n_epochs,
+        "n_batch_size": ns_parser.n_batch_size,
+        "lr": ns_parser.lr,
+    }
+    n_jobs = min(ns_parser.n_jobs, ns_parser.n_loops)
+
+    l_checkpoints: List[Dict[str, Any]] = [
+        {"load_path": None, "is_trained": False, "save_path": None}
+    ] * ns_parser.n_loops
+    if gtff.ENABLE_NN_CHECKPOINTS:
+        data_start, data_end = data_range
+        checkpoint_dir = get_checkpoint_dir(
+            s_ticker,
+            data_start,
+            model_layers,
+            dict(
+                hyperparameters,
+                preprocesser=getattr(ns_parser, "s_preprocessing", PREPROCESSER),
+                valid_split=ns_parser.valid_split,
+                shuffle=ns_parser.no_shuffle,
+            ),
+        )
+        data_hash = get_data_hash(
+            X_train, y_train, X_valid, y_valid, forecast_data_input
+        )
+        l_checkpoints = list()
+        for i in range(ns_parser.n_loops):
+            load_path, is_trained = (
+                (None, False)
+                if ns_parser.b_retrain
+                else find_checkpoint(checkpoint_dir, i, data_end, data_hash)
+            )
+            l_checkpoints.append(
+                {
+                    "load_path": load_path,
+                    "is_trained": is_trained,
+                    "save_path": get_checkpoint_path(checkpoint_dir, i, data_end),
+                    "data_end": data_end,
+                    "data_hash": data_hash,
+                }
+            )
+        n_trained = sum(checkpoint["is_trained"] for checkpoint in l_checkpoints)
+        n_fine_tuned = sum(
+            bool(checkpoint["load_path"]) for checkpoint in l_checkpoints
+        )
+        n_fine_tuned -= n_trained
+        if n_trained or n_fine_tuned:
+            print(
+                f"Loaded {n_trained} trained and {n_fine_tuned} fine-tuned loops from checkpoints"
+            )
+
+    l_loop_args = [
+        (
+            model_layers,
+            X_train,
+            y_train,
+            X_valid,
+            y_valid,
+            forecast_data_input,
+            future_dates,
+            scaler,
+            hyperparameters,
+            n_jobs == 1,
+            checkpoint,
+        )
+        for checkpoint in l_checkpoints
+    ]
+
+    start = time.time()
+    if n_jobs > 1:
+        print(f"Training {ns_parser.n_loops} loops on {n_jobs} parallel jobs ...")
+        # Spawned processes don't inherit the TensorFlow state of the terminal
+        with multiprocessing.get_context("spawn").Pool(
+            processes=n_jobs,
+            initializer=_init_worker,
+            initargs=(max(1, (os.cpu_count() or 1) // n_jobs),),
+        ) as pool:
+            l_results = pool.map(train_loop, l_loop_args, chunksize=1)
+    else:
+        l_results = list(map(train_loop, l_loop_args))
+
+    for i, (_, _, elapsed) in enumerate(l_results):
+        print(f"Loop {i + 1}/{ns_parser.n_loops} trained in {elapsed:.1f} s")
+    if ns_parser.n_loops > 1:
+        print(f"All loops trained in {time.time() - start:.1f} s")
+
+    preds = np.stack([loop_preds for loop_preds, _, _ in l_results])
+    forecast_data = np.stack([loop_forecast for _, loop_forecast, _ in l_results])
+    return preds, forecast_data
+
+
 def mlp(other_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
     """
     Train a multi-layer perceptron model
@@ -182,41 +433,19 @@ def mlp(other_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
             dates_forecast_input[-1], n_next_days=ns_parser.n_days
         )
 
-        preds = np.zeros((ns_parser.n_loops, X_valid.shape[0], ns_parser.n_days))
-        forecast_data = np.zeros((ns_parser.n_loops, ns_parser.n_days))
-        for i in range(ns_parser.n_loops):
-            # Build Neural Network model
-            model = build_neural_network_model(
-                cfg_nn_models.Long_Short_Term_Memory,
-                ns_parser.n_inputs,
-                ns_parser.n_days,
-            )
-            model.compile(
-                optimizer=optimizers[cfg_nn_models.Optimizer](
-                    learning_rate=ns_parser.lr
-                ),
-                loss=cfg_nn_models.Loss,
-            )
-
-            model.fit(
-                X_train.reshape(X_train.shape[0], X_train.shape[1], 1),
-                y_train,
-                epochs=ns_parser.n_epochs,
-                verbose=True,
-                batch_size=ns_parser.n_batch_size,
-                validation_data=(
-                    X_valid.reshape(X_valid.shape[0], X_valid.shape[1], 1),
-                    y_valid,
-                ),
-                callbacks=[es],
-            )
-
-            preds[i] = model.predict(
-                X_valid.reshape(X_valid.shape[0], X_valid.shape[1], 1)
-            ).reshape(X_valid.shape[0], ns_parser.n_days)
-            forecast_data[i] = forecast(
-                forecast_data_input, future_dates, model, scaler
-            ).values.flat
+        preds, forecast_data = train_loops(
+            cfg_nn_models.Long_Short_Term_Memory,
+            X_train,
+            y_train,
+            X_valid,
+            y_valid,
+            forecast_data_input,
+            future_dates,
+            scaler,
+            ns_parser,
+            s_ticker,
+            (str(df_stock.index[0]), str(dates_forecast_input[-1])),
+        )
 
         forecast_data_df = pd.DataFrame(forecast_data.T, index=future_dates)
         if ns_parser.n_loops > 1:
@@ -294,40 +523,19 @@ def rnn(other_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
             dates_forecast_input[-1], n_next_days=ns_parser.n_days
         )
 
-        preds = np.zeros((ns_parser.n_loops, X_valid.shape[0], ns_parser.n_days))
-        forecast_data = np.zeros((ns_parser.n_loops, ns_parser.n_days))
-        for i in range(ns_parser.n_loops):
-            # Build Neural Network model
-            model = build_neural_network_model(
-                cfg_nn_models.Long_Short_Term_Memory,
-                ns_parser.n_inputs,
-                ns_parser.n_days,
-            )
-            model.compile(
-                optimizer=optimizers[cfg_nn_models.Optimizer](
-                    learning_rate=ns_parser.lr
-                ),
-                loss=cfg_nn_models.Loss,
-            )
-            model.fit(
-                X_train.reshape(X_train.shape[0], X_train.shape[1], 1),
-                y_train,
-                epochs=ns_parser.n_epochs,
-                verbose=True,
-                batch_size=ns_parser.n_batch_size,
-                validation_data=(
-                    X_valid.reshape(X_valid.shape[0], X_valid.shape[1], 1),
-                    y_valid,
-                ),
-                callbacks=[es],
-            )
-
-            preds[i] = model.predict(
-                X_valid.reshape(X_valid.shape[0], X_valid.shape[1], 1)
-            ).reshape(X_valid.shape[0], ns_parser.n_days)
-            forecast_data[i] = forecast(
-                forecast_data_input, future_dates, model, scaler
-            ).values.flat
+        preds, forecast_data = train_loops(
+            cfg_nn_models.Long_Short_Term_Memory,
+            X_train,
+            y_train,
+            X_valid,
+            y_valid,
+            forecast_data_input,
+            future_dates,
+            scaler,
+            ns_parser,
+            s_ticker,
+            (str(df_stock.index[0]), str(dates_forecast_input[-1])),
+        )
 
         forecast_data_df = pd.DataFrame(forecast_data.T, index=future_dates)
         if ns_parser.n_loops > 1:
@@ -403,42 +611,19 @@ def lstm(other_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
             dates_forecast_input[-1], n_next_days=ns_parser.n_days
         )
 
-        preds = np.zeros((ns_parser.n_loops, X_valid.shape[0], ns_parser.n_days))
-        forecast_data = np.zeros((ns_parser.n_loops, ns_parser.n_days))
-        for i in range(ns_parser.n_loops):
-            # Build Neural Network model
-            model = build_neural_network_model(
-                cfg_nn_models.Long_Short_Term_Memory,
-                ns_parser.n_inputs,
-                ns_parser.n_days,
-            )
-            model.compile(
-                optimizer=optimizers[cfg_nn_models.Optimizer](
-                    learning_rate=ns_parser.lr
-                ),
-                loss=cfg_nn_models.Loss,
-            )
-
-            model.fit(
-                X_train.reshape(X_train.shape[0], X_train.shape[1], 1),
-                y_train,
-                epochs=ns_parser.n_epochs,
-                verbose=True,
-                batch_size=ns_parser.n_batch_size,
-                validation_data=(
-                    X_valid.reshape(X_valid.shape[0], X_valid.shape[1], 1),
-                    y_valid,
-                ),
-                callbacks=[es],
-            )
-
-            preds[i] = model.predict(
-                X_valid.reshape(X_valid.shape[0], X_valid.shape[1], 1)
-            ).reshape(X_valid.shape[0], ns_parser.n_days)
-
-            forecast_data[i] = forecast(
-                forecast_data_input, future_dates, model, scaler
-            ).values.flat
+        preds, forecast_data = train_loops(
+            cfg_nn_models.Long_Short_Term_Memory,
+            X_train,
+            y_train,
+            X_valid,
+            y_valid,
+            forecast_data_input,
+            future_dates,
+            scaler,
+            ns_parser,
+            s_ticker,
+            (str(df_stock.index[0]), str(dates_forecast_input[-1])),
+        )
 
         forecast_data_df = pd.DataFrame(forecast_data.T, index=future_dates)
         if ns_parser.n_loops > 1:
@@ -515,42 +700,19 @@ def conv1d(other_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
             dates_forecast_input[-1], n_next_days=ns_parser.n_days
         )
 
-        preds = np.zeros((ns_parser.n_loops, X_valid.shape[0], ns_parser.n_days))
-        forecast_data = np.zeros((ns_parser.n_loops, ns_parser.n_days))
-        for i in range(ns_parser.n_loops):
-            # Build Neural Network model
-            model = build_neural_network_model(
-                cfg_nn_models.Convolutional,
-                ns_parser.n_inputs,
-                ns_parser.n_days,
-            )
-
-            model.compile(
-                optimizer=optimizers[cfg_nn_models.Optimizer](
-                    learning_rate=ns_parser.lr
-                ),
-                loss=cfg_nn_models.Loss,
-            )
-
-            model.fit(
-                X_train.reshape(X_train.shape[0], X_train.shape[1], 1),
-                y_train,
-                epochs=ns_parser.n_epochs,
-                verbose=True,
-                batch_size=ns_parser.n_batch_size,
-                validation_data=(
-                    X_valid.reshape(X_valid.shape[0], X_valid.shape[1], 1),
-                    y_valid,
-                ),
-                callbacks=[es],
-            )
-
-            preds[i] = model.predict(
-                X_valid.reshape(X_valid.shape[0], X_valid.shape[1], 1)
-            ).reshape(X_valid.shape[0], ns_parser.n_days)
-            forecast_data[i] = forecast(
-                forecast_data_input, future_dates, model, scaler
-            ).values.flat
+        preds, forecast_data = train_loops(
+            cfg_nn_models.Convolutional,
+            X_train,
+            y_train,
+            X_valid,
+            y_valid,
+            forecast_data_input,
+            future_dates,
+            scaler,
+            ns_parser,
+            s_ticker,
+            (str(df_stock.index[0]), str(dates_forecast_input[-1])),
+        )
 
         forecast_data_df = pd.DataFrame(forecast_data.T, index=future_dates)
         if ns_parser.n_loops > 1:
@@ -3,6 +3,7 @@ __docformat__ = "numpy"
 
 import argparse
 from typing import List
+from collections import OrderedDict
 import os
 from warnings import simplefilter
 from datetime import timedelta
@@ -21,6 +22,7 @@ from sklearn.preprocessing import StandardScaler, MinMaxScaler, Normalizer
 from tensorflow.keras.models import Sequential
 from gamestonk_terminal.helper_funcs import (
     check_positive,
+    get_data_key,
     parse_known_args_and_warn,
     valid_date,
     plot_autoscale,
@@ -42,6 +44,11 @@ ORIGINAL_TF_FORCE_GPU_ALLOW_GROWTH = os.environ.get("TF_FORCE_GPU_ALLOW_GROWTH")
 
 PREPROCESSER = cfg.Preprocess
 
+# Scaled windows and fitted preprocessers of the last prepared series, shared by the
+# knn, mlp, rnn, lstm and conv1d commands
+PREPARED_DATA_CACHE_SIZE = 8
+_prepared_data: OrderedDict = OrderedDict()
+
 
 def check_valid_frac(num) -> float:
     if (num < 0) or (num > 1):
@@ -161,6 +168,22 @@ def parse_args(prog: str, description: str, other_args: List[str]):
         default=1,
         help="number of loops to iterate and train models",
     )
+    parser.add_argument(
+        "--retrain",
+        action="store_true",
+        dest="b_retrain",
+        default=False,
+        help="train from scratch instead of starting from saved checkpoints",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        action="store",
+        dest="n_jobs",
+        type=check_positive,
+        default=1,
+        help="number of loops to train in parallel processes, sharing the CPU cores",
+    )
     parser.add_argument(
         "-v",
         "--valid",
@@ -216,6 +239,62 @@ def parse_args(prog: str, description: str, other_args: List[str]):
         return None
 
 
+def get_preprocesser(preprocesser: str):
+    """
+    Create an unfitted preprocesser
+    Parameters
+    ----------
+    preprocesser: str
+        One of standardization, minmax, normalization or none
+    Returns
+    -------
+    scaler:
+        Preprocesser, None if data isn't pre-processed
+    """
+    if preprocesser == "standardization":
+        return StandardScaler()
+    if preprocesser == "minmax":
+        return MinMaxScaler()
+    if preprocesser == "normalization":
+        return Normalizer()
+    return None
+
+
+def clear_prepared_data():
+    """Forget the prepared data and fitted preprocessers of previous commands"""
+    _prepared_data.clear()
+
+
+def build_sliding_windows(values: np.ndarray, n_input_days: int, n_predict_days: int):
+    """
+    Build the input and target windows of a series as strided views, without copying any row.
+    Parameters
+    ----------
+    values: np.ndarray
+        Series values, of shape (# points, ...)
+    n_input_days: int
+        Length of each input window
+    n_predict_days: int
+        Length of each target window, following its input window
+    Returns
+    -------
+    input_windows: np.ndarray
+        Read-only view of the input windows.  Shape (# windows, n_input_days, ...)
+    target_windows: np.ndarray
+        Read-only view of the target windows.  Shape (# windows, n_predict_days, ...)
+    """
+    values = np.ascontiguousarray(values)
+    n_windows = max(len(values) - n_input_days - n_predict_days, 0)
+    # np.lib.stride_tricks.sliding_window_view needs numpy 1.20
+    windows = np.lib.stride_tricks.as_strided(
+        values,
+        shape=(n_windows, n_input_days + n_predict_days) + values.shape[1:],
+        strides=(values.strides[0],) + values.strides,
+        writeable=False,
+    )
+    return windows[:, :n_input_days], windows[:, n_input_days:]
+
+
 def prepare_scale_train_valid_test(
     df_stock: pd.DataFrame, ns_parser: argparse.Namespace
 ):
@@ -256,19 +335,9 @@ def prepare_scale_train_valid_test(
     n_input_days = ns_parser.n_inputs
     n_predict_days = ns_parser.n_days
     test_size = ns_parser.valid_split
+    # knn selects its own preprocessing, the neural networks use the configured one
+    preprocesser = getattr(ns_parser, "s_preprocessing", PREPROCESSER)
 
-    # Pre-process data
-    if PREPROCESSER == "standardization":
-        scaler = StandardScaler()
-
-    elif PREPROCESSER == "minmax":
-        scaler = MinMaxScaler()
-
-    elif PREPROCESSER == "normalization":
-        scaler = Normalizer()
-
-    elif (PREPROCESSER == "none") or (PREPROCESSER is None):
-        scaler = None
     # Test data is used for forecasting.  Takes the last n_input_days data points.
     # These points are not fed into training
 
@@ -291,71 +360,73 @@ def prepare_scale_train_valid_test(
                 True,
             )
 
-    test_data = df_stock.iloc[-n_input_days:]
-    train_data = df_stock.iloc[:-n_input_days]
+    data_key = get_data_key(df_stock)
+    cache_key = (
+        data_key,
+        str(ns_parser.s_end_date),
+        preprocesser,
+        n_input_days,
+        n_predict_days,
+        test_size,
+        ns_parser.no_shuffle,
+    )
+    if cache_key in _prepared_data:
+        _prepared_data.move_to_end(cache_key)
+        return _prepared_data[cache_key]
 
     dates = df_stock.index
-    dates_test = test_data.index
-    if scaler:
-        train_data = scaler.fit_transform(df_stock.values.reshape(-1, 1))
-        test_data = scaler.transform(test_data.values.reshape(-1, 1))
-    else:
-        train_data = df_stock.values.reshape(-1, 1)
-        test_data = test_data.values.reshape(-1, 1)
+    dates_test = dates[-n_input_days:]
+    values = df_stock.values.reshape(-1, 1)
 
-    prices = train_data
-
-    input_dates = []
-    input_prices = []
-    next_n_day_prices = []
-    next_n_day_dates = []
-
-    for idx in range(len(prices) - n_input_days - n_predict_days):
-        input_prices.append(prices[idx : idx + n_input_days])
-        input_dates.append(dates[idx : idx + n_input_days])
-        next_n_day_prices.append(
-            prices[idx + n_input_days : idx + n_input_days + n_predict_days]
-        )
-        next_n_day_dates.append(
-            dates[idx + n_input_days : idx + n_input_days + n_predict_days]
-        )
-
-    input_dates = np.asarray(input_dates)
-    input_prices = np.array(input_prices)
-    next_n_day_prices = np.array(next_n_day_prices)
-    next_n_day_dates = np.asarray(next_n_day_dates)
-
-    (
-        X_train,
-        X_valid,
-        y_train,
-        y_valid,
-        X_dates_train,
-        X_dates_valid,
-        y_dates_train,
-        y_dates_valid,
-    ) = train_test_split(
-        input_prices,
-        next_n_day_prices,
-        input_dates,
-        next_n_day_dates,
+    input_dates, next_n_day_dates = build_sliding_windows(
+        np.asarray(dates), n_input_days, n_predict_days
+    )
+    train_idx, valid_idx = train_test_split(
+        np.arange(len(input_dates)),
         test_size=test_size,
         shuffle=ns_parser.no_shuffle,
+        # The same series is always split the same way, so that trained models can be
+        # found again from the hash of their data
+        random_state=data_key[-1] % 2 ** 32,
     )
-    return (
-        X_train,
-        X_valid,
-        y_train,
-        y_valid,
-        X_dates_train,
-        X_dates_valid,
-        y_dates_train,
-        y_dates_valid,
+
+    # Only the prices seen by the training windows are used to fit the preprocesser,
+    # so that validation prices don't leak into the scaling
+    scaler = get_preprocesser(preprocesser)
+    if scaler:
+        n_points = np.zeros(len(values) + 1, dtype=int)
+        np.add.at(n_points, train_idx, 1)
+        np.add.at(n_points, train_idx + n_input_days + n_predict_days, -1)
+        scaler.fit(values[np.cumsum(n_points[:-1]) > 0])
+        values = scaler.transform(values)
+
+    test_data = values[-n_input_days:]
+    input_prices, next_n_day_prices = build_sliding_windows(
+        values, n_input_days, n_predict_days
+    )
+
+    prepared_data = (
+        input_prices[train_idx],
+        input_prices[valid_idx],
+        next_n_day_prices[train_idx],
+        next_n_day_prices[valid_idx],
+        input_dates[train_idx],
+        input_dates[valid_idx],
+        next_n_day_dates[train_idx],
+        next_n_day_dates[valid_idx],
         test_data,
         dates_test,
         scaler,
         False,
     )
+    for data in prepared_data[:9]:
+        data.setflags(write=False)
+
+    _prepared_data[cache_key] = prepared_data
+    if len(_prepared_data) > PREPARED_DATA_CACHE_SIZE:
+        _prepared_data.popitem(last=False)
+
+    return prepared_data
 
 
 def forecast(
@@ -26,6 +26,7 @@ from gamestonk_terminal.prediction_techniques.pred_helper import (
     price_prediction_backtesting_color,
     print_prediction_kpis,
 )
+from gamestonk_terminal.prediction_techniques import walk_forward_view
 
 from gamestonk_terminal.config_plot import PLOT_DPI
 from gamestonk_terminal import feature_flags as gtff
@@ -114,11 +115,32 @@ def regression(
             help="polynomial associated with regression.",
         )
 
+    walk_forward_view.add_walk_forward_arguments(parser)
+
     try:
         ns_parser = parse_known_args_and_warn(parser, other_args)
         if not ns_parser:
             return
 
+        # WALK-FORWARD BACKTESTING
+        if ns_parser.n_folds:
+            if polynomial == USER_INPUT:
+                polynomial = ns_parser.n_polynomial
+            walk_forward_view.walk_forward(
+                s_ticker,
+                df_stock,
+                "regression",
+                {
+                    "n_inputs": ns_parser.n_inputs,
+                    "n_jumps": ns_parser.n_jumps,
+                    "polynomial": polynomial,
+                },
+                ns_parser,
+                ns_parser.n_inputs + ns_parser.n_days,
+                f"Regression (polynomial {polynomial})",
+            )
+            return
+
         # BACKTESTING
         if ns_parser.s_end_date:
             if ns_parser.s_end_date < df_stock.index[0]:
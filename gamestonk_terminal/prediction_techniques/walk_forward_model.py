@@ -0,0 +1,343 @@
+"""Walk-forward backtests of the prediction models"""
+__docformat__ = "numpy"
+
+import multiprocessing
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from sklearn import linear_model
+from sklearn import neighbors
+from sklearn import pipeline
+from sklearn import preprocessing
+from tsxv import splitTrain
+from gamestonk_terminal.prediction_techniques import arima_model, ets_model
+
+# Prices of the walk-forward, set once per worker process by init_worker
+_values: Optional[np.ndarray] = None
+
+
+def regression_forecast(
+    values: np.ndarray, n_days: int, n_inputs: int, n_jumps: int, polynomial: int
+) -> np.ndarray:
+    """Forecast of a polynomial regression on the last n_inputs prices, as regression_view
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Training prices
+    n_days : int
+        Prediction days
+    n_inputs : int
+        Number of days to use for prediction
+    n_jumps : int
+        Number of jumps in training data
+    polynomial : int
+        Polynomial degree
+
+    Returns
+    -------
+    np.ndarray
+        Predictions of the next n_days prices
+    """
+    stock_x, stock_y = splitTrain.split_train(values, n_inputs, n_days, n_jumps)
+    if polynomial == 1:
+        model = linear_model.LinearRegression()
+    else:
+        model = pipeline.make_pipeline(
+            preprocessing.PolynomialFeatures(polynomial), linear_model.Ridge()
+        )
+    model.fit(stock_x, stock_y)
+    return model.predict(values[-n_inputs:].reshape(1, -1))[0]
+
+
+def knn_forecast(
+    values: np.ndarray, n_days: int, n_inputs: int, n_jumps: int, n_neighbors: int
+) -> np.ndarray:
+    """Forecast of k-nearest neighbors on the last n_inputs prices
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Training prices
+    n_days : int
+        Prediction days
+    n_inputs : int
+        Number of days to use as input for prediction
+    n_jumps : int
+        Number of jumps in training data
+    n_neighbors : int
+        Number of neighbors
+
+    Returns
+    -------
+    np.ndarray
+        Predictions of the next n_days prices
+    """
+    stock_x, stock_y = splitTrain.split_train(values, n_inputs, n_days, n_jumps)
+    model = neighbors.KNeighborsRegressor(n_neighbors=min(n_neighbors, len(stock_x)))
+    model.fit(stock_x, stock_y)
+    return model.predict(values[-n_inputs:].reshape(1, -1))[0]
+
+
+def arima_forecast(
+    values: np.ndarray,
+    n_days: int,
+    order: Optional[Tuple[int, int, int]],
+    method: str,
+    ic: str,
+    seasonal: bool,
+    max_p: int,
+    max_q: int,
+) -> np.ndarray:
+    """Forecast of an ARIMA model of a given order, or else of the searched order
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Training prices
+    n_days : int
+        Prediction days
+    order : Optional[Tuple[int, int, int]]
+        ARIMA (p,d,q) order, None to search it
+    method : str
+        Order search method.  One of [stepwise, grid]
+    ic : str
+        Information criteria of the order search, oob holding out the last n_days prices
+    seasonal : bool
+        Also search weekly seasonal orders
+    max_p : int
+        Maximum p of the order search
+    max_q : int
+        Maximum q of the order search
+
+    Returns
+    -------
+    np.ndarray
+        Predictions of the next n_days prices
+    """
+    prices = pd.Series(values)
+    if order:
+        return arima_model.get_fit(prices, order).forecast(n_days)
+    # Folds already run in parallel, so each searches its order in its own process
+    model_fit = arima_model.get_auto_fit(
+        prices, method, ic, seasonal, max_p, max_q, n_jobs=1, out_of_sample_size=n_days
+    )
+    return model_fit.forecast(n_days)
+
+
+def ets_forecast(
+    values: np.ndarray, n_days: int, trend: str, seasonal: str, seasonal_periods: int
+) -> np.ndarray:
+    """Forecast of an exponential smoothing model, NaN when its fit does not converge
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Training prices
+    n_days : int
+        Prediction days
+    trend : str
+        Trend component.  One of [N, A, Ad]
+    seasonal : str
+        Seasonal component.  One of [N, A, M]
+    seasonal_periods : int
+        Number of seasonal periods
+
+    Returns
+    -------
+    np.ndarray
+        Predictions of the next n_days prices
+    """
+    model, _ = ets_model.get_exponential_smoothing_model(
+        values, trend, seasonal, seasonal_periods
+    )
+    if not model.mle_retvals.success:
+        return np.full(n_days, np.nan)
+    return model.forecast(n_days)
+
+
+FORECASTERS: Dict[str, Callable[..., np.ndarray]] = {
+    "regression": regression_forecast,
+    "knn": knn_forecast,
+    "arima": arima_forecast,
+    "ets": ets_forecast,
+}
+
+
+def get_cutoffs(
+    n_obs: int, n_days: int, n_folds: int, step: int, min_train: int
+) -> List[int]:
+    """Cut-off positions of the folds, the last one leaving n_days prices to predict
+
+    Parameters
+    ----------
+    n_obs : int
+        Number of prices
+    n_days : int
+        Prediction days of each fold
+    n_folds : int
+        Maximum number of folds
+    step : int
+        Number of prices between consecutive cut-offs
+    min_train : int
+        Minimum number of prices before the first cut-off
+
+    Returns
+    -------
+    List[int]
+        Ascending cut-offs, each fold trains on the prices before its cut-off
+    """
+    last = n_obs - n_days
+    return [
+        cutoff
+        for cutoff in range(last - step * (n_folds - 1), last + 1, step)
+        if cutoff >= min_train
+    ]
+
+
+def init_worker(values: np.ndarray):
+    """Set the prices of the walk-forward folds run by this process"""
+    global _values  # pylint: disable=global-statement
+    _values = values
+
+
+def run_fold(job: Tuple[str, Dict, int, int, int]) -> np.ndarray:
+    """Fit a model on the training window of a fold and predict its next prices
+
+    Parameters
+    ----------
+    job : Tuple[str, Dict, int, int, int]
+        Model name in FORECASTERS, its parameters, start and cut-off positions of the
+        training window, and prediction days
+
+    Returns
+    -------
+    np.ndarray
+        Non-negative predictions, NaN when the model could not be fitted
+    """
+    model, params, start, cutoff, n_days = job
+    assert _values is not None, "init_worker sets the prices of the process"
+    try:
+        l_predictions = FORECASTERS[model](_values[start:cutoff], n_days, **params)
+        return np.clip(np.asarray(l_predictions, dtype=float), 0, None)
+    except Exception:  # pylint: disable=broad-except
+        return np.full(n_days, np.nan)
+
+
+def walk_forward(
+    prices: pd.Series,
+    model: str,
+    params: Dict,
+    n_days: int,
+    n_folds: int,
+    window: int = 0,
+    step: Optional[int] = None,
+    min_train: int = 10,
+    n_jobs: int = 1,
+) -> pd.DataFrame:
+    """Refit a model over rolling training windows ending at many cut-off dates
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Adjusted close prices
+    model : str
+        Model name in FORECASTERS
+    params : Dict
+        Model parameters, besides the training prices and prediction days
+    n_days : int
+        Prediction days of each fold
+    n_folds : int
+        Maximum number of folds
+    window : int
+        Number of prices of each training window, 0 to train on every previous price
+    step : Optional[int]
+        Number of prices between consecutive cut-offs, n_days by default so that the
+        predicted periods do not overlap
+    min_train : int
+        Minimum number of training prices of a fold
+    n_jobs : int
+        Number of worker processes
+
+    Returns
+    -------
+    pd.DataFrame
+        Row per fold predicted, indexed by cut-off date, with the predictions and the
+        real prices of each prediction day
+    """
+    values = prices.values.astype(float)
+    l_cutoffs = get_cutoffs(
+        len(values), n_days, n_folds, step or n_days, max(min_train, window)
+    )
+    l_jobs = [
+        (model, params, max(0, cutoff - window) if window else 0, cutoff, n_days)
+        for cutoff in l_cutoffs
+    ]
+
+    if n_jobs > 1 and len(l_jobs) > 1:
+        with multiprocessing.get_context("spawn").Pool(
+            processes=min(n_jobs, len(l_jobs)),
+            initializer=init_worker,
+            initargs=(values,),
+        ) as pool:
+            l_predictions = pool.map(run_fold, l_jobs)
+    else:
+        init_worker(values)
+        l_predictions = list(map(run_fold, l_jobs))
+
+    return pd.DataFrame(
+        [
+            {
+                "Prediction": predictions,
+                "Real": values[cutoff : cutoff + n_days],
+            }
+            for cutoff, predictions in zip(l_cutoffs, l_predictions)
+        ],
+        index=pd.Index(
+            prices.index[np.array(l_cutoffs, dtype=int) - 1], name="Cut-off"
+        ),
+    )
+
+
+def get_fold_errors(df_folds: pd.DataFrame) -> pd.DataFrame:
+    """Prediction errors of each fold
+
+    Parameters
+    ----------
+    df_folds : pd.DataFrame
+        Folds, from walk_forward
+
+    Returns
+    -------
+    pd.DataFrame
+        MAPE [%], RMSE and MAE of each fold, NaN for folds the model could not fit
+    """
+    l_errors = list()
+    for real, pred in zip(df_folds["Real"], df_folds["Prediction"]):
+        error = pred - real
+        l_errors.append(
+            {
+                "MAPE": 100 * np.mean(np.abs(error / real)),
+                "RMSE": np.sqrt(np.mean(error ** 2)),
+                "MAE": np.mean(np.abs(error)),
+            }
+        )
+    return pd.DataFrame(l_errors, index=df_folds.index, columns=["MAPE", "RMSE", "MAE"])
+
+
+def summarize_errors(df_errors: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate the prediction errors across folds
+
+    Parameters
+    ----------
+    df_errors : pd.DataFrame
+        Errors of each fold, from get_fold_errors
+
+    Returns
+    -------
+    pd.DataFrame
+        Mean, standard deviation, median and worst fold of each error
+    """
+    return df_errors.agg(["mean", "std", "median", "max"]).rename(
+        index={"mean": "Mean", "std": "Std", "median": "Median", "max": "Worst"}
+    )
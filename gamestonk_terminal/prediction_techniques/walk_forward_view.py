@@ -0,0 +1,144 @@
+"""Walk-forward backtest view of the prediction models"""
+__docformat__ = "numpy"
+
+import argparse
+import os
+from typing import Dict
+import matplotlib.pyplot as plt
+import pandas as pd
+from pandas.plotting import register_matplotlib_converters
+from gamestonk_terminal.helper_funcs import (
+    check_non_negative,
+    check_positive,
+    plot_autoscale,
+)
+from gamestonk_terminal.prediction_techniques import walk_forward_model
+from gamestonk_terminal.config_plot import PLOT_DPI
+from gamestonk_terminal import feature_flags as gtff
+
+register_matplotlib_converters()
+
+
+def add_walk_forward_arguments(parser: argparse.ArgumentParser):
+    """Add the walk-forward backtest arguments to the parser of a prediction model
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        Parser of the model command
+    """
+    parser.add_argument(
+        "--folds",
+        action="store",
+        dest="n_folds",
+        type=check_positive,
+        default=None,
+        help="Walk-forward backtest over this number of cut-off dates, instead of predicting.",
+    )
+    parser.add_argument(
+        "--window",
+        action="store",
+        dest="n_window",
+        type=check_non_negative,
+        default=252,
+        help="Walk-forward training window, in days. 0 to train on every previous day.",
+    )
+    parser.add_argument(
+        "--step",
+        action="store",
+        dest="n_step",
+        type=check_positive,
+        default=None,
+        help="Walk-forward days between cut-off dates. Default is the prediction days.",
+    )
+    parser.add_argument(
+        "--jobs",
+        action="store",
+        dest="n_jobs",
+        type=check_positive,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes.",
+    )
+
+
+def walk_forward(
+    s_ticker: str,
+    df_stock: pd.DataFrame,
+    model: str,
+    params: Dict,
+    ns_parser: argparse.Namespace,
+    min_train: int,
+    title: str,
+):
+    """Walk-forward backtest a prediction model, and display its errors across folds
+
+    Parameters
+    ----------
+    s_ticker : str
+        Loaded ticker
+    df_stock : pd.DataFrame
+        Loaded stock dataframe
+    model : str
+        Model name in walk_forward_model.FORECASTERS
+    params : Dict
+        Model parameters
+    ns_parser : argparse.Namespace
+        Parsed arguments, with those of add_walk_forward_arguments and n_days
+    min_train : int
+        Minimum number of training days of the model
+    title : str
+        Model description
+    """
+    df_folds = walk_forward_model.walk_forward(
+        df_stock["5. adjusted close"],
+        model,
+        params,
+        ns_parser.n_days,
+        ns_parser.n_folds,
+        ns_parser.n_window,
+        ns_parser.n_step,
+        min_train,
+        ns_parser.n_jobs,
+    )
+    if df_folds.empty:
+        print("Not enough data for a single walk-forward fold.\n")
+        return
+
+    df_errors = walk_forward_model.get_fold_errors(df_folds)
+
+    plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
+    plt.plot(df_stock.index, df_stock["5. adjusted close"], lw=2)
+    for cutoff, predictions in zip(df_folds.index, df_folds["Prediction"]):
+        l_fold_days = df_stock.index[df_stock.index > cutoff][: len(predictions)]
+        plt.plot(
+            [cutoff, *l_fold_days],
+            [df_stock["5. adjusted close"][cutoff], *predictions],
+            lw=1,
+            c="tab:green",
+        )
+    plt.title(
+        f"WALK-FORWARD: {title} on {s_ticker} - {len(df_folds)} folds of "
+        f"{ns_parser.n_days} days prediction"
+    )
+    plt.xlim(df_stock.index[0], df_stock.index[-1])
+    plt.xlabel("Time")
+    plt.ylabel("Share Price ($)")
+    plt.grid(b=True, which="major", color="#666666", linestyle="-")
+    plt.minorticks_on()
+    plt.grid(b=True, which="minor", color="#999999", linestyle="-", alpha=0.2)
+    plt.legend(["Real data", "Prediction data"])
+
+    if gtff.USE_ION:
+        plt.ion()
+
+    plt.show()
+
+    df_errors.index = df_errors.index.strftime("%Y-%m-%d")
+    print(df_errors.round(3).to_string())
+    print("")
+    n_failed = df_errors["MAPE"].isna().sum()
+    if n_failed:
+        print(f"The model could not be fitted on {n_failed} folds.")
+    print(f"Errors across {len(df_errors) - n_failed} folds:")
+    print(walk_forward_model.summarize_errors(df_errors).round(3).to_string())
+    print("")
@@ -2,11 +2,11 @@
 __docformat__ = "numpy"
 
 import argparse
+import os
 from typing import List
 import pandas as pd
-import pmdarima
-from statsmodels.tsa.arima.model import ARIMA
 from gamestonk_terminal.helper_funcs import parse_known_args_and_warn
+from gamestonk_terminal.prediction_techniques import arima_model
 
 
 def naive(
@@ -118,33 +118,21 @@ def arima(
         if not ns_parser:
             return
 
+        # Fits are shared with the arima command of the pred menu
         if ns_parser.s_order:
-            t_order = tuple(int(ord) for ord in list(ns_parser.s_order))
-            model_fit = ARIMA(stock.values, order=t_order).fit()
-            model = pd.Series(model_fit.fittedvalues[1:], index=stock.index[1:])
-            model_name = f"ARIMA {t_order}"
-            residuals = model_fit.resid
-
+            p, d, q = (int(ord) for ord in list(ns_parser.s_order))
+            model_fit = arima_model.get_fit(stock, (p, d, q))
         else:
-            if ns_parser.b_seasonal:
-                model_fit = pmdarima.auto_arima(
-                    stock.values,
-                    error_action="ignore",
-                    seasonal=True,
-                    m=5,
-                    information_criteria=ns_parser.s_ic,
-                )
-            else:
-                model_fit = pmdarima.auto_arima(
-                    stock.values,
-                    error_action="ignore",
-                    seasonal=False,
-                    information_criteria=ns_parser.s_ic,
-                )
-
-            model = pd.Series(model_fit.predict_in_sample()[1:], index=stock.index[1:])
-            model_name = f"ARIMA {model_fit.order}"
-            residuals = model_fit.resid()
+            model_fit = arima_model.get_auto_fit(
+                stock,
+                ic=ns_parser.s_ic,
+                seasonal=ns_parser.b_seasonal,
+                n_jobs=os.cpu_count() or 1,
+            )
+
+        model = pd.Series(model_fit.fittedvalues[1:], index=stock.index[1:])
+        model_name = f"ARIMA {model_fit.model.order}"
+        residuals = model_fit.resid
 
         return model_name, model, residuals
 
@@ -16,6 +16,7 @@ from gamestonk_terminal.helper_funcs import (
 from gamestonk_terminal.screener import finviz_view
 from gamestonk_terminal.screener import yahoo_finance_view
 from gamestonk_terminal.portfolio_optimization import po_controller
+from gamestonk_terminal.technical_analysis import scan_view
 
 presets_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "presets/")
 
@@ -38,6 +39,7 @@ class ScreenerController:
         "performance",
         "technical",
         "signals",
+        "scan",
         "po",
     ]
 
@@ -73,6 +75,7 @@ class ScreenerController:
         print("   technical      technical (e.g. Beta, SMA50, 52W Low, RSI, Change)")
         print("")
         print("   signals        view filter signals (e.g. -s top_gainers)")
+        print("   scan           scan technical indicators of screened tickers")
         print("")
         if self.screen_tickers:
             print(f"Last screened tickers: {', '.join(self.screen_tickers)}")
@@ -262,6 +265,10 @@ class ScreenerController:
         """Process signals command"""
         finviz_view.view_signals(other_args)
 
+    def call_scan(self, other_args: List[str]):
+        """Process scan command"""
+        scan_view.scan(other_args, self.screen_tickers)
+
     def call_po(self, _):
         """Call the portfolio optimization menu with selected tickers"""
         return po_controller.menu(self.screen_tickers)
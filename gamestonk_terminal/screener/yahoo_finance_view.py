@@ -6,10 +6,10 @@ import datetime
 import configparser
 from pandas.plotting import register_matplotlib_converters
 import matplotlib.pyplot as plt
-import yfinance as yf
 from finvizfinance.screener import ticker
 from gamestonk_terminal.screener import finviz_view
 from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal import market_data
 from gamestonk_terminal.helper_funcs import (
     parse_known_args_and_warn,
     plot_autoscale,
@@ -112,10 +112,6 @@ def historical(other_args: List[str], preset_loaded: str) -> List[str]:
             else:
                 screen.set_filter(filters_dict=d_filters)
 
-        l_min = list()
-        l_leg = list()
-        plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
-
         l_stocks = screen.ScreenerView(verbose=0)
 
         if len(l_stocks) > 10:
@@ -127,39 +123,19 @@ def historical(other_args: List[str], preset_loaded: str) -> List[str]:
             l_stocks = sorted(l_stocks[:10])
             print(", ".join(l_stocks))
 
-        while l_stocks:
-            l_parsed_stocks = list()
-            for symbol in l_stocks:
-                try:
-                    df_similar_stock = yf.download(
-                        symbol,
-                        start=datetime.datetime.strftime(ns_parser.start, "%Y-%m-%d"),
-                        progress=False,
-                        threads=False,
-                    )
-                    if not df_similar_stock.empty:
-                        plt.plot(
-                            df_similar_stock.index,
-                            df_similar_stock[
-                                d_candle_types[ns_parser.type_candle]
-                            ].values,
-                        )
-                        l_min.append(df_similar_stock.index[0])
-                        l_leg.append(symbol)
-
-                    l_parsed_stocks.append(symbol)
-                except Exception as e:
-                    print("")
-                    print(e)
-                    print(
-                        "Disregard previous error, which is due to API Rate limits from Yahoo Finance."
-                    )
-                    print(
-                        f"Because we like '{symbol}', and we won't leave without getting data from it."
-                    )
-
-            for parsed_stock in l_parsed_stocks:
-                l_stocks.remove(parsed_stock)
+        df_similar = market_data.get_prices_multiple(
+            l_stocks,
+            start=datetime.datetime.strftime(ns_parser.start, "%Y-%m-%d"),
+            column=d_candle_types[ns_parser.type_candle],
+        )
+
+        l_min = list()
+        plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
+        for symbol in df_similar.columns:
+            df_similar_stock = df_similar[symbol].dropna()
+            plt.plot(df_similar_stock.index, df_similar_stock.values)
+            l_min.append(df_similar_stock.index[0])
+        l_leg = list(df_similar.columns)
 
         if ns_parser.signal:
             plt.title(
@@ -175,14 +151,14 @@ def historical(other_args: List[str], preset_loaded: str) -> List[str]:
         plt.minorticks_on()
         plt.grid(b=True, which="minor", color="#999999", linestyle="-", alpha=0.2)
         # ensures that the historical data starts from same datapoint
-        plt.xlim([max(l_min), df_similar_stock.index[-1]])
+        plt.xlim([max(l_min), df_similar.index[-1]])
 
         if gtff.USE_ION:
             plt.ion()
 
         plt.show()
         print("")
-        return l_parsed_stocks
+        return l_leg
 
     except SystemExit:
         print("Similar companies need to be provided", "\n")
@@ -0,0 +1,371 @@
+"""Batch computation of technical indicators"""
+__docformat__ = "numpy"
+
+from typing import Callable, Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+# Default parameter set of each indicator, the same as its single indicator command
+INDICATORS: Dict[str, Tuple] = {
+    "ema": (20,),
+    "sma": (20,),
+    "vwap": (),
+    "cci": (14, 0.015),
+    "macd": (12, 26, 9),
+    "rsi": (14,),
+    "stoch": (14, 3, 3),
+    "adx": (14,),
+    "aroon": (25,),
+    "bbands": (5, 2),
+    "ad": (),
+    "obv": (),
+}
+
+
+class SharedIntermediates:
+    """Memo of the series shared between indicators, computed once per batch
+
+    True range, typical price, price differences, rolling windows and moving averages
+    are keyed by what they are computed from, so e.g. sma 20 and bbands 20 share the same
+    rolling mean, and ema 12, ema 26 and macd 12 26 share the same exponential averages.
+    """
+
+    def __init__(self, df_ohlcv: pd.DataFrame):
+        self.df_ohlcv = df_ohlcv
+        self._memo: Dict[Tuple, pd.Series] = dict()
+
+    def _get(self, key: Tuple, compute: Callable[[], pd.Series]) -> pd.Series:
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def __len__(self):
+        return len(self._memo)
+
+    def column(self, name: str) -> pd.Series:
+        return self.df_ohlcv[name]
+
+    def typical_price(self) -> pd.Series:
+        return self._get(
+            ("tp",),
+            lambda: (self.column("High") + self.column("Low") + self.column("Close"))
+            / 3,
+        )
+
+    def true_range(self) -> pd.Series:
+        def compute():
+            prev_close = self.column("Close").shift(1)
+            return pd.concat(
+                [
+                    self.column("High") - self.column("Low"),
+                    (self.column("High") - prev_close).abs(),
+                    (self.column("Low") - prev_close).abs(),
+                ],
+                axis=1,
+            ).max(axis=1, skipna=False)
+
+        return self._get(("tr",), compute)
+
+    def diff(self, name: str) -> pd.Series:
+        return self._get(("diff", name), lambda: self.column(name).diff())
+
+    def rolling(self, name: str, length: int, how: str) -> pd.Series:
+        """Rolling mean, std, min or max of a price column or of the typical price"""
+        series = self.typical_price() if name == "tp" else self.column(name)
+        return self._get(
+            ("rolling", name, length, how),
+            lambda: getattr(series.rolling(length), how)(
+                **({"ddof": 0} if how == "std" else {})
+            ),
+        )
+
+    def ema(self, name: str, length: int) -> pd.Series:
+        return self._get(("ema", name, length), lambda: ema(self.column(name), length))
+
+    def rma(self, key: Tuple, series: Callable[[], pd.Series], length: int):
+        """Wilder's moving average of a shared series"""
+        return self._get(("rma", length) + key, lambda: rma(series(), length))
+
+
+def ema(series: pd.Series, length: int) -> pd.Series:
+    """Exponential moving average, seeded with the simple average of the first length values
+
+    Parameters
+    ----------
+    series : pd.Series
+        Values to average, leading NaNs are skipped
+    length : int
+        Span of the average
+
+    Returns
+    -------
+    pd.Series
+        Exponential moving average, NaN until length values are seen
+    """
+    values = series.astype(float).copy()
+    first = values.first_valid_index()
+    if first is None:
+        return values
+    start = values.index.get_loc(first)
+    if len(values) - start < length:
+        return values * np.nan
+    values.iloc[: start + length - 1] = np.nan
+    values.iloc[start + length - 1] = series.iloc[start : start + length].mean()
+    return values.ewm(span=length, adjust=False).mean()
+
+
+def rma(series: pd.Series, length: int) -> pd.Series:
+    """Wilder's moving average, as pandas_ta.rma
+
+    Parameters
+    ----------
+    series : pd.Series
+        Values to average, leading NaNs are skipped
+    length : int
+        Length of the average, whose smoothing factor is 1 / length
+
+    Returns
+    -------
+    pd.Series
+        Wilder's moving average, NaN until length values are seen
+    """
+    return series.ewm(alpha=1 / length, min_periods=length).mean()
+
+
+def rolling_windows(series: pd.Series, length: int) -> np.ndarray:
+    """Windows of the last length values at each bar, as a strided view of the series
+
+    Parameters
+    ----------
+    series : pd.Series
+        Values to window
+    length : int
+        Length of each window
+
+    Returns
+    -------
+    np.ndarray
+        Read-only view of shape (# values - length + 1, length), whose first row is
+        the window ending at the length-th value
+    """
+    values = np.ascontiguousarray(series.values, dtype=float)
+    # np.lib.stride_tricks.sliding_window_view needs numpy 1.20
+    return np.lib.stride_tricks.as_strided(
+        values,
+        shape=(max(len(values) - length + 1, 0), length),
+        strides=values.strides * 2,
+        writeable=False,
+    )
+
+
+def rolling_reduce(
+    series: pd.Series, length: int, reduce: Callable[[np.ndarray], np.ndarray]
+) -> pd.Series:
+    """Reduce the rolling windows of a series at once, instead of one window at a time
+
+    Parameters
+    ----------
+    series : pd.Series
+        Values to window
+    length : int
+        Length of each window
+    reduce : Callable[[np.ndarray], np.ndarray]
+        Function of an array of windows, one per row, to the value of each window
+
+    Returns
+    -------
+    pd.Series
+        Value of the window ending at each bar, NaN until length values are seen and
+        for the windows with a missing value
+    """
+    windows = rolling_windows(series, length)
+    result = np.full(len(series), np.nan)
+    if len(windows):
+        result[length - 1 :] = np.where(
+            np.isnan(windows).any(axis=1), np.nan, reduce(windows)
+        )
+    return pd.Series(result, index=series.index)
+
+
+def _ema(shared: SharedIntermediates, length: int) -> pd.DataFrame:
+    return shared.ema("Close", length).rename(f"EMA_{length}").to_frame()
+
+
+def _sma(shared: SharedIntermediates, length: int) -> pd.DataFrame:
+    return shared.rolling("Close", length, "mean").rename(f"SMA_{length}").to_frame()
+
+
+def _vwap(shared: SharedIntermediates) -> pd.DataFrame:
+    # Anchored at the start of each day, which is every bar of daily prices
+    volume = shared.column("Volume")
+    day = shared.df_ohlcv.index.normalize()
+    cum_tpv = (shared.typical_price() * volume).groupby(day).cumsum()
+    cum_volume = volume.groupby(day).cumsum()
+    return (cum_tpv / cum_volume).rename("VWAP").to_frame()
+
+
+def _cci(shared: SharedIntermediates, length: int, scalar: float) -> pd.DataFrame:
+    tp = shared.typical_price()
+    mean_tp = shared.rolling("tp", length, "mean")
+    mad = rolling_reduce(
+        tp,
+        length,
+        lambda windows: np.abs(windows - windows.mean(axis=1)[:, None]).mean(axis=1),
+    )
+    return ((tp - mean_tp) / (scalar * mad)).rename(f"CCI_{length}_{scalar}").to_frame()
+
+
+def _macd(
+    shared: SharedIntermediates, fast: int, slow: int, signal: int
+) -> pd.DataFrame:
+    suffix = f"{fast}_{slow}_{signal}"
+    macd_line = shared.ema("Close", fast) - shared.ema("Close", slow)
+    signal_line = ema(macd_line, signal)
+    return pd.DataFrame(
+        {
+            f"MACD_{suffix}": macd_line,
+            f"MACDh_{suffix}": macd_line - signal_line,
+            f"MACDs_{suffix}": signal_line,
+        }
+    )
+
+
+def _rsi(shared: SharedIntermediates, length: int) -> pd.DataFrame:
+    gain = shared.rma(("gain",), lambda: shared.diff("Close").clip(lower=0), length)
+    loss = shared.rma(("loss",), lambda: (-shared.diff("Close")).clip(lower=0), length)
+    return (100 * gain / (gain + loss)).rename(f"RSI_{length}").to_frame()
+
+
+def _stoch(shared: SharedIntermediates, k: int, d: int, smooth_k: int) -> pd.DataFrame:
+    suffix = f"{k}_{d}_{smooth_k}"
+    lowest_low = shared.rolling("Low", k, "min")
+    highest_high = shared.rolling("High", k, "max")
+    fast_k = 100 * (shared.column("Close") - lowest_low) / (highest_high - lowest_low)
+    stoch_k = fast_k.rolling(smooth_k).mean()
+    return pd.DataFrame(
+        {f"STOCHk_{suffix}": stoch_k, f"STOCHd_{suffix}": stoch_k.rolling(d).mean()}
+    )
+
+
+def _adx(shared: SharedIntermediates, length: int) -> pd.DataFrame:
+    up = shared.diff("High")
+    down = -shared.diff("Low")
+    atr = shared.rma(("tr",), shared.true_range, length)
+    # The directional moves of the first bar stay missing, as in pandas_ta
+    dmp = 100 * shared.rma(("dmp",), lambda: ((up > down) & (up > 0)) * up, length)
+    dmn = 100 * shared.rma(("dmn",), lambda: ((down > up) & (down > 0)) * down, length)
+    dmp, dmn = dmp / atr, dmn / atr
+    dx = 100 * (dmp - dmn).abs() / (dmp + dmn)
+    return pd.DataFrame(
+        {
+            f"ADX_{length}": rma(dx, length),
+            f"DMP_{length}": dmp,
+            f"DMN_{length}": dmn,
+        }
+    )
+
+
+def _aroon(shared: SharedIntermediates, length: int) -> pd.DataFrame:
+    # Bars since the extreme of a window of length + 1 bars. Windows are reversed so that
+    # ties count from the most recent extreme, as in pandas_ta.
+    periods_from_high = rolling_reduce(
+        shared.column("High"),
+        length + 1,
+        lambda windows: np.argmax(windows[:, ::-1], axis=1),
+    )
+    periods_from_low = rolling_reduce(
+        shared.column("Low"),
+        length + 1,
+        lambda windows: np.argmin(windows[:, ::-1], axis=1),
+    )
+    aroon_up = 100 * (1 - periods_from_high / length)
+    aroon_down = 100 * (1 - periods_from_low / length)
+    return pd.DataFrame(
+        {
+            f"AROOND_{length}": aroon_down,
+            f"AROONU_{length}": aroon_up,
+            f"AROONOSC_{length}": aroon_up - aroon_down,
+        }
+    )
+
+
+def _bbands(shared: SharedIntermediates, length: int, std: float) -> pd.DataFrame:
+    suffix = f"{length}_{float(std)}"
+    mid = shared.rolling("Close", length, "mean")
+    dev = std * shared.rolling("Close", length, "std")
+    return pd.DataFrame(
+        {f"BBL_{suffix}": mid - dev, f"BBM_{suffix}": mid, f"BBU_{suffix}": mid + dev}
+    )
+
+
+def _ad(shared: SharedIntermediates) -> pd.DataFrame:
+    high, low, close = (
+        shared.column("High"),
+        shared.column("Low"),
+        shared.column("Close"),
+    )
+    range_ = high - low
+    clv = ((close - low) - (high - close)) / range_.where(range_ != 0)
+    return (clv.fillna(0) * shared.column("Volume")).cumsum().rename("AD").to_frame()
+
+
+def _obv(shared: SharedIntermediates) -> pd.DataFrame:
+    sign = np.sign(shared.diff("Close")).fillna(0)
+    # The first bar counts as an up bar, as in pandas_ta
+    sign.iloc[:1] = 1
+    return (sign * shared.column("Volume")).cumsum().rename("OBV").to_frame()
+
+
+_INDICATOR_FUNCS: Dict[str, Callable[..., pd.DataFrame]] = {
+    "ema": _ema,
+    "sma": _sma,
+    "vwap": _vwap,
+    "cci": _cci,
+    "macd": _macd,
+    "rsi": _rsi,
+    "stoch": _stoch,
+    "adx": _adx,
+    "aroon": _aroon,
+    "bbands": _bbands,
+    "ad": _ad,
+    "obv": _obv,
+}
+
+
+def get_indicators(
+    df_ohlcv: pd.DataFrame, l_indicators: List[Tuple[str, Tuple]]
+) -> pd.DataFrame:
+    """Compute a batch of indicators in one pass over the prices
+
+    Parameters
+    ----------
+    df_ohlcv : pd.DataFrame
+        Prices with the market_data.TA_COLUMNS schema
+    l_indicators : List[Tuple[str, Tuple]]
+        Indicator name, from INDICATORS, and parameter set of each indicator to compute.
+        An empty parameter set stands for the default one.
+
+    Returns
+    -------
+    pd.DataFrame
+        Wide frame with the prices index and a column per indicator output, named
+        after the indicator and its parameters, e.g. RSI_14 or MACDh_12_26_9
+    """
+    shared = SharedIntermediates(df_ohlcv)
+    l_frames = list()
+    for name, params in l_indicators:
+        if name not in _INDICATOR_FUNCS:
+            raise ValueError(
+                f"Unknown indicator {name}, choose from {', '.join(INDICATORS)}"
+            )
+        if len(params) > len(INDICATORS[name]):
+            raise ValueError(f"{name} takes at most {len(INDICATORS[name])} parameters")
+        # Missing trailing parameters take their default value
+        params = tuple(params) + INDICATORS[name][len(params) :]
+        l_frames.append(_INDICATOR_FUNCS[name](shared, *params))
+
+    if not l_frames:
+        return pd.DataFrame(index=df_ohlcv.index)
+
+    df_features = pd.concat(l_frames, axis=1)
+    return df_features.loc[:, ~df_features.columns.duplicated()]
@@ -0,0 +1,131 @@
+"""Batch technical indicators view"""
+__docformat__ = "numpy"
+
+import argparse
+import os
+from typing import List, Tuple
+import pandas as pd
+from gamestonk_terminal.helper_funcs import parse_known_args_and_warn
+from gamestonk_terminal.technical_analysis import batch_model
+
+
+def parse_indicator(s_indicator: str) -> Tuple[str, List[Tuple]]:
+    """Parse an indicator and its parameter sets, e.g. rsi:14,21 or macd:12-26-9,5-35-5
+
+    Parameters
+    ----------
+    s_indicator : str
+        Indicator name, optionally followed by ':' and comma separated parameter sets,
+        each of them with its parameters separated by '-'
+
+    Returns
+    -------
+    str
+        Indicator name
+    List[Tuple]
+        Parameter sets of the indicator, a single empty one for the default parameters
+    """
+    s_name, _, s_params = s_indicator.lower().partition(":")
+    if s_name not in batch_model.INDICATORS:
+        raise argparse.ArgumentTypeError(
+            f"{s_name} is not one of {', '.join(batch_model.INDICATORS)}"
+        )
+
+    l_params = list()
+    for s_param_set in filter(None, s_params.split(",")):
+        try:
+            l_params.append(
+                tuple(
+                    float(s_param) if "." in s_param else int(s_param)
+                    for s_param in s_param_set.split("-")
+                )
+            )
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(
+                f"{s_param_set} is not a valid parameter set of {s_name}"
+            ) from e
+
+    return s_name, l_params or [()]
+
+
+def batch(l_args: List[str], s_ticker: str, df_stock: pd.DataFrame):
+    """Compute several indicators with several parameter sets at once, and export them
+
+    Parameters
+    ----------
+    l_args : List[str]
+        Argparse arguments
+    s_ticker : str
+        Stock ticker
+    df_stock : pd.DataFrame
+        Prices with the market_data.TA_COLUMNS schema
+    """
+    parser = argparse.ArgumentParser(
+        add_help=False,
+        prog="batch",
+        description=f"""
+            Compute a list of indicators, each with one or more parameter sets, in a single
+            pass over the loaded prices. Intermediate series shared between indicators, such
+            as the true range, typical price and rolling windows, are computed once. Parameter
+            sets are comma separated, with their parameters separated by '-', e.g.
+            'batch rsi:7,14,21 macd:12-26-9,5-35-5 bbands:20-2 obv'. Indicators without
+            parameters use those of their own command. Available indicators:
+            {', '.join(f"{k} ({'-'.join(map(str, v)) or 'none'})" for k, v in batch_model.INDICATORS.items())}.
+        """,
+    )
+    parser.add_argument(
+        "indicators",
+        nargs="+",
+        type=parse_indicator,
+        help="indicators with optional parameter sets, e.g. rsi:7,14,21",
+    )
+    parser.add_argument(
+        "-n",
+        "--num",
+        action="store",
+        dest="n_num",
+        type=int,
+        default=5,
+        help="number of latest rows to display",
+    )
+    parser.add_argument(
+        "-e",
+        "--export",
+        action="store",
+        dest="s_export",
+        type=str,
+        default="",
+        help="file to export all rows to, csv unless it ends in .json or .xlsx",
+    )
+
+    try:
+        ns_parser = parse_known_args_and_warn(parser, l_args)
+        if not ns_parser:
+            return
+
+        df_features = batch_model.get_indicators(
+            df_stock,
+            [
+                (s_name, params)
+                for s_name, l_params in ns_parser.indicators
+                for params in l_params
+            ],
+        )
+
+        print(f"{len(df_features.columns)} indicator values of {s_ticker}:")
+        print(df_features.tail(ns_parser.n_num).T.to_string())
+        print("")
+
+        if ns_parser.s_export:
+            s_ext = os.path.splitext(ns_parser.s_export)[1].lower()
+            if s_ext == ".json":
+                df_features.to_json(ns_parser.s_export)
+            elif s_ext == ".xlsx":
+                df_features.to_excel(ns_parser.s_export)
+            else:
+                df_features.to_csv(ns_parser.s_export)
+            print(f"Exported to {ns_parser.s_export}\n")
+
+    except Exception as e:
+        print(e)
+        print("")
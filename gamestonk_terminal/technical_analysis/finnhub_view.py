@@ -3,10 +3,10 @@ from typing import List
 import math
 from datetime import datetime
 import requests
-import yfinance as yf
 import mplfinance as mpf
 import pandas as pd
 from gamestonk_terminal import config_terminal as cfg
+from gamestonk_terminal import market_data
 from gamestonk_terminal.helper_funcs import (
     parse_known_args_and_warn,
     plot_autoscale,
@@ -98,10 +98,9 @@ def plot_pattern_recognition(ticker: str, pattern: pd.DataFrame):
         if pattern[i]["atime"] < start_time:
             start_time = pattern[i]["atime"]
 
-    df_stock = yf.download(
+    df_stock = market_data.get_prices(
         ticker,
         start=datetime.utcfromtimestamp(start_time).strftime("%Y-%m-%d"),
-        progress=False,
     )
 
     df_stock["date_id"] = (df_stock.index.date - df_stock.index.date.min()).astype(
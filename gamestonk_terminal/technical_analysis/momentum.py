@@ -13,7 +13,7 @@ from gamestonk_terminal import feature_flags as gtff
 register_matplotlib_converters()
 
 
-def cci(l_args, s_ticker, s_interval, df_stock):
+def cci(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="cci",
@@ -59,35 +59,19 @@ def cci(l_args, s_ticker, s_interval, df_stock):
         if not ns_parser:
             return
 
-        # Daily
-        if s_interval == "1440min":
-            df_ta = ta.cci(
-                high=df_stock["2. high"],
-                low=df_stock["3. low"],
-                close=df_stock["5. adjusted close"],
-                length=ns_parser.n_length,
-                scalar=ns_parser.n_scalar,
-                offset=ns_parser.n_offset,
-            ).dropna()
-
-        # Intraday
-        else:
-            df_ta = ta.cci(
-                high=df_stock["2. high"],
-                low=df_stock["3. low"],
-                close=df_stock["4. close"],
-                length=ns_parser.n_length,
-                scalar=ns_parser.n_scalar,
-                offset=ns_parser.n_offset,
-            ).dropna()
+        df_ta = ta.cci(
+            high=df_stock["High"],
+            low=df_stock["Low"],
+            close=df_stock["Close"],
+            length=ns_parser.n_length,
+            scalar=ns_parser.n_scalar,
+            offset=ns_parser.n_offset,
+        ).dropna()
 
         plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
         plt.subplot(211)
         plt.title(f"Commodity Channel Index (CCI) on {s_ticker}")
-        if s_interval == "1440min":
-            plt.plot(df_stock.index, df_stock["5. adjusted close"].values, "k", lw=2)
-        else:
-            plt.plot(df_stock.index, df_stock["4. close"].values, "k", lw=2)
+        plt.plot(df_stock.index, df_stock["Close"].values, "k", lw=2)
         plt.xlim(df_stock.index[0], df_stock.index[-1])
         plt.ylabel("Share Price ($)")
         plt.grid(b=True, which="major", color="#666666", linestyle="-")
@@ -120,7 +104,7 @@ def cci(l_args, s_ticker, s_interval, df_stock):
         print("")
 
 
-def macd(l_args, s_ticker, s_interval, df_stock):
+def macd(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="macd",
@@ -178,33 +162,18 @@ def macd(l_args, s_ticker, s_interval, df_stock):
         if not ns_parser:
             return
 
-        # Daily
-        if s_interval == "1440min":
-            df_ta = ta.macd(
-                df_stock["5. adjusted close"],
-                fast=ns_parser.n_fast,
-                slow=ns_parser.n_slow,
-                signal=ns_parser.n_signal,
-                offset=ns_parser.n_offset,
-            ).dropna()
-
-        # Intraday
-        else:
-            df_ta = ta.macd(
-                df_stock["4. close"],
-                fast=ns_parser.n_fast,
-                slow=ns_parser.n_slow,
-                signal=ns_parser.n_signal,
-                offset=ns_parser.n_offset,
-            ).dropna()
+        df_ta = ta.macd(
+            df_stock["Close"],
+            fast=ns_parser.n_fast,
+            slow=ns_parser.n_slow,
+            signal=ns_parser.n_signal,
+            offset=ns_parser.n_offset,
+        ).dropna()
 
         plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
         plt.subplot(211)
         plt.title(f"Moving Average Convergence Divergence (MACD) on {s_ticker}")
-        if s_interval == "1440min":
-            plt.plot(df_stock.index, df_stock["5. adjusted close"].values, "k", lw=2)
-        else:
-            plt.plot(df_stock.index, df_stock["4. close"].values, "k", lw=2)
+        plt.plot(df_stock.index, df_stock["Close"].values, "k", lw=2)
         plt.xlim(df_stock.index[0], df_stock.index[-1])
         plt.ylabel("Share Price ($)")
         plt.grid(b=True, which="major", color="#666666", linestyle="-")
@@ -238,7 +207,7 @@ def macd(l_args, s_ticker, s_interval, df_stock):
         print("")
 
 
-def rsi(l_args, s_ticker, s_interval, df_stock):
+def rsi(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="rsi",
@@ -293,32 +262,17 @@ def rsi(l_args, s_ticker, s_interval, df_stock):
         if not ns_parser:
             return
 
-        # Daily
-        if s_interval == "1440min":
-            df_ta = ta.rsi(
-                df_stock["5. adjusted close"],
-                length=ns_parser.n_length,
-                scalar=ns_parser.n_scalar,
-                drift=ns_parser.n_drift,
-                offset=ns_parser.n_offset,
-            ).dropna()
-
-        # Intraday
-        else:
-            df_ta = ta.rsi(
-                df_stock["4. close"],
-                length=ns_parser.n_length,
-                scalar=ns_parser.n_scalar,
-                drift=ns_parser.n_drift,
-                offset=ns_parser.n_offset,
-            ).dropna()
+        df_ta = ta.rsi(
+            df_stock["Close"],
+            length=ns_parser.n_length,
+            scalar=ns_parser.n_scalar,
+            drift=ns_parser.n_drift,
+            offset=ns_parser.n_offset,
+        ).dropna()
 
         plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
         plt.subplot(211)
-        if s_interval == "1440min":
-            plt.plot(df_stock.index, df_stock["5. adjusted close"].values, "k", lw=2)
-        else:
-            plt.plot(df_stock.index, df_stock["4. close"].values, "k", lw=2)
+        plt.plot(df_stock.index, df_stock["Close"].values, "k", lw=2)
         plt.title(f"Relative Strength Index (RSI) on {s_ticker}")
         plt.xlim(df_stock.index[0], df_stock.index[-1])
         plt.ylabel("Share Price ($)")
@@ -353,7 +307,7 @@ def rsi(l_args, s_ticker, s_interval, df_stock):
         print("")
 
 
-def stoch(l_args, s_ticker, s_interval, df_stock):
+def stoch(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="stoch",
@@ -408,36 +362,19 @@ def stoch(l_args, s_ticker, s_interval, df_stock):
         if not ns_parser:
             return
 
-        # Daily
-        if s_interval == "1440min":
-            df_ta = ta.stoch(
-                high=df_stock["2. high"],
-                low=df_stock["3. low"],
-                close=df_stock["5. adjusted close"],
-                k=ns_parser.n_fastkperiod,
-                d=ns_parser.n_slowdperiod,
-                smooth_k=ns_parser.n_slowkperiod,
-                offset=ns_parser.n_offset,
-            ).dropna()
-
-        # Intraday
-        else:
-            df_ta = ta.stoch(
-                high=df_stock["2. high"],
-                low=df_stock["3. low"],
-                close=df_stock["4. close"],
-                k=ns_parser.n_fastkperiod,
-                d=ns_parser.n_slowdperiod,
-                smooth_k=ns_parser.n_slowkperiod,
-                offset=ns_parser.n_offset,
-            ).dropna()
+        df_ta = ta.stoch(
+            high=df_stock["High"],
+            low=df_stock["Low"],
+            close=df_stock["Close"],
+            k=ns_parser.n_fastkperiod,
+            d=ns_parser.n_slowdperiod,
+            smooth_k=ns_parser.n_slowkperiod,
+            offset=ns_parser.n_offset,
+        ).dropna()
 
         plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
         plt.subplot(211)
-        if s_interval == "1440min":
-            plt.plot(df_stock.index, df_stock["5. adjusted close"].values, "k", lw=2)
-        else:
-            plt.plot(df_stock.index, df_stock["4. close"].values, "k", lw=2)
+        plt.plot(df_stock.index, df_stock["Close"].values, "k", lw=2)
         plt.title(f"Stochastic Relative Strength Index (STOCH RSI) on {s_ticker}")
         plt.xlim(df_stock.index[0], df_stock.index[-1])
         plt.ylabel("Share Price ($)")
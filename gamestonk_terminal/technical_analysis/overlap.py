@@ -13,7 +13,7 @@ from gamestonk_terminal import feature_flags as gtff
 register_matplotlib_converters()
 
 
-def ema(l_args, s_ticker, s_interval, df_stock):
+def ema(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="ema",
@@ -53,38 +53,16 @@ def ema(l_args, s_ticker, s_interval, df_stock):
         if not ns_parser:
             return
 
-        # Daily
-        if s_interval == "1440min":
-            df_ta = ta.ema(
-                df_stock["5. adjusted close"],
-                length=ns_parser.n_length,
-                offset=ns_parser.n_offset,
-            ).dropna()
-
-        # Intraday
-        else:
-            df_ta = ta.ema(
-                df_stock["4. close"],
-                length=ns_parser.n_length,
-                offset=ns_parser.n_offset,
-            ).dropna()
+        df_ta = ta.ema(
+            df_stock["Close"],
+            length=ns_parser.n_length,
+            offset=ns_parser.n_offset,
+        ).dropna()
 
         _, _ = plt.subplots(figsize=plot_autoscale(), dpi=PLOT_DPI)
         plt.title(f"{ns_parser.n_length} EMA on {s_ticker}")
-        if s_interval == "1440min":
-            plt.plot(
-                df_stock["5. adjusted close"].index,
-                df_stock["5. adjusted close"].values,
-                "k",
-                lw=3,
-            )
-            plt.xlim(
-                df_stock["5. adjusted close"].index[0],
-                df_stock["5. adjusted close"].index[-1],
-            )
-        else:
-            plt.plot(df_stock["4. close"].index, df_stock["4. close"].values, "k", lw=3)
-            plt.xlim(df_stock["4. close"].index[0], df_stock["4. close"].index[-1])
+        plt.plot(df_stock.index, df_stock["Close"].values, "k", lw=3)
+        plt.xlim(df_stock.index[0], df_stock.index[-1])
         plt.xlabel("Time")
         plt.ylabel(f"Share Price of {s_ticker} ($)")
         plt.plot(df_ta.index, df_ta.values, c="tab:blue")
@@ -112,7 +90,7 @@ def ema(l_args, s_ticker, s_interval, df_stock):
         print("")
 
 
-def sma(l_args, s_ticker, s_interval, df_stock):
+def sma(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="sma",
@@ -151,23 +129,13 @@ def sma(l_args, s_ticker, s_interval, df_stock):
             return
 
         plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
-        if s_interval == "1440min":
-            plt.plot(df_stock.index, df_stock["5. adjusted close"].values, color="k")
-        else:
-            plt.plot(df_stock.index, df_stock["4. close"].values, color="k")
+        plt.plot(df_stock.index, df_stock["Close"].values, color="k")
         l_legend = list()
         l_legend.append(s_ticker)
         for length in ns_parser.l_length:
-            if s_interval == "1440min":
-                df_ta = ta.sma(
-                    df_stock["5. adjusted close"],
-                    length=length,
-                    offset=ns_parser.n_offset,
-                ).dropna()
-            else:
-                df_ta = ta.sma(
-                    df_stock["4. close"], length=length, offset=ns_parser.n_offset
-                ).dropna()
+            df_ta = ta.sma(
+                df_stock["Close"], length=length, offset=ns_parser.n_offset
+            ).dropna()
             plt.plot(df_ta.index, df_ta.values)
             l_legend.append(f"{length} SMA")
         plt.title(f"SMA on {s_ticker}")
@@ -190,7 +158,7 @@ def sma(l_args, s_ticker, s_interval, df_stock):
         print("")
 
 
-def vwap(l_args, s_ticker, s_interval, df_stock):
+def vwap(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="vwap",
@@ -215,31 +183,16 @@ def vwap(l_args, s_ticker, s_interval, df_stock):
         if not ns_parser:
             return
 
-        # Daily
-        if s_interval == "1440min":
-            df_ta = ta.vwap(
-                high=df_stock["2. high"],
-                low=df_stock["3. low"],
-                close=df_stock["5. adjusted close"],
-                volume=df_stock["6. volume"],
-                offset=ns_parser.n_offset,
-            )
-
-        # Intraday
-        else:
-            df_ta = ta.vwap(
-                high=df_stock["2. high"],
-                low=df_stock["3. low"],
-                close=df_stock["4. close"],
-                volume=df_stock["5. volume"],
-                offset=ns_parser.n_offset,
-            )
+        df_ta = ta.vwap(
+            high=df_stock["High"],
+            low=df_stock["Low"],
+            close=df_stock["Close"],
+            volume=df_stock["Volume"],
+            offset=ns_parser.n_offset,
+        )
 
         _, axPrice = plt.subplots(figsize=plot_autoscale(), dpi=PLOT_DPI)
-        if s_interval == "1440min":
-            plt.plot(df_stock.index, df_stock["5. adjusted close"].values, color="k")
-        else:
-            plt.plot(df_stock.index, df_stock["4. close"].values, color="k")
+        plt.plot(df_stock.index, df_stock["Close"].values, color="k")
         plt.plot(df_ta.index, df_ta.values)
         plt.title(f"VWAP on {s_ticker}")
         plt.xlim(df_stock.index[0], df_stock.index[-1])
@@ -247,22 +200,13 @@ def vwap(l_args, s_ticker, s_interval, df_stock):
         plt.ylabel("Share Price ($)")
         plt.legend([s_ticker, "VWAP"])
         _ = axPrice.twinx()
-        if s_interval == "1440min":
-            plt.bar(
-                df_stock.index,
-                df_stock["6. volume"].values,
-                color="k",
-                alpha=0.8,
-                width=0.3,
-            )
-        else:
-            plt.bar(
-                df_stock.index,
-                df_stock["5. volume"].values,
-                color="k",
-                alpha=0.8,
-                width=0.3,
-            )
+        plt.bar(
+            df_stock.index,
+            df_stock["Volume"].values,
+            color="k",
+            alpha=0.8,
+            width=0.3,
+        )
         plt.ylabel("Volume")
         plt.grid(b=True, which="major", color="#666666", linestyle="-")
         plt.minorticks_on()
@@ -0,0 +1,178 @@
+"""Multi-ticker technical indicator scan"""
+__docformat__ = "numpy"
+
+import multiprocessing
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from gamestonk_terminal import market_data
+from gamestonk_terminal.technical_analysis import batch_model
+
+
+def bars_since_cross(series: pd.Series) -> float:
+    """Bars since a series last crossed above zero, e.g. a MACD histogram
+
+    Parameters
+    ----------
+    series : pd.Series
+        Series crossing zero
+
+    Returns
+    -------
+    float
+        0 if the cross happened on the last bar, NaN if the series never crossed above zero
+    """
+    values = series.dropna().values
+    crosses = np.flatnonzero((values[1:] > 0) & (values[:-1] <= 0))
+    if not len(crosses):
+        return np.nan
+    return float(len(values) - 2 - crosses[-1])
+
+
+def scan_ticker(
+    job: Tuple[str, pd.DataFrame, List[Tuple[str, Tuple]], int, int]
+) -> Optional[Dict]:
+    """Compute the indicators of a ticker and summarize their latest values
+
+    Parameters
+    ----------
+    job : Tuple[str, pd.DataFrame, List[Tuple[str, Tuple]], int, int]
+        Ticker, its prices with the market_data.TA_COLUMNS schema, extra indicators and
+        parameter sets as in batch_model.get_indicators, RSI length and SMA length
+
+    Returns
+    -------
+    Optional[Dict]
+        Row of the scan table, None if there are not enough prices for the indicators
+    """
+    ticker, df_ohlcv, l_indicators, rsi_length, sma_length = job
+    if len(df_ohlcv) < max(rsi_length, sma_length, 35):
+        return None
+
+    df_features = batch_model.get_indicators(
+        df_ohlcv,
+        [("rsi", (rsi_length,)), ("macd", ()), ("sma", (sma_length,))] + l_indicators,
+    )
+    close = df_ohlcv["Close"].iloc[-1]
+    d_row = {
+        "Ticker": ticker,
+        "Close": close,
+        "RSI": df_features[f"RSI_{rsi_length}"].iloc[-1],
+        "MACD cross": bars_since_cross(df_features["MACDh_12_26_9"]),
+        "SMA dist %": 100 * (close / df_features[f"SMA_{sma_length}"].iloc[-1] - 1),
+    }
+    d_row.update(
+        df_features.drop(
+            columns=[f"RSI_{rsi_length}", f"SMA_{sma_length}"]
+            + [col for col in df_features.columns if col.endswith("_12_26_9")],
+            errors="ignore",
+        )
+        .iloc[-1]
+        .to_dict()
+    )
+    return d_row
+
+
+def scan(
+    tickers: List[str],
+    start: str,
+    l_indicators: List[Tuple[str, Tuple]],
+    rsi_length: int = 14,
+    sma_length: int = 50,
+    n_jobs: int = 1,
+) -> pd.DataFrame:
+    """Scan the indicators of several tickers, computed in parallel worker processes
+
+    Prices are downloaded concurrently in this process, through the session memo and
+    on-disk cache of market_data, and the indicators of each ticker are computed by a
+    pool of worker processes.
+
+    Parameters
+    ----------
+    tickers : List[str]
+        Stock tickers
+    start : str
+        Start date of the prices
+    l_indicators : List[Tuple[str, Tuple]]
+        Extra indicators and parameter sets, whose latest values are added to the table
+    rsi_length : int
+        Length of the RSI
+    sma_length : int
+        Length of the SMA the close is compared to
+    n_jobs : int
+        Number of worker processes
+
+    Returns
+    -------
+    pd.DataFrame
+        Row per ticker with enough prices, with the latest RSI, bars since the last
+        bullish MACD cross, distance to the SMA and extra indicator values
+    """
+    d_prices = market_data.get_prices_dict(tickers, start=start)
+    l_jobs = [
+        (
+            ticker,
+            market_data.to_ohlcv_frame(df_prices),
+            l_indicators,
+            rsi_length,
+            sma_length,
+        )
+        for ticker, df_prices in d_prices.items()
+    ]
+
+    if n_jobs > 1 and len(l_jobs) > 1:
+        with multiprocessing.get_context("spawn").Pool(
+            processes=min(n_jobs, len(l_jobs))
+        ) as pool:
+            l_rows = pool.map(scan_ticker, l_jobs, chunksize=4)
+    else:
+        l_rows = list(map(scan_ticker, l_jobs))
+
+    l_rows = [d_row for d_row in l_rows if d_row]
+    if not l_rows:
+        return pd.DataFrame()
+
+    return pd.DataFrame(l_rows).set_index("Ticker")
+
+
+def filter_scan(
+    df_scan: pd.DataFrame,
+    rsi_max: Optional[float] = None,
+    rsi_min: Optional[float] = None,
+    n_cross_bars: Optional[int] = None,
+    s_sort: str = "RSI",
+    b_descend: bool = False,
+) -> pd.DataFrame:
+    """Filter and rank a scan table
+
+    Parameters
+    ----------
+    df_scan : pd.DataFrame
+        Scan table, from scan
+    rsi_max : Optional[float]
+        Keep the tickers with an RSI below this value
+    rsi_min : Optional[float]
+        Keep the tickers with an RSI above this value
+    n_cross_bars : Optional[int]
+        Keep the tickers whose MACD crossed above its signal line in these last bars
+    s_sort : str
+        Column to rank the tickers by
+    b_descend : bool
+        Rank in descending order, instead of ascending
+
+    Returns
+    -------
+    pd.DataFrame
+        Ranked tickers meeting every given condition
+    """
+    mask = pd.Series(True, index=df_scan.index)
+    if rsi_max is not None:
+        mask &= df_scan["RSI"] < rsi_max
+    if rsi_min is not None:
+        mask &= df_scan["RSI"] > rsi_min
+    if n_cross_bars is not None:
+        mask &= df_scan["MACD cross"] < n_cross_bars
+
+    return df_scan[mask].sort_values(
+        s_sort, ascending=not b_descend, kind="mergesort", na_position="last"
+    )
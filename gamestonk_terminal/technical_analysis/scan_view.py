@@ -0,0 +1,218 @@
+"""Multi-ticker technical indicator scan view"""
+__docformat__ = "numpy"
+
+import argparse
+import os
+from datetime import datetime, timedelta
+from typing import List
+from gamestonk_terminal.helper_funcs import (
+    check_positive,
+    parse_known_args_and_warn,
+    valid_date,
+)
+from gamestonk_terminal.screener import finviz_view
+from gamestonk_terminal.technical_analysis import batch_view
+from gamestonk_terminal.technical_analysis import scan_model
+
+
+def scan(other_args: List[str], l_tickers: List[str]):
+    """Scan technical indicators of a watchlist, and display the ranked tickers
+
+    Parameters
+    ----------
+    other_args : List[str]
+        Argparse arguments
+    l_tickers : List[str]
+        Tickers scanned when neither a ticker list nor a preset is given
+    """
+    parser = argparse.ArgumentParser(
+        add_help=False,
+        prog="scan",
+        description="""
+            Scan technical indicators of a list of tickers, computed in parallel worker
+            processes, and rank the tickers meeting the conditions. E.g. 'scan -p oversold
+            --rsi-max 30 --cross 5' ranks the tickers of the oversold preset with an RSI
+            below 30 and a bullish MACD crossover in the last 5 bars. Tickers are the given
+            list, the screened tickers of a preset, or else the last screened tickers.
+        """,
+    )
+    parser.add_argument(
+        "-t",
+        "--tickers",
+        dest="l_tickers",
+        type=lambda s: [ticker.strip().upper() for ticker in s.split(",") if ticker],
+        default=None,
+        help="comma separated tickers to scan",
+    )
+    parser.add_argument(
+        "-p",
+        "--preset",
+        dest="s_preset",
+        type=str,
+        default="",
+        help="scan the tickers of this screener preset [Finviz]",
+        choices=[""]
+        + [
+            preset.split(".")[0]
+            for preset in os.listdir(finviz_view.presets_path)
+            if preset[-4:] == ".ini"
+        ],
+    )
+    parser.add_argument(
+        "-l",
+        "--limit",
+        dest="n_limit",
+        type=check_positive,
+        default=0,
+        help="limit of preset tickers to scan",
+    )
+    parser.add_argument(
+        "-s",
+        "--start",
+        type=valid_date,
+        default=datetime.now() - timedelta(days=365),
+        dest="s_start_date",
+        help="start date of the prices",
+    )
+    parser.add_argument(
+        "-i",
+        "--indicators",
+        nargs="+",
+        type=batch_view.parse_indicator,
+        default=[],
+        dest="indicators",
+        help="extra indicators with optional parameter sets, e.g. adx:14 bbands:20-2",
+    )
+    parser.add_argument(
+        "--rsi-length",
+        dest="n_rsi_length",
+        type=check_positive,
+        default=14,
+        help="RSI length",
+    )
+    parser.add_argument(
+        "--sma-length",
+        dest="n_sma_length",
+        type=check_positive,
+        default=50,
+        help="SMA length the close is compared to",
+    )
+    parser.add_argument(
+        "--rsi-max",
+        dest="n_rsi_max",
+        type=float,
+        default=None,
+        help="keep tickers with an RSI below this value, e.g. 30",
+    )
+    parser.add_argument(
+        "--rsi-min",
+        dest="n_rsi_min",
+        type=float,
+        default=None,
+        help="keep tickers with an RSI above this value, e.g. 70",
+    )
+    parser.add_argument(
+        "--cross",
+        dest="n_cross",
+        type=check_positive,
+        default=None,
+        help="keep tickers with a bullish MACD crossover in these last bars",
+    )
+    parser.add_argument(
+        "--sort",
+        dest="s_sort",
+        type=str,
+        default="RSI",
+        help="column to rank tickers by, e.g. RSI, 'MACD cross' or 'SMA dist %%'",
+    )
+    parser.add_argument(
+        "-d",
+        "--descend",
+        action="store_true",
+        default=False,
+        dest="b_descend",
+        help="rank in descending order",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="n_jobs",
+        type=check_positive,
+        default=os.cpu_count() or 1,
+        help="number of worker processes",
+    )
+    parser.add_argument(
+        "-n",
+        "--num",
+        dest="n_num",
+        type=check_positive,
+        default=20,
+        help="number of ranked tickers to display",
+    )
+    parser.add_argument(
+        "-e",
+        "--export",
+        dest="s_export",
+        type=str,
+        default="",
+        help="csv file to export every ranked ticker to",
+    )
+
+    try:
+        ns_parser = parse_known_args_and_warn(parser, other_args)
+        if not ns_parser:
+            return
+
+        if ns_parser.l_tickers:
+            l_tickers = ns_parser.l_tickers
+        elif ns_parser.s_preset:
+            df_screen = finviz_view.get_screener_data(
+                ns_parser.s_preset, "overview", None, ns_parser.n_limit, False
+            )
+            l_tickers = list(df_screen["Ticker"].values)
+
+        if not l_tickers:
+            print("No tickers to scan, use -t or -p, or run a screener first.\n")
+            return
+
+        l_indicators = [
+            (s_name, params)
+            for s_name, l_params in ns_parser.indicators
+            for params in l_params
+        ]
+
+        print(f"Scanning {len(l_tickers)} tickers...")
+        df_scan = scan_model.scan(
+            l_tickers,
+            ns_parser.s_start_date.strftime("%Y-%m-%d"),
+            l_indicators,
+            ns_parser.n_rsi_length,
+            ns_parser.n_sma_length,
+            ns_parser.n_jobs,
+        )
+        if df_scan.empty:
+            print("No prices found for the scanned tickers.\n")
+            return
+
+        df_ranked = scan_model.filter_scan(
+            df_scan,
+            ns_parser.n_rsi_max,
+            ns_parser.n_rsi_min,
+            ns_parser.n_cross,
+            ns_parser.s_sort,
+            ns_parser.b_descend,
+        )
+
+        print(
+            f"{len(df_ranked)} of {len(df_scan)} scanned tickers meet the conditions:"
+        )
+        print(df_ranked.head(ns_parser.n_num).round(2).to_string())
+        print("")
+
+        if ns_parser.s_export:
+            df_ranked.to_csv(ns_parser.s_export)
+            print(f"Exported to {ns_parser.s_export}\n")
+
+    except Exception as e:
+        print(e)
+        print("")
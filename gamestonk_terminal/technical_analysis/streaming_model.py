@@ -0,0 +1,356 @@
+"""Incremental technical indicators, updated in constant time per new bar"""
+__docformat__ = "numpy"
+
+import copy
+from collections import deque
+from typing import Any, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+
+class StreamingEMA:
+    """Exponential moving average, seeded with the simple average of the first length values
+
+    Matches batch_model.ema, bar by bar. As in pandas' ewm, a missing value keeps the
+    average, but still ages it, so that the next value weighs more.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2 / (length + 1)
+        self.value = np.nan
+        self._seed: List[float] = list()
+        self._n_seed_bars = 0
+        self._n_missing = 0
+
+    def update(self, x: float) -> float:
+        if self._n_seed_bars < self.length:
+            # The seed averages the values of the length bars from the first valid one
+            if np.isnan(x) and not self._n_seed_bars:
+                return self.value
+            self._n_seed_bars += 1
+            if not np.isnan(x):
+                self._seed.append(x)
+            if self._n_seed_bars == self.length:
+                self.value = float(np.mean(self._seed))
+            return self.value
+        if np.isnan(x):
+            self._n_missing += 1
+            return self.value
+        old_weight = (1 - self.alpha) ** (self._n_missing + 1)
+        self.value = (old_weight * self.value + self.alpha * x) / (
+            old_weight + self.alpha
+        )
+        self._n_missing = 0
+        return self.value
+
+
+class StreamingSMA:
+    """Simple moving average, from the running sum of a window of the last length values
+
+    As pandas' rolling mean, it is NaN while a missing value is in the window.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self._window: deque = deque(maxlen=length)
+        self._n_missing = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def update(self, x: float) -> float:
+        if len(self._window) == self.length:
+            old = self._window[0]
+            if np.isnan(old):
+                self._n_missing -= 1
+            else:
+                self._sum -= old
+                self._sum_sq -= old * old
+        self._window.append(x)
+        if np.isnan(x):
+            self._n_missing += 1
+        else:
+            self._sum += x
+            self._sum_sq += x * x
+        return self.value
+
+    @property
+    def b_full(self) -> bool:
+        """Whether the window holds length values, none of them missing"""
+        return len(self._window) == self.length and not self._n_missing
+
+    @property
+    def value(self) -> float:
+        if not self.b_full:
+            return np.nan
+        return self._sum / self.length
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the window"""
+        if not self.b_full:
+            return np.nan
+        mean = self._sum / self.length
+        return float(np.sqrt(max(self._sum_sq / self.length - mean * mean, 0.0)))
+
+
+class StreamingRSI:
+    """Relative strength index, with Wilder's moving averages of gains and losses
+
+    Matches batch_model.rma: the averages weigh each past gain and loss by 1 - 1 / length
+    per bar, so that the RSI is the ratio of the decayed sums of gains and losses. Bars
+    without a change, e.g. around a missing close, still decay the sums.
+    """
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self.decay = 1 - 1 / length
+        self.value = np.nan
+        self._prev_close = np.nan
+        self._n_diffs = 0
+        self._sum_gain = 0.0
+        self._sum_loss = 0.0
+
+    def update(self, close: float) -> float:
+        diff = close - self._prev_close
+        self._prev_close = close
+        if np.isnan(diff):
+            self._sum_gain *= self.decay
+            self._sum_loss *= self.decay
+            return self.value
+        self._n_diffs += 1
+        self._sum_gain = self.decay * self._sum_gain + max(diff, 0.0)
+        self._sum_loss = self.decay * self._sum_loss + max(-diff, 0.0)
+        if self._n_diffs >= self.length:
+            total = self._sum_gain + self._sum_loss
+            self.value = 100 * self._sum_gain / total if total else np.nan
+        return self.value
+
+
+class StreamingMACD:
+    """Moving average convergence divergence, its signal line and histogram"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.suffix = f"{fast}_{slow}_{signal}"
+        self._fast = StreamingEMA(fast)
+        self._slow = StreamingEMA(slow)
+        self._signal = StreamingEMA(signal)
+        self.macd = self.signal = np.nan
+
+    def update(self, close: float) -> float:
+        self.macd = self._fast.update(close) - self._slow.update(close)
+        self.signal = self._signal.update(self.macd)
+        return self.macd
+
+    @property
+    def histogram(self) -> float:
+        return self.macd - self.signal
+
+
+class StreamingBBands:
+    """Bollinger bands, from the running mean and standard deviation of the close"""
+
+    def __init__(self, length: int = 5, std: float = 2):
+        self.suffix = f"{length}_{float(std)}"
+        self.n_std = std
+        self._sma = StreamingSMA(length)
+
+    def update(self, close: float) -> float:
+        return self._sma.update(close)
+
+    @property
+    def mid(self) -> float:
+        return self._sma.value
+
+    @property
+    def lower(self) -> float:
+        return self._sma.value - self.n_std * self._sma.std
+
+    @property
+    def upper(self) -> float:
+        return self._sma.value + self.n_std * self._sma.std
+
+
+class StreamingOBV:
+    """On balance volume, NaN on the bars missing their volume"""
+
+    def __init__(self):
+        self.value = 0.0
+        self._total = 0.0
+        self._prev_close = np.nan
+        self._b_first = True
+
+    def update(self, close: float, volume: float) -> float:
+        diff = close - self._prev_close
+        self._prev_close = close
+        if self._b_first:
+            # The first bar counts as an up bar, as in pandas_ta
+            sign = 1.0
+            self._b_first = False
+        else:
+            sign = 0.0 if np.isnan(diff) else np.sign(diff)
+        if np.isnan(volume):
+            self.value = np.nan
+        else:
+            self._total += sign * volume
+            self.value = self._total
+        return self.value
+
+
+class StreamingAD:
+    """Chaikin accumulation/distribution line, NaN on the bars missing their volume"""
+
+    def __init__(self):
+        self.value = 0.0
+        self._total = 0.0
+
+    def update(self, high: float, low: float, close: float, volume: float) -> float:
+        if np.isnan(volume):
+            self.value = np.nan
+            return self.value
+        # Bars missing a price, or without a range, add nothing
+        if high != low and not np.isnan(high + low + close):
+            self._total += ((close - low) - (high - close)) / (high - low) * volume
+        self.value = self._total
+        return self.value
+
+
+class StreamingIndicators:
+    """Set of incremental indicators of a ticker, fed only with the bars not seen yet
+
+    E.g., reloading intraday prices with one extra bar costs one update per indicator,
+    instead of a recomputation over the whole history. The last bar seen may still be
+    revised, e.g. while its minute is in progress, so the indicators before it are kept
+    to apply it again.
+
+    Parameters
+    ----------
+    ema : List[int]
+        EMA lengths
+    sma : List[int]
+        SMA lengths
+    rsi : List[int]
+        RSI lengths
+    macd : List[tuple]
+        MACD fast, slow and signal lengths
+    bbands : List[tuple]
+        Bollinger bands length and number of standard deviations
+    obv : bool
+        Compute the on balance volume
+    ad : bool
+        Compute the accumulation/distribution line
+    """
+
+    def __init__(
+        self,
+        ema: Optional[List[int]] = None,
+        sma: Optional[List[int]] = None,
+        rsi: Optional[List[int]] = None,
+        macd: Optional[List[tuple]] = None,
+        bbands: Optional[List[tuple]] = None,
+        obv: bool = False,
+        ad: bool = False,
+    ):
+        self.ema = {f"EMA_{n}": StreamingEMA(n) for n in ema or []}
+        self.sma = {f"SMA_{n}": StreamingSMA(n) for n in sma or []}
+        self.rsi = {f"RSI_{n}": StreamingRSI(n) for n in rsi or []}
+        self.macd = [StreamingMACD(*params) for params in macd or []]
+        self.bbands = [StreamingBBands(*params) for params in bbands or []]
+        self.obv = StreamingOBV() if obv else None
+        self.ad = StreamingAD() if ad else None
+        self.last_index = None
+        # Last bar seen, and the indicators before it
+        self._last_bar: Dict[str, float] = dict()
+        self._state_before_last: tuple = ()
+
+    def _get_state(self) -> tuple:
+        return copy.deepcopy(
+            (self.ema, self.sma, self.rsi, self.macd, self.bbands, self.obv, self.ad)
+        )
+
+    def _set_state(self, state: tuple):
+        (
+            self.ema,
+            self.sma,
+            self.rsi,
+            self.macd,
+            self.bbands,
+            self.obv,
+            self.ad,
+        ) = copy.deepcopy(state)
+
+    def update_bar(self, bar: Dict[str, float]):
+        """Update every indicator with a bar of the market_data.TA_COLUMNS schema"""
+        close = bar["Close"]
+        l_close_indicators: List[Any] = [
+            *self.ema.values(),
+            *self.sma.values(),
+            *self.rsi.values(),
+            *self.macd,
+            *self.bbands,
+        ]
+        for indicator in l_close_indicators:
+            indicator.update(close)
+        if self.obv:
+            self.obv.update(close, bar["Volume"])
+        if self.ad:
+            self.ad.update(bar["High"], bar["Low"], close, bar["Volume"])
+
+    @property
+    def values(self) -> Dict[str, float]:
+        """Latest value of every indicator, named as in batch_model"""
+        l_indicators: List[Dict[str, Any]] = [self.ema, self.sma, self.rsi]
+        d_values = {
+            name: indicator.value
+            for d_indicators in l_indicators
+            for name, indicator in d_indicators.items()
+        }
+        for macd in self.macd:
+            d_values[f"MACD_{macd.suffix}"] = macd.macd
+            d_values[f"MACDh_{macd.suffix}"] = macd.histogram
+            d_values[f"MACDs_{macd.suffix}"] = macd.signal
+        for bbands in self.bbands:
+            d_values[f"BBL_{bbands.suffix}"] = bbands.lower
+            d_values[f"BBM_{bbands.suffix}"] = bbands.mid
+            d_values[f"BBU_{bbands.suffix}"] = bbands.upper
+        if self.obv:
+            d_values["OBV"] = self.obv.value
+        if self.ad:
+            d_values["AD"] = self.ad.value
+        return d_values
+
+    def update(self, df_ohlcv: pd.DataFrame) -> pd.DataFrame:
+        """Update the indicators with the bars after the last one seen, and with the last
+        one seen if it was revised
+
+        Parameters
+        ----------
+        df_ohlcv : pd.DataFrame
+            Prices with the market_data.TA_COLUMNS schema, sorted by ascending date.
+            Only the bars from the last one seen are read.
+
+        Returns
+        -------
+        pd.DataFrame
+            Indicator values at each new or revised bar, empty if there is none
+        """
+        if self.last_index is not None:
+            df_ohlcv = df_ohlcv.loc[df_ohlcv.index >= self.last_index]
+            if len(df_ohlcv) and df_ohlcv.index[0] == self.last_index:
+                if next(df_ohlcv.itertuples(index=False))._asdict() == self._last_bar:
+                    df_ohlcv = df_ohlcv.iloc[1:]
+                else:
+                    self._set_state(self._state_before_last)
+
+        l_values = list()
+        for i, bar in enumerate(df_ohlcv.itertuples(index=False)):
+            d_bar = bar._asdict()
+            if i == len(df_ohlcv) - 1:
+                self._state_before_last = self._get_state()
+                self._last_bar = d_bar
+            self.update_bar(d_bar)
+            l_values.append(self.values)
+        if len(df_ohlcv):
+            self.last_index = df_ohlcv.index[-1]
+
+        return pd.DataFrame(l_values, index=df_ohlcv.index)
@@ -9,6 +9,7 @@ import matplotlib.pyplot as plt
 from prompt_toolkit.completion import NestedCompleter
 
 from gamestonk_terminal import feature_flags as gtff
+from gamestonk_terminal import market_data
 from gamestonk_terminal.helper_funcs import get_flair
 from gamestonk_terminal.menu import session
 from gamestonk_terminal.technical_analysis import momentum as ta_momentum
@@ -20,6 +21,8 @@ from gamestonk_terminal.technical_analysis import finbrain_view
 from gamestonk_terminal.technical_analysis import tradingview_view
 from gamestonk_terminal.technical_analysis import finviz_view
 from gamestonk_terminal.technical_analysis import finnhub_view
+from gamestonk_terminal.technical_analysis import batch_view
+from gamestonk_terminal.technical_analysis import scan_view
 
 
 class TechnicalAnalysisController:
@@ -46,6 +49,8 @@ class TechnicalAnalysisController:
         "bbands",
         "ad",
         "obv",
+        "batch",
+        "scan",
     ]
 
     def __init__(
@@ -60,6 +65,8 @@ class TechnicalAnalysisController:
         self.start = start
         self.interval = interval
         self.stock = stock
+        # Every indicator reads the same canonical OHLCV frame, whatever the source
+        self.ohlcv = market_data.to_ohlcv_frame(stock)
 
         self.ta_parser = argparse.ArgumentParser(add_help=False, prog="ta")
         self.ta_parser.add_argument(
@@ -109,6 +116,9 @@ class TechnicalAnalysisController:
         print("   ad          chaikin accumulation/distribution line values")
         print("   obv         on balance volume")
         print("")
+        print("   batch       compute and export several indicators at once")
+        print("   scan        scan technical indicators of a list of tickers")
+        print("")
 
     def switch(self, an_input: str):
         """Process and dispatch input
@@ -157,55 +167,63 @@ class TechnicalAnalysisController:
     # OVERLAP
     def call_ema(self, other_args: List[str]):
         """Process ema command"""
-        ta_overlap.ema(other_args, self.ticker, self.interval, self.stock)
+        ta_overlap.ema(other_args, self.ticker, self.ohlcv)
 
     def call_sma(self, other_args: List[str]):
         """Process sma command"""
-        ta_overlap.sma(other_args, self.ticker, self.interval, self.stock)
+        ta_overlap.sma(other_args, self.ticker, self.ohlcv)
 
     def call_vwap(self, other_args: List[str]):
         """Process vwap command"""
-        ta_overlap.vwap(other_args, self.ticker, self.interval, self.stock)
+        ta_overlap.vwap(other_args, self.ticker, self.ohlcv)
 
     # MOMENTUM
     def call_cci(self, other_args: List[str]):
         """Process cci command"""
-        ta_momentum.cci(other_args, self.ticker, self.interval, self.stock)
+        ta_momentum.cci(other_args, self.ticker, self.ohlcv)
 
     def call_macd(self, other_args: List[str]):
         """Process macd command"""
-        ta_momentum.macd(other_args, self.ticker, self.interval, self.stock)
+        ta_momentum.macd(other_args, self.ticker, self.ohlcv)
 
     def call_rsi(self, other_args: List[str]):
         """Process rsi command"""
-        ta_momentum.rsi(other_args, self.ticker, self.interval, self.stock)
+        ta_momentum.rsi(other_args, self.ticker, self.ohlcv)
 
     def call_stoch(self, other_args: List[str]):
         """Process stoch command"""
-        ta_momentum.stoch(other_args, self.ticker, self.interval, self.stock)
+        ta_momentum.stoch(other_args, self.ticker, self.ohlcv)
 
     # TREND
     def call_adx(self, other_args: List[str]):
         """Process adx command"""
-        ta_trend.adx(other_args, self.ticker, self.interval, self.stock)
+        ta_trend.adx(other_args, self.ticker, self.ohlcv)
 
     def call_aroon(self, other_args: List[str]):
         """Process aroon command"""
-        ta_trend.aroon(other_args, self.ticker, self.interval, self.stock)
+        ta_trend.aroon(other_args, self.ticker, self.ohlcv)
 
     # VOLATILITY
     def call_bbands(self, other_args: List[str]):
         """Process bbands command"""
-        ta_volatility.bbands(other_args, self.ticker, self.interval, self.stock)
+        ta_volatility.bbands(other_args, self.ticker, self.ohlcv)
 
     # VOLUME
     def call_ad(self, other_args: List[str]):
         """Process ad command"""
-        ta_volume.ad(other_args, self.ticker, self.interval, self.stock)
+        ta_volume.ad(other_args, self.ticker, self.ohlcv)
 
     def call_obv(self, other_args: List[str]):
         """Process obv command"""
-        ta_volume.obv(other_args, self.ticker, self.interval, self.stock)
+        ta_volume.obv(other_args, self.ticker, self.ohlcv)
+
+    def call_batch(self, other_args: List[str]):
+        """Process batch command"""
+        batch_view.batch(other_args, self.ticker, self.ohlcv)
+
+    def call_scan(self, other_args: List[str]):
+        """Process scan command"""
+        scan_view.scan(other_args, [self.ticker])
 
 
 def menu(
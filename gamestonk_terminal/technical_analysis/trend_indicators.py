@@ -13,7 +13,7 @@ from gamestonk_terminal import feature_flags as gtff
 register_matplotlib_converters()
 
 
-def adx(l_args, s_ticker, s_interval, df_stock):
+def adx(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="adx",
@@ -66,29 +66,15 @@ def adx(l_args, s_ticker, s_interval, df_stock):
         if not ns_parser:
             return
 
-        # Daily
-        if s_interval == "1440min":
-            df_ta = ta.adx(
-                high=df_stock["2. high"],
-                low=df_stock["3. low"],
-                close=df_stock["5. adjusted close"],
-                length=ns_parser.n_length,
-                scalar=ns_parser.n_scalar,
-                drift=ns_parser.n_drift,
-                offset=ns_parser.n_offset,
-            ).dropna()
-
-        # Intraday
-        else:
-            df_ta = ta.adx(
-                high=df_stock["2. high"],
-                low=df_stock["3. low"],
-                close=df_stock["4. close"],
-                length=ns_parser.n_length,
-                scalar=ns_parser.n_scalar,
-                drift=ns_parser.n_drift,
-                offset=ns_parser.n_offset,
-            ).dropna()
+        df_ta = ta.adx(
+            high=df_stock["High"],
+            low=df_stock["Low"],
+            close=df_stock["Close"],
+            length=ns_parser.n_length,
+            scalar=ns_parser.n_scalar,
+            drift=ns_parser.n_drift,
+            offset=ns_parser.n_offset,
+        ).dropna()
 
         plot_adx(df_stock, s_ticker, df_ta)
 
@@ -102,7 +88,7 @@ def adx(l_args, s_ticker, s_interval, df_stock):
 def plot_adx(df_stock, s_ticker, df_ta):
     plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
     plt.subplot(211)
-    plt.plot(df_stock.index, df_stock["4. close"].values, "k", lw=2)
+    plt.plot(df_stock.index, df_stock["Close"].values, "k", lw=2)
     plt.title(f"Average Directional Movement Index (ADX) on {s_ticker}")
     plt.xlim(df_stock.index[0], df_stock.index[-1])
     plt.ylabel("Share Price ($)")
@@ -134,7 +120,7 @@ def plot_adx(df_stock, s_ticker, df_ta):
     plt.show()
 
 
-def aroon(l_args, s_ticker, s_interval, df_stock):
+def aroon(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="aroon",
@@ -186,8 +172,8 @@ def aroon(l_args, s_ticker, s_interval, df_stock):
             return
 
         df_ta = ta.aroon(
-            high=df_stock["2. high"],
-            low=df_stock["3. low"],
+            high=df_stock["High"],
+            low=df_stock["Low"],
             length=ns_parser.n_length,
             scalar=ns_parser.n_scalar,
             offset=ns_parser.n_offset,
@@ -195,12 +181,7 @@ def aroon(l_args, s_ticker, s_interval, df_stock):
 
         plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
         plt.subplot(311)
-        # Daily
-        if s_interval == "1440min":
-            plt.plot(df_stock.index, df_stock["5. adjusted close"].values, "k", lw=2)
-        # Intraday
-        else:
-            plt.plot(df_stock.index, df_stock["4. close"].values, "k", lw=2)
+        plt.plot(df_stock.index, df_stock["Close"].values, "k", lw=2)
 
         plt.title(f"Aroon on {s_ticker}")
         plt.xlim(df_stock.index[0], df_stock.index[-1])
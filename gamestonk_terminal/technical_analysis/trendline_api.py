@@ -1,9 +1,11 @@
 """Technical Analysis Trendline Module"""
 __docformat__ = "numpy"
 
+from typing import List, Tuple
+import numpy as np
 from pandas.core.frame import DataFrame
-import yfinance as yf
-from scipy.stats import linregress
+
+from gamestonk_terminal import market_data
 
 
 def load_ticker(ticker: str, start_date: str) -> DataFrame:
@@ -23,12 +25,11 @@ def load_ticker(ticker: str, start_date: str) -> DataFrame:
         A Panda's data frame with columns Open, High, Low, Close, Adj Close, Volume, date_id, OC-High, OC-Low.
     """
     # print(f"Start date: {start_date}")
-    df_data = yf.download(ticker, start=start_date, progress=False)
+    df_data = market_data.get_prices(ticker, start=start_date)
 
-    df_data["date_id"] = (df_data.index.date - df_data.index.date.min()).astype(
-        "timedelta64[D]"
-    )
-    df_data["date_id"] = df_data["date_id"].dt.days + 1
+    # Days since the first date, shared by the intraday bars of a day
+    df_dates = df_data.index.normalize()
+    df_data["date_id"] = (df_dates - df_dates.min()).days + 1
 
     df_data["OC_High"] = df_data[["Open", "Close"]].max(axis=1)
     df_data["OC_Low"] = df_data[["Open", "Close"]].min(axis=1)
@@ -36,9 +37,28 @@ def load_ticker(ticker: str, start_date: str) -> DataFrame:
     return df_data
 
 
+def _upper_hull(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Upper convex hull of points sorted by x, with a single point per x"""
+    l_hull: List[int] = list()
+    for idx in range(len(x)):
+        # Drop the last hull point while it does not make a clockwise turn
+        while len(l_hull) >= 2:
+            o, a = l_hull[-2], l_hull[-1]
+            cross = (x[a] - x[o]) * (y[idx] - y[o]) - (y[a] - y[o]) * (x[idx] - x[o])
+            if cross < 0:
+                break
+            l_hull.pop()
+        l_hull.append(idx)
+    return x[l_hull], y[l_hull]
+
+
 def find_trendline(df_data: DataFrame, y_key: str, high_low: str = "high") -> DataFrame:
     """Attempts to find a trend line based on y_key column from a given stock ticker data frame.
 
+    The trend line is the line with every point below it (high) or above it (low) that is the
+    closest to the points overall. It is the edge of the upper (high) or lower (low) convex
+    hull of (date_id, y_key) above the mean date_id, found in O(n log n).
+
     Parameters
     ----------
     df_data : DataFrame
@@ -58,35 +78,27 @@ def find_trendline(df_data: DataFrame, y_key: str, high_low: str = "high") -> Da
         If no trend was found,
             An original Panda's data frame
     """
-
-    for iteration in [3, 4, 5, 6, 7]:
-        df_temp = df_data.copy()
-        while len(df_temp) > iteration:
-            reg = linregress(
-                x=df_temp["date_id"],
-                y=df_temp[y_key],
-            )
-
-            if high_low == "high":
-                df_temp = df_temp.loc[
-                    df_temp[y_key] > reg[0] * df_temp["date_id"] + reg[1]
-                ]
-            else:
-                df_temp = df_temp.loc[
-                    df_temp[y_key] < reg[0] * df_temp["date_id"] + reg[1]
-                ]
-
-        if len(df_temp) > 1:
-            break
-
-    if len(df_temp) == 1:
+    df_valid = df_data[["date_id", y_key]].dropna()
+    x = df_valid["date_id"].values.astype(float)
+    # The lower hull is the upper hull of the points mirrored around the x axis
+    sign = 1.0 if high_low == "high" else -1.0
+    y = sign * df_valid[y_key].values.astype(float)
+
+    # Intraday bars share their date_id, and only the most extreme one can be on the hull
+    order = np.lexsort((y, x))
+    x_sorted, y_sorted = x[order], y[order]
+    last_of_x = np.append(x_sorted[1:] != x_sorted[:-1], True)
+    hull_x, hull_y = _upper_hull(x_sorted[last_of_x], y_sorted[last_of_x])
+
+    if len(hull_x) < 2:
         return df_data
 
-    reg = linregress(
-        x=df_temp["date_id"],
-        y=df_temp[y_key],
-    )
+    # The summed distance of the points to a line above them is the smallest for the
+    # hull edge over their mean date_id
+    idx = int(np.clip(np.searchsorted(hull_x, x.mean()), 1, len(hull_x) - 1))
+    slope = (hull_y[idx] - hull_y[idx - 1]) / (hull_x[idx] - hull_x[idx - 1])
+    intercept = hull_y[idx] - slope * hull_x[idx]
 
-    df_data[f"{y_key}_trend"] = reg[0] * df_data["date_id"] + reg[1]
+    df_data[f"{y_key}_trend"] = sign * (slope * df_data["date_id"] + intercept)
 
     return df_data
@@ -13,7 +13,7 @@ from gamestonk_terminal import feature_flags as gtff
 register_matplotlib_converters()
 
 
-def bbands(l_args, s_ticker, s_interval, df_stock):
+def bbands(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="bbands",
@@ -67,33 +67,16 @@ def bbands(l_args, s_ticker, s_interval, df_stock):
         if not ns_parser:
             return
 
-        # Daily
-        if s_interval == "1440min":
-            df_ta = ta.bbands(
-                close=df_stock["5. adjusted close"],
-                length=ns_parser.n_length,
-                std=ns_parser.n_std,
-                mamode=ns_parser.s_mamode,
-                offset=ns_parser.n_offset,
-            ).dropna()
-
-        # Intraday
-        else:
-            df_ta = ta.bbands(
-                close=df_stock["4. close"],
-                length=ns_parser.n_length,
-                std=ns_parser.n_std,
-                mamode=ns_parser.s_mamode,
-                offset=ns_parser.n_offset,
-            ).dropna()
+        df_ta = ta.bbands(
+            close=df_stock["Close"],
+            length=ns_parser.n_length,
+            std=ns_parser.n_std,
+            mamode=ns_parser.s_mamode,
+            offset=ns_parser.n_offset,
+        ).dropna()
 
         plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
-        if s_ticker == "1440min":
-            plt.plot(
-                df_stock.index, df_stock["5. adjusted close"].values, color="k", lw=3
-            )
-        else:
-            plt.plot(df_stock.index, df_stock["4. close"].values, color="k", lw=3)
+        plt.plot(df_stock.index, df_stock["Close"].values, color="k", lw=3)
         plt.plot(df_ta.index, df_ta.iloc[:, 0].values, "r", lw=2)
         plt.plot(df_ta.index, df_ta.iloc[:, 1].values, "b", lw=1.5, ls="--")
         plt.plot(df_ta.index, df_ta.iloc[:, 2].values, "g", lw=2)
@@ -13,7 +13,7 @@ from gamestonk_terminal import feature_flags as gtff
 register_matplotlib_converters()
 
 
-def ad(l_args, s_ticker, s_interval, df_stock):
+def ad(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="ad",
@@ -53,56 +53,29 @@ def ad(l_args, s_ticker, s_interval, df_stock):
         if not ns_parser:
             return
 
-        # Daily
-        if s_interval == "1440min":
-            # Use open stock values
-            if ns_parser.b_use_open:
-                df_ta = ta.ad(
-                    high=df_stock["2. high"],
-                    low=df_stock["3. low"],
-                    close=df_stock["5. adjusted close"],
-                    volume=df_stock["6. volume"],
-                    offset=ns_parser.n_offset,
-                    open_=df_stock["1. open"],
-                ).dropna()
-            # Do not use open stock values
-            else:
-                df_ta = ta.ad(
-                    high=df_stock["2. high"],
-                    low=df_stock["3. low"],
-                    close=df_stock["5. adjusted close"],
-                    volume=df_stock["6. volume"],
-                    offset=ns_parser.n_offset,
-                ).dropna()
-
-        # Intraday
+        # Use open stock values
+        if ns_parser.b_use_open:
+            df_ta = ta.ad(
+                high=df_stock["High"],
+                low=df_stock["Low"],
+                close=df_stock["Close"],
+                volume=df_stock["Volume"],
+                offset=ns_parser.n_offset,
+                open_=df_stock["Open"],
+            ).dropna()
+        # Do not use open stock values
         else:
-            # Use open stock values
-            if ns_parser.b_use_open:
-                df_ta = ta.ad(
-                    high=df_stock["2. high"],
-                    low=df_stock["3. low"],
-                    close=df_stock["4. close"],
-                    volume=df_stock["5. volume"],
-                    offset=ns_parser.n_offset,
-                    open_=df_stock["1. open"],
-                ).dropna()
-            # Do not use open stock values
-            else:
-                df_ta = ta.ad(
-                    high=df_stock["2. high"],
-                    low=df_stock["3. low"],
-                    close=df_stock["4. close"],
-                    volume=df_stock["5. volume"],
-                    offset=ns_parser.n_offset,
-                ).dropna()
+            df_ta = ta.ad(
+                high=df_stock["High"],
+                low=df_stock["Low"],
+                close=df_stock["Close"],
+                volume=df_stock["Volume"],
+                offset=ns_parser.n_offset,
+            ).dropna()
 
         plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
         axPrice = plt.subplot(211)
-        if s_interval == "1440min":
-            plt.plot(df_stock.index, df_stock["5. adjusted close"].values, "k", lw=2)
-        else:
-            plt.plot(df_stock.index, df_stock["4. close"].values, "k", lw=2)
+        plt.plot(df_stock.index, df_stock["Close"].values, "k", lw=2)
         plt.title(f"Accumulation/Distribution Line (AD) on {s_ticker}")
         plt.xlim(df_stock.index[0], df_stock.index[-1])
         plt.ylabel("Share Price ($)")
@@ -110,22 +83,13 @@ def ad(l_args, s_ticker, s_interval, df_stock):
         plt.minorticks_on()
         plt.grid(b=True, which="minor", color="#999999", linestyle="-", alpha=0.2)
         _ = axPrice.twinx()
-        if s_interval == "1440min":
-            plt.bar(
-                df_stock.index,
-                df_stock["6. volume"].values,
-                color="k",
-                alpha=0.8,
-                width=0.3,
-            )
-        else:
-            plt.bar(
-                df_stock.index,
-                df_stock["5. volume"].values,
-                color="k",
-                alpha=0.8,
-                width=0.3,
-            )
+        plt.bar(
+            df_stock.index,
+            df_stock["Volume"].values,
+            color="k",
+            alpha=0.8,
+            width=0.3,
+        )
         plt.subplot(212)
         plt.plot(df_ta.index, df_ta.values, "b", lw=1)
         plt.xlim(df_stock.index[0], df_stock.index[-1])
@@ -148,7 +112,7 @@ def ad(l_args, s_ticker, s_interval, df_stock):
         return
 
 
-def obv(l_args, s_ticker, s_interval, df_stock):
+def obv(l_args, s_ticker, df_stock):
     parser = argparse.ArgumentParser(
         add_help=False,
         prog="obv",
@@ -178,28 +142,15 @@ def obv(l_args, s_ticker, s_interval, df_stock):
         if not ns_parser:
             return
 
-        # Daily
-        if s_interval == "1440min":
-            df_ta = ta.obv(
-                close=df_stock["5. adjusted close"],
-                volume=df_stock["6. volume"],
-                offset=ns_parser.n_offset,
-            ).dropna()
-
-        # Intraday
-        else:
-            df_ta = ta.obv(
-                close=df_stock["4. close"],
-                volume=df_stock["5. volume"],
-                offset=ns_parser.n_offset,
-            ).dropna()
+        df_ta = ta.obv(
+            close=df_stock["Close"],
+            volume=df_stock["Volume"],
+            offset=ns_parser.n_offset,
+        ).dropna()
 
         plt.figure(figsize=plot_autoscale(), dpi=PLOT_DPI)
         axPrice = plt.subplot(211)
-        if s_interval == "1440min":
-            plt.plot(df_stock.index, df_stock["5. adjusted close"].values, "k", lw=2)
-        else:
-            plt.plot(df_stock.index, df_stock["4. close"].values, "k", lw=2)
+        plt.plot(df_stock.index, df_stock["Close"].values, "k", lw=2)
         plt.title(f"On-Balance Volume (OBV) on {s_ticker}")
         plt.xlim(df_stock.index[0], df_stock.index[-1])
         plt.ylabel("Share Price ($)")
@@ -207,22 +158,13 @@ def obv(l_args, s_ticker, s_interval, df_stock):
         plt.minorticks_on()
         plt.grid(b=True, which="minor", color="#999999", linestyle="-", alpha=0.2)
         _ = axPrice.twinx()
-        if s_interval == "1440min":
-            plt.bar(
-                df_stock.index,
-                df_stock["6. volume"].values,
-                color="k",
-                alpha=0.8,
-                width=0.3,
-            )
-        else:
-            plt.bar(
-                df_stock.index,
-                df_stock["5. volume"].values,
-                color="k",
-                alpha=0.8,
-                width=0.3,
-            )
+        plt.bar(
+            df_stock.index,
+            df_stock["Volume"].values,
+            color="k",
+            alpha=0.8,
+            width=0.3,
+        )
         plt.subplot(212)
         plt.plot(df_ta.index, df_ta.values, "b", lw=1)
         plt.xlim(df_stock.index[0], df_stock.index[-1])
@@ -0,0 +1,30 @@
+""" backtesting/bt_helper.py tests """
+import unittest
+from unittest import mock
+import pandas as pd
+
+from gamestonk_terminal.backtesting import bt_helper
+
+
+def mock_adjusted_closes(tickers, start=None):
+    return pd.DataFrame(
+        {tickers[0]: [1.0, 2.0, 3.0]},
+        index=pd.date_range(start, periods=3),
+    )
+
+
+class TestBtHelper(unittest.TestCase):
+    def setUp(self):
+        bt_helper.clear_data()
+
+    @mock.patch("gamestonk_terminal.market_data.get_adjusted_closes")
+    def test_get_data_fetched_once(self, mock_get_adjusted_closes):
+        mock_get_adjusted_closes.side_effect = mock_adjusted_closes
+
+        prices = bt_helper.get_data("GME", "2021-01-04")
+        same_prices = bt_helper.get_data("gme", pd.Timestamp("2021-01-04"))
+        bt_helper.get_data("spy", "2021-01-04")
+
+        self.assertIs(prices, same_prices)
+        self.assertEqual(list(prices.columns), ["gme"])
+        self.assertEqual(mock_get_adjusted_closes.call_count, 2)
@@ -0,0 +1,42 @@
+""" backtesting/sweep_view.py tests """
+import unittest
+from unittest import mock
+
+from gamestonk_terminal.backtesting import sweep_view
+
+
+class TestBtSweepView(unittest.TestCase):
+    def test_parse_range(self):
+        self.assertEqual(sweep_view.parse_range("5:20:5"), [5, 10, 15, 20])
+        self.assertEqual(sweep_view.parse_range("3:5"), [3, 4, 5])
+        self.assertEqual(sweep_view.parse_range("14"), [14])
+
+    def test_get_sweep_jobs(self):
+        l_jobs = sweep_view.get_sweep_jobs("rsi", [30, 70], [50, 70], 14, False)
+
+        # Combinations whose low level is not below the high level are skipped
+        self.assertEqual(
+            l_jobs, [("rsi", (14, 30, 50), False), ("rsi", (14, 30, 70), False)]
+        )
+
+    @mock.patch.object(sweep_view, "get_sweep_jobs", return_value=[])
+    def test_sweep_levels(self, mock_get_sweep_jobs):
+        sweep_view.sweep(
+            "aapl", "2020-01-01", ["rsi", "--low", "20:30:10", "-u", "70", "-l", "50"]
+        )
+        sweep_view.sweep("aapl", "2020-01-01", ["ema_cross", "-s", "10", "-l", "50"])
+
+        # The long EMA periods are not the low RSI levels
+        self.assertEqual(
+            mock_get_sweep_jobs.call_args_list,
+            [
+                mock.call("rsi", [20, 30], [70], 14, True),
+                mock.call("ema_cross", [10], [50], 14, True),
+            ],
+        )
+
+    @mock.patch.object(sweep_view.bt_helper, "get_data")
+    def test_sweep_fee_with_bt(self, mock_get_data):
+        sweep_view.sweep("aapl", "2020-01-01", ["ema_cross", "--bt", "--fee", "5"])
+
+        mock_get_data.assert_not_called()
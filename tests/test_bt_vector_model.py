@@ -0,0 +1,92 @@
+""" backtesting/vector_model.py tests """
+import unittest
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.backtesting import vector_model
+
+try:
+    from gamestonk_terminal.backtesting import bt_helper
+
+    B_BT = True
+except ImportError:
+    B_BT = False
+
+
+class TestBtVectorModel(unittest.TestCase):
+    def setUp(self):
+        self.prices = pd.Series(
+            [100.0, 110.0, 99.0, 99.0, 108.9],
+            index=pd.date_range("2021-01-04", periods=5),
+        )
+
+    def test_backtest_positions_earn_next_day(self):
+        positions = pd.Series([1.0, -1.0, 0.0, 1.0, 1.0], index=self.prices.index)
+
+        equity = vector_model.backtest(self.prices, positions)
+
+        # Long on day 1 (+10%), short on day 2 (+10%), out on day 3, long on day 4 (+10%)
+        np.testing.assert_allclose(equity.values, [100, 110, 121, 121, 133.1])
+
+    def test_backtest_fee(self):
+        positions = pd.Series(1.0, index=self.prices.index)
+
+        equity = vector_model.backtest(self.prices, positions, fee=0.01)
+
+        # Only the initial buy is charged
+        self.assertAlmostEqual(equity.iloc[-1], 108.9 * 0.99)
+
+    def test_get_stats(self):
+        stats = vector_model.get_stats(self.prices)
+
+        self.assertAlmostEqual(stats["total_return"], 0.089)
+        self.assertAlmostEqual(stats["max_drawdown"], -0.1)
+        self.assertAlmostEqual(stats["best_day"], 0.1)
+        self.assertEqual(set(stats), set(vector_model.STATS_LABELS))
+
+
+@unittest.skipIf(not B_BT, "bt is not installed")
+class TestBtVectorModelParity(unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        self.prices = pd.DataFrame(
+            {"abc": 100 * np.exp(np.cumsum(random.normal(0, 0.02, size=300)))},
+            index=pd.bdate_range("2020-01-01", periods=300),
+        )
+
+    def assert_parity(self, bt_backtest, positions):
+        bt_helper.bt.run(bt_backtest)
+        # bt 0.2.9 computes res.stats on the whole strategy prices, from its virtual
+        # first row, while later versions start them the day before the first trade
+        bt_stats = bt_backtest.strategy.prices.calc_perf_stats()
+        stats = vector_model.get_stats(
+            vector_model.backtest(self.prices["abc"], positions)
+        )
+
+        for stat, value in stats.items():
+            # ffn 0.3.6 takes the standard deviation of the negative returns as the
+            # downside deviation of the Sortino ratio, later versions their mean square
+            if stat == "daily_sortino":
+                continue
+            # bt trades whole shares, hence the tolerance
+            np.testing.assert_allclose(
+                value, getattr(bt_stats, stat), rtol=1e-3, atol=1e-4, err_msg=stat
+            )
+
+    def test_ema(self):
+        self.assert_parity(
+            bt_helper.ema_backtest(self.prices, 20),
+            vector_model.ema_positions(self.prices["abc"], 20),
+        )
+
+    def test_ema_cross(self):
+        self.assert_parity(
+            bt_helper.ema_cross_backtest(self.prices, 10, 30, True),
+            vector_model.ema_cross_positions(self.prices["abc"], 10, 30, True),
+        )
+
+    def test_rsi(self):
+        self.assert_parity(
+            bt_helper.rsi_backtest(self.prices, 14, 30, 70, True),
+            vector_model.rsi_positions(self.prices["abc"], 14, 30, 70, True),
+        )
@@ -0,0 +1,50 @@
+""" finra_ats_view.py tests """
+import unittest
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from gamestonk_terminal.discovery import finra_ats_view
+
+
+class TestDiscoveryFinraAtsView(unittest.TestCase):
+    def test_get_regression_slopes(self):
+        rng = np.random.default_rng(0)
+        weeks = pd.date_range("2021-01-04", periods=20, freq="W-MON")
+        df_ats = pd.DataFrame(
+            {
+                "issueSymbolIdentifier": np.repeat(["GME", "AMC", "BB"], len(weeks)),
+                "weekStartDateInt": np.tile(
+                    (weeks - pd.Timestamp(0)).total_seconds(), 3
+                ),
+                "totalWeeklyShareQuantity": rng.integers(0, 1_000_000, 3 * len(weeks)),
+            }
+        ).sample(frac=1, random_state=0)
+        # A ticker with a single week of data has no slope
+        df_ats = pd.concat(
+            [
+                df_ats,
+                pd.DataFrame(
+                    {
+                        "issueSymbolIdentifier": ["NOK"],
+                        "weekStartDateInt": [1.6e9],
+                        "totalWeeklyShareQuantity": [100],
+                    }
+                ),
+            ],
+            ignore_index=True,
+        )
+
+        slopes = finra_ats_view.get_regression_slopes(df_ats)
+
+        self.assertEqual(sorted(slopes.index), ["AMC", "BB", "GME"])
+        self.assertTrue(slopes.is_monotonic_decreasing)
+        for symbol, slope in slopes.items():
+            df_symbol = df_ats[df_ats["issueSymbolIdentifier"] == symbol]
+            self.assertAlmostEqual(
+                slope,
+                stats.linregress(
+                    df_symbol["weekStartDateInt"].values,
+                    df_symbol["totalWeeklyShareQuantity"].values,
+                )[0],
+            )
@@ -0,0 +1,63 @@
+""" finra_model.py tests """
+import tempfile
+import unittest
+from unittest import mock
+
+from gamestonk_terminal import finra_model
+
+
+def mock_response(json_data, status_code=200):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.json.return_value = json_data
+    return response
+
+
+def mock_post(url, json=None):
+    if url.endswith("weeklyDownloadDetails"):
+        return mock_response(
+            [{"weekStartDate": "2021-04-26"}, {"weekStartDate": "2021-04-19"}]
+        )
+    offset = json["offset"]
+    n_rows = finra_model.PAGE_SIZE if offset == 0 else 3
+    return mock_response(
+        [
+            {
+                "issueSymbolIdentifier": f"T{offset + i}",
+                "totalWeeklyShareQuantity": offset + i,
+                "totalWeeklyTradeCount": 1,
+                "lastUpdateDate": "2021-05-03",
+            }
+            for i in range(n_rows)
+        ]
+    )
+
+
+class TestFinraModel(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch(
+            "gamestonk_terminal.config_terminal.DATA_CACHE_DIR", self.cache_dir.name
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+
+    @mock.patch("gamestonk_terminal.feature_flags.ENABLE_DATA_CACHE", True)
+    @mock.patch("gamestonk_terminal.finra_model.get_session")
+    def test_get_weekly_summary_paginated_and_cached(self, mock_session):
+        mock_session.return_value.post.side_effect = mock_post
+
+        df_ats = finra_model.get_weekly_summary("", is_ats=True, tiers=["T1"])
+
+        self.assertEqual(len(df_ats), 2 * (finra_model.PAGE_SIZE + 3))
+        self.assertEqual(df_ats["weekStartDate"].iloc[0], "2021-04-19")
+        self.assertEqual(df_ats["weekStartDate"].iloc[-1], "2021-04-26")
+        # One weeks request, and two pages for each of the two weeks
+        self.assertEqual(mock_session.return_value.post.call_count, 5)
+
+        df_ticker = finra_model.get_weekly_summary("t5001", is_ats=True, tiers=["T1"])
+
+        self.assertEqual(list(df_ticker["issueSymbolIdentifier"]), ["T5001", "T5001"])
+        # Only the weeks are requested again, the summaries come from disk
+        self.assertEqual(mock_session.return_value.post.call_count, 6)
@@ -0,0 +1,105 @@
+""" market_data.py tests """
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal import market_data
+
+
+def mock_yf_prices(*_, start=None, **__):
+    df_prices = pd.DataFrame(
+        {
+            "Open": np.arange(10.0),
+            "High": np.arange(10.0) + 1,
+            "Low": np.arange(10.0) - 1,
+            "Close": np.arange(10.0),
+            "Adj Close": np.arange(10.0),
+            "Volume": np.arange(10) * 100,
+        },
+        index=pd.date_range("2021-01-04", periods=10, name="Date"),
+    )
+    return df_prices.loc[start:]
+
+
+class TestMarketData(unittest.TestCase):
+    def setUp(self):
+        market_data.clear_session()
+
+    @mock.patch("gamestonk_terminal.feature_flags.ENABLE_DATA_CACHE", False)
+    @mock.patch("gamestonk_terminal.market_data.yf.Ticker")
+    def test_get_prices_memoized(self, mock_yf_ticker):
+        mock_history = mock_yf_ticker.return_value.history
+        mock_history.side_effect = mock_yf_prices
+
+        df_first = market_data.get_prices("gme", start="2021-01-04")
+        df_second = market_data.get_prices("GME", start="2021-01-08")
+
+        self.assertEqual(mock_history.call_count, 1)
+        self.assertEqual(list(df_first.columns), market_data.OHLCV_COLUMNS)
+        self.assertEqual(df_second.index[0], pd.Timestamp("2021-01-08"))
+
+    @mock.patch("gamestonk_terminal.feature_flags.ENABLE_DATA_CACHE", False)
+    @mock.patch("gamestonk_terminal.market_data.yf.Ticker")
+    def test_get_prices_multiple_retries(self, mock_yf_ticker):
+        mock_yf_ticker.return_value.history.side_effect = [
+            Exception("Rate limited"),
+            mock_yf_prices(),
+            mock_yf_prices(),
+        ]
+
+        df_prices = market_data.get_prices_multiple(
+            ["GME", "AMC"], start="2021-01-04", column="Close", backoff=0
+        )
+
+        self.assertEqual(list(df_prices.columns), ["GME", "AMC"])
+        self.assertEqual(len(df_prices), 10)
+
+    @mock.patch("gamestonk_terminal.feature_flags.ENABLE_DATA_CACHE", False)
+    @mock.patch("gamestonk_terminal.market_data.yf.Ticker")
+    def test_get_prices_multiple_retry_budget(self, mock_yf_ticker):
+        mock_yf_ticker.return_value.history.side_effect = Exception("Rate limited")
+
+        df_prices = market_data.get_prices_multiple(
+            ["GME", "AMC"], start="2021-01-04", max_retries=3, backoff=0
+        )
+
+        self.assertTrue(df_prices.empty)
+        self.assertEqual(mock_yf_ticker.return_value.history.call_count, 5)
+
+    def test_to_numbered_columns(self):
+        df_prices = market_data.normalize_columns(mock_yf_prices())
+
+        self.assertEqual(
+            list(market_data.to_numbered_columns(df_prices).columns),
+            [
+                "1. open",
+                "2. high",
+                "3. low",
+                "4. close",
+                "5. adjusted close",
+                "6. volume",
+            ],
+        )
+        self.assertEqual(
+            list(
+                market_data.to_numbered_columns(
+                    df_prices.drop(columns=["Adj Close"])
+                ).columns
+            ),
+            ["1. open", "2. high", "3. low", "4. close", "5. volume"],
+        )
+
+    def test_to_ohlcv_frame(self):
+        df_stock = market_data.to_numbered_columns(mock_yf_prices())
+        df_stock["5. adjusted close"] = df_stock["4. close"] * 2
+
+        df_ohlcv = market_data.to_ohlcv_frame(df_stock)
+
+        self.assertEqual(list(df_ohlcv.columns), market_data.TA_COLUMNS)
+        self.assertTrue((df_ohlcv.dtypes == np.float64).all())
+        np.testing.assert_array_equal(df_ohlcv["Close"], np.arange(10.0) * 2)
+
+        df_coin = market_data.to_ohlcv_frame(df_stock[["4. close"]])
+
+        self.assertTrue(df_coin["Volume"].isna().all())
@@ -0,0 +1,83 @@
+""" ohlcv_cache.py tests """
+import json
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal import ohlcv_cache
+
+
+class TestOhlcvCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.df_prices = pd.DataFrame(
+            {"Close": np.arange(30, dtype=float)},
+            index=pd.date_range("2021-01-01", periods=30, name="date"),
+        )
+        self.fetched_starts = []
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def fetch(self, start):
+        self.fetched_starts.append(start)
+        return self.df_prices.loc[start:]
+
+    def load(self, start):
+        with mock.patch.object(
+            ohlcv_cache.cfg, "DATA_CACHE_DIR", self.cache_dir.name
+        ), mock.patch.object(
+            ohlcv_cache.cfg, "DATA_CACHE_MAX_AGE", 0
+        ), mock.patch.object(
+            ohlcv_cache.gtff, "ENABLE_DATA_CACHE", True
+        ):
+            return ohlcv_cache.load_cached("yf", "GME", "1440min", start, self.fetch)
+
+    def test_top_up_from_last_cached_bar(self):
+        df_first = self.load("2021-01-05")
+        df_second = self.load("2021-01-10")
+
+        self.assertEqual(self.fetched_starts, ["2021-01-05", "2021-01-29"])
+        self.assertEqual(len(df_first), 26)
+        self.assertEqual(df_second.index[0], pd.Timestamp("2021-01-10"))
+        self.assertEqual(df_second.index[-1], pd.Timestamp("2021-01-30"))
+
+    def test_earlier_start_refetches(self):
+        self.load("2021-01-05")
+        df_prices = self.load("2021-01-02")
+
+        self.assertEqual(self.fetched_starts, ["2021-01-05", "2021-01-02"])
+        self.assertEqual(len(df_prices), 29)
+
+    def test_adjusted_prices_refetch(self):
+        self.load("2021-01-05")
+        # A dividend adjusts every close before the last one
+        self.df_prices["Close"] *= 0.9
+        df_prices = self.load("2021-01-10")
+
+        self.assertEqual(
+            self.fetched_starts, ["2021-01-05", "2021-01-29", "2021-01-05"]
+        )
+        np.testing.assert_allclose(df_prices["Close"], np.arange(9, 30) * 0.9)
+
+    def test_empty_top_up_refetch(self):
+        self.load("2021-01-05")
+        df_cached = self.df_prices
+        with mock.patch.object(ohlcv_cache.cfg, "DATA_CACHE_DIR", self.cache_dir.name):
+            _, meta_file = ohlcv_cache.get_cache_paths("yf", "GME", "1440min")
+        with open(meta_file, "w", encoding="utf-8") as f:
+            json.dump({"start": "2021-01-05", "updated": "2021-02-01 00:00:00"}, f)
+
+        # Bars out of the lookback window of the source are not returned
+        self.df_prices = self.df_prices.iloc[:0]
+        df_prices = self.load("2021-01-10")
+
+        self.assertEqual(
+            self.fetched_starts, ["2021-01-05", "2021-01-29", "2021-01-05"]
+        )
+        pd.testing.assert_frame_equal(df_prices, df_cached.loc["2021-01-10":])
+        # The cache is not marked as updated
+        with open(meta_file, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["updated"], "2021-02-01 00:00:00")
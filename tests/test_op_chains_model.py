@@ -0,0 +1,52 @@
+""" options/chains_model.py tests """
+import threading
+import time
+import unittest
+from unittest import mock
+
+from gamestonk_terminal.options import chains_model
+
+
+class FakeTicker:
+    def __init__(self):
+        self.ticker = "GME"
+        self.options = ("2021-06-18", "2021-06-25", "2021-07-02")
+        self.calls = []
+        self.calls_lock = threading.Lock()
+
+    def option_chain(self, expiry):
+        time.sleep(0.05)
+        with self.calls_lock:
+            self.calls.append(expiry)
+        return f"chain {expiry}"
+
+
+class TestOptionsChainsModel(unittest.TestCase):
+    def setUp(self):
+        chains_model.clear_chains()
+
+    def test_prefetch_ticker_chains(self):
+        yf_ticker_data = FakeTicker()
+
+        chains_model.prefetch_ticker_chains(yf_ticker_data)
+        # Chains being prefetched are not downloaded again
+        self.assertEqual(
+            chains_model.get_option_chain(yf_ticker_data, "2021-06-25"),
+            "chain 2021-06-25",
+        )
+        self.assertEqual(
+            chains_model.get_option_chains(
+                yf_ticker_data, list(yf_ticker_data.options)
+            ),
+            ["chain 2021-06-18", "chain 2021-06-25", "chain 2021-07-02"],
+        )
+        self.assertEqual(sorted(yf_ticker_data.calls), list(yf_ticker_data.options))
+
+    @mock.patch("gamestonk_terminal.config_terminal.DATA_CACHE_MAX_AGE", 0)
+    def test_get_option_chain_expired(self):
+        yf_ticker_data = FakeTicker()
+
+        chains_model.get_option_chain(yf_ticker_data, "2021-06-18")
+        chains_model.get_option_chain(yf_ticker_data, "2021-06-18")
+
+        self.assertEqual(yf_ticker_data.calls, ["2021-06-18", "2021-06-18"])
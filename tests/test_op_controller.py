@@ -0,0 +1,80 @@
+""" options/op_controller.py tests """
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pandas as pd
+
+from gamestonk_terminal.options import chains_model
+from gamestonk_terminal.options import op_controller
+
+
+class FakeTicker:
+    def __init__(self, ticker, released=None):
+        self.ticker = ticker
+        self.released = released
+        self.calls = []
+
+    @property
+    def options(self):
+        self.calls.append("options")
+        return ("2021-06-18", "2021-06-25")
+
+    def option_chain(self, expiry):
+        if self.released:
+            self.released.wait(5)
+        self.calls.append(expiry)
+        return f"chain {expiry}"
+
+
+class TestOptionsController(unittest.TestCase):
+    def setUp(self):
+        chains_model.clear_chains()
+
+    def test_q_cancels_prefetch(self):
+        released = threading.Event()
+        slow_ticker = FakeTicker("SLOW", released)
+        yf_ticker_data = FakeTicker("GME")
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        with mock.patch.object(chains_model, "_executor", executor), mock.patch.object(
+            op_controller.yf, "Ticker", return_value=yf_ticker_data
+        ):
+            # The only worker is busy with a slow download, so the prefetch is queued
+            slow_future = executor.submit(
+                chains_model.get_option_chain, slow_ticker, "2021-06-18"
+            )
+            controller = op_controller.OptionsController(
+                "GME", pd.DataFrame({"5. adjusted close": [100.0]})
+            )
+            self.assertFalse(controller.switch("q"))
+
+            released.set()
+            self.assertEqual(slow_future.result(), "chain 2021-06-18")
+            executor.shutdown(wait=True)
+
+        self.assertTrue(controller.prefetch.cancelled())
+        self.assertEqual(yf_ticker_data.calls, [])
+
+    def test_q_cancels_queued_chains(self):
+        released = threading.Event()
+        yf_ticker_data = FakeTicker("GME", released)
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        with mock.patch.object(chains_model, "_executor", executor), mock.patch.object(
+            op_controller.yf, "Ticker", return_value=yf_ticker_data
+        ):
+            controller = op_controller.OptionsController(
+                "GME", pd.DataFrame({"5. adjusted close": [100.0]})
+            )
+            # Once the expiry dates are fetched, the chains are queued behind the
+            # prefetch, whose worker is then busy with the first chain
+            l_futures = controller.prefetch.result()
+            self.assertFalse(controller.switch("q"))
+
+            released.set()
+            executor.shutdown(wait=True)
+
+        self.assertTrue(l_futures[-1].cancelled())
+        self.assertNotIn("2021-06-25", yf_ticker_data.calls)
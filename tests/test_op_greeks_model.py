@@ -0,0 +1,91 @@
+""" options/greeks_model.py tests """
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.options import greeks_model
+
+
+class TestOptionsGreeksModel(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(42)
+        self.strikes = rng.uniform(50, 150, 1000)
+        self.years = rng.uniform(0.02, 2, 1000)
+        self.vols = rng.uniform(0.1, 1.5, 1000)
+        self.is_call = rng.rand(1000) < 0.5
+
+    def test_implied_volatility(self):
+        prices = greeks_model.bs_price(
+            100, self.strikes, self.years, 0.02, self.vols, self.is_call
+        )
+        iv = greeks_model.implied_volatility(
+            prices, 100, self.strikes, self.years, 0.02, self.is_call
+        )
+
+        # Volatilities are only identified where the prices depend on them
+        vega = greeks_model.get_greeks(
+            100, self.strikes, self.years, 0.02, self.vols, self.is_call
+        )["vega"]
+        np.testing.assert_allclose(iv[vega > 1e-3], self.vols[vega > 1e-3], atol=1e-4)
+
+        # Prices below the intrinsic value have no implied volatility
+        self.assertTrue(
+            np.isnan(greeks_model.implied_volatility(5, 100, 90, 0.5, 0, True))
+        )
+
+    def test_get_greeks(self):
+        d_greeks = greeks_model.get_greeks(
+            100, self.strikes, self.years, 0.02, self.vols, self.is_call
+        )
+
+        def price(spot=100, years=self.years, vols=self.vols):
+            return greeks_model.bs_price(
+                spot, self.strikes, years, 0.02, vols, self.is_call
+            )
+
+        np.testing.assert_allclose(
+            d_greeks["delta"], (price(100.01) - price(99.99)) / 0.02, atol=1e-6
+        )
+        np.testing.assert_allclose(
+            d_greeks["gamma"],
+            (price(100.01) - 2 * price() + price(99.99)) / 1e-4,
+            atol=1e-5,
+        )
+        np.testing.assert_allclose(
+            d_greeks["vega"],
+            (price(vols=self.vols + 1e-4) - price(vols=self.vols - 1e-4)) / 2e-2,
+            atol=1e-6,
+        )
+        np.testing.assert_allclose(
+            d_greeks["theta"],
+            (price(years=self.years - 1e-4) - price(years=self.years + 1e-4))
+            / 2e-4
+            / 365,
+            atol=1e-5,
+        )
+
+    def test_get_gex_by_strike(self):
+        now = datetime(2021, 6, 1, 16)
+        df_chains = pd.DataFrame(
+            {
+                "expiry": ["2021-06-18", "2021-06-18", "2021-07-16", "2021-06-18"],
+                "type": ["calls", "puts", "calls", "calls"],
+                "strike": [100.0, 100.0, 100.0, 110.0],
+                "bid": [2.0, 1.9, 3.9, 0.0],
+                "ask": [2.2, 2.1, 4.1, 0.0],
+                "lastPrice": [2.1, 2.0, 4.0, 0.3],
+                "openInterest": [1000, 2000, 500, np.nan],
+            }
+        )
+        df_greeks = greeks_model.get_chains_greeks(df_chains, 100, now=now)
+
+        self.assertFalse(df_greeks[greeks_model.GREEKS_COLUMNS].isna().any().any())
+        df_gex = greeks_model.get_gex_by_strike(df_greeks, 100)
+
+        self.assertEqual(list(df_gex.index), [100.0, 110.0])
+        gex = df_greeks["gamma"].values * 100 * 100 * 100 * 0.01
+        self.assertAlmostEqual(df_gex.loc[100.0, "calls"], gex[0] * 1000 + gex[2] * 500)
+        self.assertAlmostEqual(df_gex.loc[100.0, "puts"], -gex[1] * 2000)
+        self.assertEqual(df_gex.loc[110.0, "total"], 0)
@@ -0,0 +1,85 @@
+""" options/iv_surface_model.py tests """
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.options import iv_surface_model
+
+
+class TestOptionsIvSurfaceModel(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2021, 6, 1, 16)
+        strikes = np.arange(50.0, 151.0, 5.0)
+        self.expiries = ["2021-06-15", "2021-07-01", "2021-09-01", "2022-06-01"]
+        self.df_chains = pd.DataFrame(
+            [
+                {"expiry": expiry, "type": s_type, "strike": strike, "iv": 0.4}
+                for expiry in self.expiries
+                for s_type in ["calls", "puts"]
+                for strike in strikes
+            ]
+        )
+
+    def test_get_surface_points(self):
+        df_points = iv_surface_model.get_surface_points(self.df_chains, 100, self.now)
+
+        # One out of the money option per strike and expiry
+        self.assertEqual(len(df_points), 4 * 21)
+        self.assertTrue(df_points["years"].is_monotonic_increasing)
+        self.assertAlmostEqual(df_points["years"].iloc[0], 14 / 365)
+
+    def test_interpolate_surface(self):
+        df_points = iv_surface_model.get_surface_points(self.df_chains, 100, self.now)
+        # The volatility of the second expiry is in the middle of the first and third
+        # in total variance
+        years = df_points["years"].unique()
+        df_points.loc[df_points["years"] == years[1], "iv"] = np.sqrt(
+            0.5 * (0.3 ** 2 * years[0] + 0.5 ** 2 * years[2]) / years[1]
+        )
+        df_points.loc[df_points["years"] == years[0], "iv"] = 0.3
+        df_points.loc[df_points["years"] == years[2], "iv"] = 0.5
+
+        df_surface = iv_surface_model.interpolate_surface(df_points)
+
+        self.assertEqual(list(df_surface.index), list(iv_surface_model.MONEYNESS_GRID))
+        # 7 days is before the first expiry and 730 after the last one
+        self.assertTrue(df_surface[7].isna().all())
+        self.assertTrue(df_surface[730].isna().all())
+        self.assertFalse(df_surface[[14, 30, 60, 90, 180, 365]].isna().any().any())
+        np.testing.assert_allclose(df_surface[14], 0.3)
+        np.testing.assert_allclose(df_surface[365], 0.4)
+
+        # Total variances are linear in time between expiries
+        t30 = 30 / 365
+        weight = (t30 - years[1]) / (years[2] - years[1])
+        variance = (1 - weight) * 0.5 * (0.3 ** 2 * years[0] + 0.5 ** 2 * years[2])
+        variance += weight * 0.5 ** 2 * years[2]
+        np.testing.assert_allclose(df_surface[30], np.sqrt(variance / t30))
+
+    def test_snapshots(self):
+        df_points = iv_surface_model.get_surface_points(self.df_chains, 100, self.now)
+        df_surface = iv_surface_model.interpolate_surface(df_points)
+
+        with tempfile.TemporaryDirectory() as cache_dir, mock.patch(
+            "gamestonk_terminal.config_terminal.DATA_CACHE_DIR", cache_dir
+        ):
+            iv_surface_model.save_snapshot(df_surface, "gme", self.now)
+            iv_surface_model.save_snapshot(
+                df_surface + 0.01, "GME", datetime(2021, 6, 2, 16)
+            )
+            l_snapshots = iv_surface_model.list_snapshots("GME")
+            self.assertEqual(l_snapshots, [self.now, datetime(2021, 6, 2, 16)])
+
+            df_diff = iv_surface_model.diff_surfaces(
+                iv_surface_model.load_snapshot("GME", l_snapshots[0]),
+                iv_surface_model.load_snapshot("GME", l_snapshots[1]),
+            )
+
+        self.assertEqual(df_diff.shape, df_surface.shape)
+        np.testing.assert_allclose(
+            df_diff[365].values, np.full(len(df_diff), 0.01), atol=1e-6
+        )
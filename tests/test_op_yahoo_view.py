@@ -0,0 +1,74 @@
+""" options/yahoo_view.py tests """
+import unittest
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.options.yahoo_view import (
+    get_max_pain,
+    get_max_pain_by_expiry,
+)
+
+
+def brute_force_max_pain(strikes, oi_calls, oi_puts):
+    loss = [
+        np.sum(np.clip(price - strikes, 0, None) * oi_calls)
+        + np.sum(np.clip(strikes - price, 0, None) * oi_puts)
+        for price in strikes
+    ]
+    return strikes[int(np.argmin(loss))]
+
+
+class TestOptionsYahooView(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(42)
+        self.strikes = np.sort(
+            rng.choice(np.arange(10, 300, 2.5), size=40, replace=False)
+        )
+        self.oi_calls = rng.randint(0, 5000, size=40).astype(float)
+        self.oi_puts = rng.randint(0, 5000, size=40).astype(float)
+
+    def test_get_max_pain(self):
+        chain = pd.DataFrame(
+            {"OI_call": self.oi_calls, "OI_put": -self.oi_puts}, index=self.strikes
+        )
+
+        self.assertEqual(
+            get_max_pain(chain),
+            brute_force_max_pain(self.strikes, self.oi_calls, self.oi_puts),
+        )
+
+    def test_get_max_pain_by_expiry(self):
+        l_chains = list()
+        for expiry, shift in [("2021-07-16", 0), ("2021-07-23", 15)]:
+            l_chains.append(
+                pd.DataFrame(
+                    {
+                        "strike": self.strikes,
+                        "openInterest": np.roll(self.oi_calls, shift),
+                        "expiry": expiry,
+                        "type": "calls",
+                    }
+                )
+            )
+            l_chains.append(
+                pd.DataFrame(
+                    {
+                        "strike": self.strikes,
+                        "openInterest": np.roll(self.oi_puts, shift),
+                        "expiry": expiry,
+                        "type": "puts",
+                    }
+                )
+            )
+
+        max_pain = get_max_pain_by_expiry(pd.concat(l_chains, ignore_index=True))
+
+        for expiry, shift in [("2021-07-16", 0), ("2021-07-23", 15)]:
+            self.assertEqual(
+                max_pain[expiry],
+                brute_force_max_pain(
+                    self.strikes,
+                    np.roll(self.oi_calls, shift),
+                    np.roll(self.oi_puts, shift),
+                ),
+            )
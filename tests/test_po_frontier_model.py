@@ -0,0 +1,47 @@
+""" portfolio_optimization/frontier_model.py tests """
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.portfolio_optimization import frontier_model
+
+
+class TestPortfolioFrontierModel(unittest.TestCase):
+    def setUp(self):
+        tickers = ["AAPL", "GME", "MSFT", "TSLA"]
+        rng = np.random.RandomState(0)
+        returns = rng.normal(0.001, 0.02, (250, 4))
+        self.mu = pd.Series(returns.mean(axis=0) * 252, index=tickers)
+        self.cov = pd.DataFrame(np.cov(returns.T) * 252, index=tickers, columns=tickers)
+
+    def test_get_pareto_frontier(self):
+        stds = np.array([0.3, 0.1, 0.2, 0.2, 0.4])
+        rets = np.array([0.3, 0.1, 0.05, 0.2, 0.25])
+
+        self.assertEqual(
+            list(frontier_model.get_pareto_frontier(stds, rets)), [1, 3, 0]
+        )
+
+    def test_simulate_portfolios(self):
+        df_frontier, df_best, df_sample = frontier_model.simulate_portfolios(
+            self.mu, self.cov, 2500, chunk_size=1000, seed=42
+        )
+
+        # Same portfolios as a single pass over every weight
+        l_seeds = np.random.SeedSequence(42).spawn(3)
+        weights = np.concatenate(
+            [
+                np.random.default_rng(seed).dirichlet(np.ones(4), n)
+                for seed, n in zip(l_seeds, [1000, 1000, 500])
+            ]
+        )
+        rets = weights @ self.mu.values
+        stds = np.sqrt(np.diag(weights @ self.cov.values @ weights.T))
+        idx = frontier_model.get_pareto_frontier(stds, rets)
+
+        np.testing.assert_allclose(df_frontier["volatility"], stds[idx])
+        np.testing.assert_allclose(df_frontier[list(self.mu.index)], weights[idx])
+        self.assertAlmostEqual(df_best.loc["Max Sharpe", "sharpe"], max(rets / stds))
+        self.assertAlmostEqual(df_best.loc["Min Volatility", "volatility"], min(stds))
+        self.assertEqual(len(df_sample), 2500)
@@ -0,0 +1,47 @@
+""" portfolio_optimization/optimizer_helper.py tests """
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.portfolio_optimization import optimizer_helper
+
+
+def mock_adjusted_closes(tickers, **_):
+    rng = np.random.RandomState(0)
+    return pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.02, (60, len(tickers))), axis=0)),
+        index=pd.bdate_range("2021-01-04", periods=60),
+        columns=tickers,
+    )
+
+
+class TestPortfolioOptimizerHelper(unittest.TestCase):
+    def setUp(self):
+        optimizer_helper.clear_cache()
+
+    @mock.patch(
+        "gamestonk_terminal.portfolio_optimization.optimizer_helper.risk_models.risk_matrix",
+        wraps=optimizer_helper.risk_models.risk_matrix,
+    )
+    @mock.patch(
+        "gamestonk_terminal.portfolio_optimization.optimizer_helper.market_data.get_adjusted_closes",
+        side_effect=mock_adjusted_closes,
+    )
+    def test_get_returns_and_risk_cached(self, mock_closes, mock_risk_matrix):
+        mu, S = optimizer_helper.get_returns_and_risk(["GME", "AMC", "BB"], "3mo")
+        prices = optimizer_helper.process_stocks(["BB", "GME", "AMC"], "3mo")
+        self.assertEqual(sorted(prices.columns), ["AMC", "BB", "GME"])
+        mu_lw, S_lw = optimizer_helper.get_returns_and_risk(
+            ["AMC", "BB", "GME"], "3mo", "ledoit_wolf"
+        )
+
+        # One download per ticker set and period, one estimate per risk model
+        self.assertEqual(mock_closes.call_count, 1)
+        self.assertEqual(mock_risk_matrix.call_count, 2)
+        pd.testing.assert_series_equal(mu_lw, mu)
+        self.assertFalse(np.allclose(S_lw.values, S.values))
+
+        optimizer_helper.get_returns_and_risk(["GME", "AMC", "BB"], "1y")
+        self.assertEqual(mock_closes.call_count, 2)
@@ -0,0 +1,62 @@
+""" prediction_techniques/arima_model.py tests """
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.prediction_techniques import arima_model
+
+
+class TestPredArimaModel(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.prices = pd.Series(
+            100 + np.cumsum(rng.normal(size=200)),
+            index=pd.bdate_range("2020-01-01", periods=200),
+        )
+
+    def test_get_neighbors(self):
+        l_neighbors = arima_model.get_neighbors(((0, 1, 1), (0, 0, 0, 0)), 5, 1, 0)
+
+        self.assertEqual(
+            l_neighbors,
+            [((1, 1, 1), (0, 0, 0, 0)), ((0, 1, 0), (0, 0, 0, 0))],
+        )
+
+    def test_search_order(self):
+        (order, seasonal_order), df_fits = arima_model.search_order(
+            self.prices, "grid", "bic", max_p=1, max_q=1
+        )
+
+        self.assertEqual(len(df_fits), 4)
+        self.assertEqual(order, df_fits["order"].iloc[0])
+        self.assertEqual(seasonal_order, (0, 0, 0, 0))
+        self.assertTrue(df_fits["bic"].is_monotonic_increasing)
+
+        # Searches and fits are cached per price series
+        self.assertIs(
+            arima_model.search_order(self.prices, "grid", "bic", max_p=1, max_q=1)[1],
+            df_fits,
+        )
+        self.assertIs(
+            arima_model.get_auto_fit(self.prices, "grid", "bic", max_p=1, max_q=1),
+            arima_model.get_fit(self.prices, order),
+        )
+
+    def test_search_order_oob(self):
+        (order, seasonal_order), df_fits = arima_model.search_order(
+            self.prices, "grid", "oob", max_p=1, max_q=1, out_of_sample_size=5
+        )
+
+        self.assertTrue(df_fits["oob"].is_monotonic_increasing)
+        self.assertEqual(order, df_fits["order"].iloc[0])
+        # The oob criteria scores the forecast of the holdout, as auto_arima
+        model_fit = arima_model.ARIMA(
+            self.prices.values[:-5], order=order, seasonal_order=seasonal_order
+        ).fit()
+        self.assertAlmostEqual(
+            df_fits["oob"].iloc[0],
+            np.mean((self.prices.values[-5:] - model_fit.forecast(5)) ** 2),
+        )
+        with self.assertRaises(ValueError):
+            arima_model.search_order(self.prices, "grid", "oob", out_of_sample_size=0)
@@ -0,0 +1,129 @@
+""" prediction_techniques/checkpoint_helper.py tests """
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from gamestonk_terminal.prediction_techniques import checkpoint_helper
+
+
+class FakeModel:
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("model")
+
+
+class TestPredCheckpointHelper(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint_dir = os.path.join(self.tmp_dir.name, "TSLA_model")
+        self.data_hash = checkpoint_helper.get_data_hash(np.arange(10.0))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def save(self, loop, data_end, data_hash):
+        checkpoint_path = checkpoint_helper.get_checkpoint_path(
+            self.checkpoint_dir, loop, data_end
+        )
+        checkpoint_helper.save_checkpoint(
+            FakeModel(), checkpoint_path, data_end, data_hash
+        )
+        return checkpoint_path
+
+    def test_get_checkpoint_path(self):
+        self.assertEqual(
+            checkpoint_helper.get_checkpoint_path(
+                self.checkpoint_dir, 2, "2021-06-04 00:00:00"
+            ),
+            os.path.join(self.checkpoint_dir, "loop2_20210604000000.h5"),
+        )
+
+    def test_get_data_hash(self):
+        self.assertEqual(
+            checkpoint_helper.get_data_hash(np.arange(10.0)), self.data_hash
+        )
+        self.assertNotEqual(
+            checkpoint_helper.get_data_hash(np.arange(1.0, 11.0)), self.data_hash
+        )
+
+    def test_read_checkpoint_meta(self):
+        checkpoint_path = self.save(0, "2021-06-04", self.data_hash)
+        self.assertEqual(
+            checkpoint_helper.read_checkpoint_meta(checkpoint_path),
+            {"end": "2021-06-04", "data_hash": self.data_hash},
+        )
+
+        # A model without its metadata was not fully saved
+        os.remove(os.path.splitext(checkpoint_path)[0] + ".json")
+        self.assertEqual(checkpoint_helper.read_checkpoint_meta(checkpoint_path), {})
+
+        with open(
+            os.path.splitext(checkpoint_path)[0] + ".json", "w", encoding="utf-8"
+        ) as f:
+            f.write("{")
+        self.assertEqual(checkpoint_helper.read_checkpoint_meta(checkpoint_path), {})
+
+    def test_exact_match(self):
+        checkpoint_path = self.save(0, "2021-06-04", self.data_hash)
+        self.save(0, "2021-05-28", "other")
+        self.save(1, "2021-06-04", "other")
+
+        self.assertEqual(
+            checkpoint_helper.find_checkpoint(
+                self.checkpoint_dir, 0, "2021-06-04", self.data_hash
+            ),
+            (checkpoint_path, True),
+        )
+
+    def test_older_checkpoint(self):
+        self.save(0, "2021-05-21", "older")
+        checkpoint_path = self.save(0, "2021-05-28", "old")
+        self.save(0, "2021-06-11", "newer")
+        self.save(1, "2021-06-01", "other loop")
+
+        self.assertEqual(
+            checkpoint_helper.find_checkpoint(
+                self.checkpoint_dir, 0, "2021-06-04", self.data_hash
+            ),
+            (checkpoint_path, False),
+        )
+
+    def test_hash_mismatch(self):
+        # A checkpoint of the same end date trained on other data is fine-tuned, unless it
+        # is the only one
+        checkpoint_path = self.save(0, "2021-05-28", "old")
+        self.save(0, "2021-06-04", "other")
+        self.assertEqual(
+            checkpoint_helper.find_checkpoint(
+                self.checkpoint_dir, 0, "2021-06-04", self.data_hash
+            ),
+            (checkpoint_path, False),
+        )
+
+        os.remove(checkpoint_path)
+        self.assertEqual(
+            checkpoint_helper.find_checkpoint(
+                self.checkpoint_dir, 0, "2021-06-04", self.data_hash
+            ),
+            (None, False),
+        )
+
+    def test_no_checkpoint(self):
+        self.assertEqual(
+            checkpoint_helper.find_checkpoint(
+                self.checkpoint_dir, 0, "2021-06-04", self.data_hash
+            ),
+            (None, False),
+        )
+
+        # Models without metadata are ignored
+        checkpoint_path = self.save(0, "2021-05-28", "old")
+        os.remove(os.path.splitext(checkpoint_path)[0] + ".json")
+        self.assertEqual(
+            checkpoint_helper.find_checkpoint(
+                self.checkpoint_dir, 0, "2021-06-04", self.data_hash
+            ),
+            (None, False),
+        )
@@ -0,0 +1,285 @@
+""" prediction_techniques/pred_helper.py tests """
+import argparse
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.prediction_techniques import neural_networks_view, pred_helper
+
+
+def loop_sliding_windows(values, n_input_days, n_predict_days):
+    """Windows built row by row, as before they were strided views"""
+    input_windows = []
+    target_windows = []
+    for idx in range(len(values) - n_input_days - n_predict_days):
+        input_windows.append(values[idx : idx + n_input_days])
+        target_windows.append(
+            values[idx + n_input_days : idx + n_input_days + n_predict_days]
+        )
+    return np.array(input_windows), np.array(target_windows)
+
+
+class TestPredHelperSlidingWindows(unittest.TestCase):
+    def test_matches_loop(self):
+        values = np.arange(50, dtype=float).reshape(-1, 1) ** 1.5
+        for n_input_days, n_predict_days in [(1, 1), (10, 5), (40, 5), (45, 4)]:
+            input_windows, target_windows = pred_helper.build_sliding_windows(
+                values, n_input_days, n_predict_days
+            )
+            expected_input, expected_target = loop_sliding_windows(
+                values, n_input_days, n_predict_days
+            )
+            np.testing.assert_array_equal(input_windows, expected_input)
+            np.testing.assert_array_equal(target_windows, expected_target)
+
+    def test_dates(self):
+        dates = np.arange("2021-01-01", "2021-02-01", dtype="datetime64[D]")
+        input_dates, target_dates = pred_helper.build_sliding_windows(dates, 7, 3)
+        expected_input, expected_target = loop_sliding_windows(dates, 7, 3)
+        np.testing.assert_array_equal(input_dates, expected_input)
+        np.testing.assert_array_equal(target_dates, expected_target)
+
+    def test_too_short(self):
+        values = np.arange(10, dtype=float).reshape(-1, 1)
+        input_windows, target_windows = pred_helper.build_sliding_windows(values, 8, 2)
+        self.assertEqual(input_windows.shape, (0, 8, 1))
+        self.assertEqual(target_windows.shape, (0, 2, 1))
+
+    def test_read_only(self):
+        values = np.arange(20, dtype=float).reshape(-1, 1)
+        input_windows, _ = pred_helper.build_sliding_windows(values, 5, 2)
+        with self.assertRaises(ValueError):
+            input_windows[0, 0, 0] = -1
+
+
+class TestPredHelperPrepareData(unittest.TestCase):
+    def setUp(self):
+        pred_helper.clear_prepared_data()
+        self.df_stock = pd.Series(
+            100 + np.arange(200, dtype=float),
+            index=pd.bdate_range("2020-01-01", periods=200),
+        )
+
+    def tearDown(self):
+        pred_helper.clear_prepared_data()
+
+    @staticmethod
+    def get_ns_parser(**kwargs):
+        options = dict(
+            n_inputs=20,
+            n_days=5,
+            valid_split=0.2,
+            s_end_date=None,
+            no_shuffle=False,
+            s_preprocessing="minmax",
+        )
+        options.update(kwargs)
+        return argparse.Namespace(**options)
+
+    def test_scaler_fitted_on_training_prices(self):
+        ns_parser = self.get_ns_parser()
+        prepared_data = pred_helper.prepare_scale_train_valid_test(
+            self.df_stock, ns_parser
+        )
+        X_train, X_valid, y_train = prepared_data[:3]
+        scaler = prepared_data[10]
+
+        # Without shuffling, validation windows are the last ones, and the prices after
+        # the last training window are unseen by the scaler
+        n_train = len(X_train)
+        n_seen = n_train - 1 + ns_parser.n_inputs + ns_parser.n_days
+        self.assertEqual(scaler.data_min_[0], self.df_stock.iloc[0])
+        self.assertEqual(scaler.data_max_[0], self.df_stock.iloc[n_seen - 1])
+        self.assertLess(scaler.data_max_[0], self.df_stock.max())
+
+        # Training windows are scaled within [0, 1], later validation prices beyond it
+        self.assertEqual(X_train.min(), 0)
+        self.assertEqual(y_train.max(), 1)
+        self.assertGreater(X_valid.max(), 1)
+
+    def test_scaler_fitted_on_shuffled_training_prices(self):
+        ns_parser = self.get_ns_parser(
+            no_shuffle=True, s_preprocessing="standardization"
+        )
+        prepared_data = pred_helper.prepare_scale_train_valid_test(
+            self.df_stock, ns_parser
+        )
+        X_train, y_train = prepared_data[0], prepared_data[2]
+        X_dates_train, y_dates_train = prepared_data[4], prepared_data[6]
+        scaler = prepared_data[10]
+
+        seen_dates = np.unique(np.concatenate([X_dates_train, y_dates_train], axis=1))
+        seen_prices = self.df_stock[seen_dates].values
+        self.assertAlmostEqual(scaler.mean_[0], seen_prices.mean())
+        self.assertAlmostEqual(scaler.scale_[0], seen_prices.std())
+        np.testing.assert_allclose(
+            scaler.inverse_transform(X_train.reshape(-1, 1)).flatten(),
+            self.df_stock[X_dates_train.flatten()].values,
+        )
+        np.testing.assert_allclose(
+            scaler.inverse_transform(y_train.reshape(-1, 1)).flatten(),
+            self.df_stock[y_dates_train.flatten()].values,
+        )
+
+    def test_shuffled_split_is_deterministic(self):
+        ns_parser = self.get_ns_parser(no_shuffle=True)
+        prepared_data = pred_helper.prepare_scale_train_valid_test(
+            self.df_stock, ns_parser
+        )
+        pred_helper.clear_prepared_data()
+        prepared_again = pred_helper.prepare_scale_train_valid_test(
+            self.df_stock, ns_parser
+        )
+        self.assertIsNot(prepared_again, prepared_data)
+        for data, data_again in zip(prepared_data[:10], prepared_again[:10]):
+            np.testing.assert_array_equal(data, data_again)
+
+    def test_cache_hit(self):
+        ns_parser = self.get_ns_parser()
+        prepared_data = pred_helper.prepare_scale_train_valid_test(
+            self.df_stock, ns_parser
+        )
+        self.assertIs(
+            pred_helper.prepare_scale_train_valid_test(
+                self.df_stock.copy(), self.get_ns_parser()
+            ),
+            prepared_data,
+        )
+        # Cached arrays are shared between commands, and can't be modified
+        with self.assertRaises(ValueError):
+            prepared_data[0][0, 0, 0] = -1
+
+    def test_cache_key(self):
+        ns_parser = self.get_ns_parser()
+        prepared_data = pred_helper.prepare_scale_train_valid_test(
+            self.df_stock, ns_parser
+        )
+        df_other = self.df_stock.copy()
+        df_other.iloc[-1] += 1
+        l_other = [
+            (df_other, ns_parser),
+            (self.df_stock, self.get_ns_parser(s_end_date="2020-08-31")),
+            (self.df_stock, self.get_ns_parser(s_preprocessing="standardization")),
+            (self.df_stock, self.get_ns_parser(n_inputs=10)),
+            (self.df_stock, self.get_ns_parser(n_days=3)),
+            (self.df_stock, self.get_ns_parser(valid_split=0.1)),
+            (self.df_stock, self.get_ns_parser(no_shuffle=True)),
+        ]
+        for df_stock, other_parser in l_other:
+            self.assertIsNot(
+                pred_helper.prepare_scale_train_valid_test(df_stock, other_parser),
+                prepared_data,
+            )
+        self.assertEqual(len(pred_helper._prepared_data), len(l_other) + 1)
+
+    def test_cache_eviction(self):
+        n_cached = pred_helper.PREPARED_DATA_CACHE_SIZE
+        l_parsers = [self.get_ns_parser(n_inputs=10 + i) for i in range(n_cached + 1)]
+        l_prepared = [
+            pred_helper.prepare_scale_train_valid_test(self.df_stock, ns_parser)
+            for ns_parser in l_parsers[:n_cached]
+        ]
+        # Using the oldest entry makes the second one the least recently used
+        pred_helper.prepare_scale_train_valid_test(self.df_stock, l_parsers[0])
+        pred_helper.prepare_scale_train_valid_test(self.df_stock, l_parsers[-1])
+
+        self.assertEqual(len(pred_helper._prepared_data), n_cached)
+        self.assertIs(
+            pred_helper.prepare_scale_train_valid_test(self.df_stock, l_parsers[0]),
+            l_prepared[0],
+        )
+        self.assertIsNot(
+            pred_helper.prepare_scale_train_valid_test(self.df_stock, l_parsers[1]),
+            l_prepared[1],
+        )
+
+    def test_clear_prepared_data(self):
+        ns_parser = self.get_ns_parser()
+        prepared_data = pred_helper.prepare_scale_train_valid_test(
+            self.df_stock, ns_parser
+        )
+        pred_helper.clear_prepared_data()
+        self.assertIsNot(
+            pred_helper.prepare_scale_train_valid_test(self.df_stock, ns_parser),
+            prepared_data,
+        )
+
+
+def fake_train_loop(loop_args):
+    """Predict the last validation prices, without any model"""
+    X_valid = loop_args[3]
+    n_days = loop_args[8]["n_days"]
+    return X_valid[:, -n_days:, 0], np.arange(n_days, dtype=float), 0.0
+
+
+class TestPredHelperTrainLoops(unittest.TestCase):
+    def setUp(self):
+        self.X_train = np.random.rand(30, 10, 1)
+        self.y_train = np.random.rand(30, 3, 1)
+        self.X_valid = np.random.rand(8, 10, 1)
+        self.y_valid = np.random.rand(8, 3, 1)
+
+    def train_loops(self, n_loops, n_jobs):
+        ns_parser = argparse.Namespace(
+            n_inputs=10,
+            n_days=3,
+            n_epochs=1,
+            n_batch_size=4,
+            lr=0.01,
+            n_loops=n_loops,
+            n_jobs=n_jobs,
+            valid_split=0.1,
+            no_shuffle=True,
+            b_retrain=False,
+        )
+        return neural_networks_view.train_loops(
+            [],
+            self.X_train,
+            self.y_train,
+            self.X_valid,
+            self.y_valid,
+            self.X_valid[-1],
+            [],
+            None,
+            ns_parser,
+            "TSLA",
+            ("2020-01-01", "2020-12-31"),
+        )
+
+    @mock.patch.object(neural_networks_view.gtff, "ENABLE_NN_CHECKPOINTS", False)
+    @mock.patch.object(neural_networks_view.multiprocessing, "get_context")
+    def test_serial(self, mock_get_context):
+        for n_loops, n_jobs in [(3, 1), (1, 4)]:
+            with mock.patch.object(
+                neural_networks_view, "train_loop", side_effect=fake_train_loop
+            ) as mock_train_loop:
+                preds, forecast_data = self.train_loops(n_loops, n_jobs)
+
+            # A single job trains every loop in this process, printing its progress
+            mock_get_context.assert_not_called()
+            self.assertEqual(mock_train_loop.call_count, n_loops)
+            for call in mock_train_loop.call_args_list:
+                self.assertTrue(call.args[0][9])
+            self.assertEqual(preds.shape, (n_loops, 8, 3))
+            self.assertEqual(forecast_data.shape, (n_loops, 3))
+
+    @mock.patch.object(neural_networks_view.gtff, "ENABLE_NN_CHECKPOINTS", False)
+    @mock.patch.object(neural_networks_view.multiprocessing, "get_context")
+    def test_parallel(self, mock_get_context):
+        mock_pool = mock_get_context.return_value.Pool
+        mock_map = mock_pool.return_value.__enter__.return_value.map
+        mock_map.side_effect = lambda func, l_args, chunksize: list(
+            map(fake_train_loop, l_args)
+        )
+        preds, forecast_data = self.train_loops(4, 2)
+
+        mock_get_context.assert_called_once_with("spawn")
+        self.assertEqual(mock_pool.call_args.kwargs["processes"], 2)
+        l_loop_args = mock_map.call_args.args[1]
+        self.assertEqual(len(l_loop_args), 4)
+        # Parallel loops don't print their progress over each other
+        self.assertFalse(any(loop_args[9] for loop_args in l_loop_args))
+        self.assertEqual(preds.shape, (4, 8, 3))
+        self.assertEqual(forecast_data.shape, (4, 3))
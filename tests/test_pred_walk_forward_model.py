@@ -0,0 +1,62 @@
+""" prediction_techniques/walk_forward_model.py tests """
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.prediction_techniques import walk_forward_model
+
+
+class TestPredWalkForwardModel(unittest.TestCase):
+    def setUp(self):
+        self.prices = pd.Series(
+            100 + np.arange(300, dtype=float),
+            index=pd.bdate_range("2020-01-01", periods=300),
+        )
+
+    def test_get_cutoffs(self):
+        # The last fold predicts the last prices, earlier ones step back from it
+        self.assertEqual(
+            walk_forward_model.get_cutoffs(100, 5, 4, 10, 60), [65, 75, 85, 95]
+        )
+        # Folds without enough training prices are dropped
+        self.assertEqual(
+            walk_forward_model.get_cutoffs(100, 5, 10, 10, 60), [65, 75, 85, 95]
+        )
+
+    def test_walk_forward_linear(self):
+        df_folds = walk_forward_model.walk_forward(
+            self.prices,
+            "regression",
+            {"n_inputs": 10, "n_jumps": 1, "polynomial": 1},
+            n_days=5,
+            n_folds=6,
+            window=50,
+        )
+
+        self.assertEqual(len(df_folds), 6)
+        self.assertEqual(df_folds.index[-1], self.prices.index[-6])
+        np.testing.assert_allclose(df_folds["Real"].iloc[-1], self.prices.values[-5:])
+
+        # A linear model predicts a linear trend exactly
+        df_errors = walk_forward_model.get_fold_errors(df_folds)
+        np.testing.assert_allclose(df_errors.values, 0, atol=1e-6)
+        self.assertEqual(
+            list(walk_forward_model.summarize_errors(df_errors).index),
+            ["Mean", "Std", "Median", "Worst"],
+        )
+
+    def test_failed_fold(self):
+        # Too few training prices for a single window of 40 inputs and 5 outputs
+        df_folds = walk_forward_model.walk_forward(
+            self.prices,
+            "regression",
+            {"n_inputs": 40, "n_jumps": 1, "polynomial": 1},
+            n_days=5,
+            n_folds=1,
+            window=20,
+            min_train=20,
+        )
+
+        df_errors = walk_forward_model.get_fold_errors(df_folds)
+        self.assertTrue(df_errors["MAPE"].isna().all())
@@ -0,0 +1,155 @@
+""" technical_analysis/batch_model.py tests """
+import unittest
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+
+from gamestonk_terminal.technical_analysis import batch_model
+
+
+def get_ohlcv(n_rows=120):
+    close = 100 + np.cumsum(np.random.RandomState(0).normal(size=n_rows))
+    return pd.DataFrame(
+        {
+            "Open": close - 0.5,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": np.arange(1.0, n_rows + 1) * 1000,
+        },
+        index=pd.date_range("2021-01-04", periods=n_rows, freq="B"),
+    )
+
+
+def get_tied_ohlcv(n_rows=120):
+    # Prices rounded to whole dollars repeat their highs and lows
+    df_ohlcv = get_ohlcv(n_rows)
+    df_ohlcv[["Open", "High", "Low", "Close"]] = df_ohlcv[
+        ["Open", "High", "Low", "Close"]
+    ].round()
+    return df_ohlcv
+
+
+class TestTaBatchModel(unittest.TestCase):
+    def test_get_indicators_wide_frame(self):
+        df_ohlcv = get_ohlcv()
+
+        df_features = batch_model.get_indicators(
+            df_ohlcv,
+            [("sma", (10,)), ("sma", (20,)), ("bbands", (20, 2)), ("macd", ())]
+            + [(name, ()) for name in ["rsi", "stoch", "adx", "aroon", "ad", "obv"]],
+        )
+
+        self.assertTrue(df_features.index.equals(df_ohlcv.index))
+        for col in ["SMA_10", "SMA_20", "BBM_20_2.0", "MACDh_12_26_9", "RSI_14"]:
+            self.assertIn(col, df_features.columns)
+        pd.testing.assert_series_equal(
+            df_features["SMA_20"], df_features["BBM_20_2.0"], check_names=False
+        )
+        pd.testing.assert_series_equal(
+            df_features["SMA_10"],
+            df_ohlcv["Close"].rolling(10).mean(),
+            check_names=False,
+        )
+        for col in ["RSI_14", "STOCHk_14_3_3", "ADX_14", "AROONU_25"]:
+            values = df_features[col].dropna()
+            self.assertTrue(((values >= 0) & (values <= 100)).all(), col)
+
+    def test_shared_intermediates_computed_once(self):
+        shared = batch_model.SharedIntermediates(get_ohlcv())
+
+        batch_model._sma(shared, 20)
+        n_memo = len(shared)
+        batch_model._bbands(shared, 20, 2)
+
+        # bbands only adds its rolling std to the rolling mean of sma
+        self.assertEqual(len(shared), n_memo + 1)
+
+    def test_get_indicators_unknown(self):
+        with self.assertRaises(ValueError):
+            batch_model.get_indicators(get_ohlcv(), [("foo", ())])
+
+
+class TestTaBatchModelParity(unittest.TestCase):
+    """Every output column matches its pandas_ta indicator, warm-up NaNs included"""
+
+    def assert_parity(self, name, params, get_ta):
+        for df_ohlcv in [get_ohlcv(), get_tied_ohlcv()]:
+            df_features = batch_model.get_indicators(df_ohlcv, [(name, params)])
+            df_ta = get_ta(df_ohlcv)
+            for col in df_features.columns:
+                # Single output indicators are compared whatever their pandas_ta name
+                ta_values = df_ta if isinstance(df_ta, pd.Series) else df_ta[col]
+                pd.testing.assert_series_equal(
+                    df_features[col],
+                    ta_values.astype(float),
+                    check_names=False,
+                    check_freq=False,
+                    obj=col,
+                )
+
+    def test_ema(self):
+        self.assert_parity("ema", (20,), lambda df: ta.ema(df["Close"], length=20))
+
+    def test_sma(self):
+        self.assert_parity("sma", (20,), lambda df: ta.sma(df["Close"], length=20))
+
+    def test_vwap(self):
+        self.assert_parity(
+            "vwap",
+            (),
+            lambda df: ta.vwap(df["High"], df["Low"], df["Close"], df["Volume"]),
+        )
+
+    def test_cci(self):
+        self.assert_parity(
+            "cci",
+            (14, 0.015),
+            lambda df: ta.cci(df["High"], df["Low"], df["Close"], length=14, c=0.015),
+        )
+
+    def test_macd(self):
+        self.assert_parity(
+            "macd",
+            (12, 26, 9),
+            lambda df: ta.macd(df["Close"], fast=12, slow=26, signal=9),
+        )
+
+    def test_rsi(self):
+        self.assert_parity("rsi", (14,), lambda df: ta.rsi(df["Close"], length=14))
+
+    def test_stoch(self):
+        self.assert_parity(
+            "stoch",
+            (14, 3, 3),
+            lambda df: ta.stoch(
+                df["High"], df["Low"], df["Close"], k=14, d=3, smooth_k=3
+            ),
+        )
+
+    def test_adx(self):
+        self.assert_parity(
+            "adx",
+            (14,),
+            lambda df: ta.adx(df["High"], df["Low"], df["Close"], length=14),
+        )
+
+    def test_aroon(self):
+        self.assert_parity(
+            "aroon", (25,), lambda df: ta.aroon(df["High"], df["Low"], length=25)
+        )
+
+    def test_bbands(self):
+        self.assert_parity(
+            "bbands", (5, 2), lambda df: ta.bbands(df["Close"], length=5, std=2)
+        )
+
+    def test_ad(self):
+        self.assert_parity(
+            "ad",
+            (),
+            lambda df: ta.ad(df["High"], df["Low"], df["Close"], df["Volume"]),
+        )
+
+    def test_obv(self):
+        self.assert_parity("obv", (), lambda df: ta.obv(df["Close"], df["Volume"]))
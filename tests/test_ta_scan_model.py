@@ -0,0 +1,50 @@
+""" technical_analysis/scan_model.py tests """
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.technical_analysis import scan_model
+
+
+def mock_prices_dict(tickers, start=None):
+    d_prices = dict()
+    for idx, ticker in enumerate(tickers):
+        # A falling then rising price, with the bottom further back for later tickers
+        close = np.abs(np.arange(-100.0, 20.0 + 10 * idx)) + 50
+        d_prices[ticker] = pd.DataFrame(
+            {
+                "Open": close,
+                "High": close + 1,
+                "Low": close - 1,
+                "Close": close,
+                "Adj Close": close,
+                "Volume": np.full(len(close), 1000.0),
+            },
+            index=pd.date_range("2021-01-04", periods=len(close), freq="B"),
+        ).loc[start:]
+    return d_prices
+
+
+class TestTaScanModel(unittest.TestCase):
+    def test_bars_since_cross(self):
+        self.assertEqual(scan_model.bars_since_cross(pd.Series([-1, -1, 1, 2, 3])), 2)
+        self.assertEqual(scan_model.bars_since_cross(pd.Series([np.nan, -1, 1])), 0)
+        self.assertTrue(np.isnan(scan_model.bars_since_cross(pd.Series([1, 2]))))
+
+    @mock.patch("gamestonk_terminal.market_data.get_prices_dict")
+    def test_scan_ranked(self, mock_get_prices_dict):
+        mock_get_prices_dict.side_effect = mock_prices_dict
+
+        df_scan = scan_model.scan(
+            ["AAA", "BBB", "CCC"], "2021-01-04", [("adx", ())], n_jobs=1
+        )
+
+        self.assertEqual(list(df_scan.index), ["AAA", "BBB", "CCC"])
+        self.assertIn("ADX_14", df_scan.columns)
+
+        df_ranked = scan_model.filter_scan(df_scan, n_cross_bars=30, s_sort="RSI")
+
+        # CCC bottomed out too long ago for its MACD to have crossed in the last bars
+        self.assertEqual(list(df_ranked.index), ["AAA", "BBB"])
+        self.assertTrue((df_ranked["RSI"].diff().dropna() >= 0).all())
@@ -0,0 +1,138 @@
+""" technical_analysis/streaming_model.py tests """
+import unittest
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.technical_analysis import batch_model
+from gamestonk_terminal.technical_analysis import streaming_model
+
+
+def get_ohlcv(n_rows=200):
+    random = np.random.RandomState(1)
+    close = 100 + np.cumsum(random.normal(size=n_rows))
+    return pd.DataFrame(
+        {
+            "Open": close + random.normal(size=n_rows),
+            "High": close + 1 + random.uniform(size=n_rows),
+            "Low": close - 1 - random.uniform(size=n_rows),
+            "Close": close,
+            "Volume": random.uniform(1000, 2000, size=n_rows),
+        },
+        index=pd.date_range("2021-05-03 09:30", periods=n_rows, freq="1min"),
+    )
+
+
+class TestTaStreamingModel(unittest.TestCase):
+    def test_update_matches_batch(self):
+        df_ohlcv = get_ohlcv()
+        stream = streaming_model.StreamingIndicators(
+            ema=[10],
+            sma=[20],
+            rsi=[14],
+            macd=[(12, 26, 9)],
+            bbands=[(20, 2)],
+            obv=True,
+            ad=True,
+        )
+
+        # The history, then two reloads with one and two extra bars
+        df_first = stream.update(df_ohlcv.iloc[:-3])
+        df_second = stream.update(df_ohlcv.iloc[:-2])
+        df_third = stream.update(df_ohlcv)
+
+        self.assertEqual((len(df_second), len(df_third)), (1, 2))
+        df_stream = pd.concat([df_first, df_second, df_third])
+        df_batch = batch_model.get_indicators(
+            df_ohlcv,
+            [
+                ("ema", (10,)),
+                ("sma", (20,)),
+                ("rsi", (14,)),
+                ("macd", (12, 26, 9)),
+                ("bbands", (20, 2)),
+                ("obv", ()),
+                ("ad", ()),
+            ],
+        )
+        pd.testing.assert_frame_equal(
+            df_stream[df_batch.columns], df_batch, check_freq=False
+        )
+
+    def test_update_revised_last_bar(self):
+        df_ohlcv = get_ohlcv()
+        stream = streaming_model.StreamingIndicators(
+            ema=[10], rsi=[14], macd=[(12, 26, 9)], bbands=[(20, 2)], obv=True, ad=True
+        )
+
+        # The last bar is first seen in progress, then twice revised, the second time
+        # along with a new bar
+        df_in_progress = df_ohlcv.iloc[:-1].copy()
+        df_in_progress.iloc[-1] = df_in_progress.iloc[-1] * [1, 1.01, 0.99, 1.005, 0.5]
+        df_revised = df_in_progress.copy()
+        df_revised.iloc[-1] = df_ohlcv.iloc[-2] * [1, 1, 1, 0.995, 0.8]
+
+        stream.update(df_ohlcv.iloc[:-2])
+        stream.update(df_in_progress)
+        df_first_revision = stream.update(df_revised)
+        df_second_revision = stream.update(df_ohlcv)
+        df_unchanged = stream.update(df_ohlcv)
+
+        self.assertEqual(len(df_first_revision), 1)
+        self.assertEqual(len(df_second_revision), 2)
+        self.assertTrue(df_unchanged.empty)
+        l_indicators = [
+            ("ema", (10,)),
+            ("rsi", (14,)),
+            ("macd", (12, 26, 9)),
+            ("bbands", (20, 2)),
+            ("obv", ()),
+            ("ad", ()),
+        ]
+        df_batch = batch_model.get_indicators(df_ohlcv, l_indicators)
+        pd.testing.assert_frame_equal(
+            df_second_revision[df_batch.columns],
+            df_batch.iloc[-2:],
+            check_freq=False,
+        )
+        pd.testing.assert_series_equal(
+            df_first_revision.iloc[-1][df_batch.columns],
+            batch_model.get_indicators(df_revised, l_indicators).iloc[-1],
+        )
+
+    def test_update_nan_gap(self):
+        df_ohlcv = get_ohlcv()
+        # Two bars missing altogether, one missing its volume only, and one missing its
+        # close, before and after the indicators are warmed up
+        df_ohlcv.iloc[[5, 60, 61]] = np.nan
+        df_ohlcv.iloc[90, df_ohlcv.columns.get_loc("Volume")] = np.nan
+        df_ohlcv.iloc[120, df_ohlcv.columns.get_loc("Close")] = np.nan
+        stream = streaming_model.StreamingIndicators(
+            ema=[10],
+            sma=[3],
+            rsi=[14],
+            macd=[(12, 26, 9)],
+            bbands=[(20, 2)],
+            obv=True,
+            ad=True,
+        )
+
+        df_stream = pd.concat(
+            [stream.update(df_ohlcv.iloc[:-100]), stream.update(df_ohlcv)]
+        )
+        df_batch = batch_model.get_indicators(
+            df_ohlcv,
+            [
+                ("ema", (10,)),
+                ("sma", (3,)),
+                ("rsi", (14,)),
+                ("macd", (12, 26, 9)),
+                ("bbands", (20, 2)),
+                ("obv", ()),
+                ("ad", ()),
+            ],
+        )
+        pd.testing.assert_frame_equal(
+            df_stream[df_batch.columns], df_batch, check_freq=False
+        )
+        # The averages recover once the gap leaves their window
+        self.assertFalse(df_stream.iloc[-1].isna().any())
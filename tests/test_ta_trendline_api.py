@@ -0,0 +1,31 @@
+""" technical_analysis/trendline_api.py tests """
+import unittest
+import numpy as np
+import pandas as pd
+
+from gamestonk_terminal.technical_analysis import trendline_api
+
+
+class TestTaTrendlineApi(unittest.TestCase):
+    def test_find_trendline_bounds_intraday_prices(self):
+        # Two years of hourly bars, several of them per date_id
+        index = pd.date_range("2019-01-01", "2021-01-01", freq="h")
+        close = 100 + np.cumsum(np.random.RandomState(2).normal(size=len(index)))
+        df_data = pd.DataFrame({"High": close + 1, "Low": close - 1}, index=index)
+        df_dates = df_data.index.normalize()
+        df_data["date_id"] = (df_dates - df_dates.min()).days + 1
+
+        df_data = trendline_api.find_trendline(df_data, "High", "high")
+        df_data = trendline_api.find_trendline(df_data, "Low", "low")
+
+        # Resistance and support both touch the prices, without crossing them
+        self.assertAlmostEqual((df_data["High_trend"] - df_data["High"]).min(), 0)
+        self.assertAlmostEqual((df_data["Low"] - df_data["Low_trend"]).min(), 0)
+
+    def test_find_trendline_line(self):
+        df_data = pd.DataFrame({"date_id": [1, 2, 3, 4], "y": [1.0, 3.0, 3.0, 4.0]})
+
+        df_data = trendline_api.find_trendline(df_data, "y", "low")
+
+        # The lower hull edge over the mean date_id 2.5 goes from (1, 1) to (3, 3)
+        np.testing.assert_allclose(df_data["y_trend"], [1.0, 2.0, 3.0, 4.0])